@@ -96,7 +96,8 @@ class ProgressProjector:
         if not stripped:
             return FeedResult(handled=False)
 
-        if stripped.startswith("{"):
+        # Every recognized event carries a "t" key; other JSON log lines skip the parse.
+        if stripped.startswith("{") and '"t"' in stripped:
             parsed = _try_parse_json(stripped)
             if parsed is not None:
                 return self._feed_json(parsed)
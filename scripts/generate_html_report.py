@@ -657,13 +657,14 @@ def _get_csv_path_from_report(output_dir: str) -> str | None:
     return None
 
 
-def _stat_var_matches(csv_val: str | None, stat_var: str) -> bool:
-    """Match CSV variableMeasured/StatVar to validation stat_var."""
-    if not stat_var or csv_val is None:
-        return False
-    csv_val = str(csv_val).strip()
-    stat_var = str(stat_var).strip()
-    return csv_val == stat_var or csv_val.endswith(":" + stat_var) or csv_val.endswith("/" + stat_var)
+def _stat_var_matches(csv_val: str, stat_var: str) -> bool:
+    """Match CSV variableMeasured/StatVar to validation stat_var (both already stripped): equal,
+    or ending in ':' or '/' followed by stat_var. Runs per CSV row per pending sample, so the
+    length and separator checks come before endswith()."""
+    n = len(stat_var)
+    if len(csv_val) <= n:
+        return csv_val == stat_var
+    return csv_val[-n - 1] in ":/" and csv_val.endswith(stat_var)
 
 
 def _row_val_float(row: dict, key_candidates: list[str]) -> float | None:
@@ -710,10 +711,12 @@ def _enrich_rule_failure_samples(samples: list[dict], output_dir: str, results:
 
     # Collect samples that need per-row CSV enrichment, keyed by list index for
     # direct in-place mutation.  Only two rules use CSV row data; others are skipped.
-    pending: dict[int, dict] = {
-        idx: s
+    # statVar is stripped once here rather than on every row comparison; samples whose
+    # statVar is empty after stripping are skipped (an empty stat_var would match any row).
+    pending: dict[int, tuple[dict, str, bool]] = {
+        idx: (s, stat_var, s["rule"] == "check_min_value")
         for idx, s in enumerate(samples)
-        if (s.get("statVar") or "")
+        if (stat_var := str(s.get("statVar") or "").strip())
         and (s.get("rule") or "") in ("check_min_value", "check_scaling_factor_consistency")
     }
 
@@ -730,12 +733,10 @@ def _enrich_rule_failure_samples(samples: list[dict], output_dir: str, results:
                     break  # all samples resolved — stop reading the file
                 csv_sv = get_val(row, stat_var_cols)
                 for idx in list(pending):
-                    s = pending[idx]
-                    rule = s.get("rule") or ""
-                    stat_var = s.get("statVar") or ""
+                    s, stat_var, is_min_value = pending[idx]
                     if not _stat_var_matches(csv_sv, stat_var):
                         continue
-                    if rule == "check_min_value":
+                    if is_min_value:
                         val = _row_val_float(row, value_cols)
                         if val is None or val >= min_value_threshold:
                             continue  # value condition not met; keep looking for this sample
@@ -0,0 +1,77 @@
+"""JSON encode/decode helpers that use orjson when it is installed, stdlib json otherwise.
+
+orjson is an optional speedup (see requirements.txt). Output differs in two ways: orjson
+writes non-ASCII characters as UTF-8 rather than \\uXXXX escapes, and writes NaN/Infinity
+as null where stdlib json writes NaN/Infinity. loads accepts NaN/Infinity either way: input
+orjson rejects is retried with stdlib json (the DC runner writes its output with json.dump).
+Decode errors are json.JSONDecodeError in both cases (orjson's error type subclasses it),
+so existing except clauses keep working.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+
+def loads(data: str | bytes | bytearray | memoryview) -> Any:
+    """Parse JSON from str or bytes."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # e.g. NaN/Infinity, which stdlib json writes and accepts
+            pass
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def dumps_bytes(obj: Any, *, indent: bool = False, default: Callable[[Any], Any] | None = None) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes; indent=True gives 2-space indentation."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(obj, default=default, option=option)
+        except TypeError:
+            # e.g. integers beyond 64 bits, which stdlib json handles
+            pass
+    return json.dumps(obj, indent=2 if indent else None, default=default).encode("utf-8")
+
+
+def dumps(obj: Any, *, indent: bool = False, default: Callable[[Any], Any] | None = None) -> str:
+    """Serialize obj to a JSON str; indent=True gives 2-space indentation."""
+    return dumps_bytes(obj, indent=indent, default=default).decode("utf-8")
+
+
+def dump_path(
+    obj: Any,
+    path: str | Path,
+    *,
+    indent: bool = False,
+    default: Callable[[Any], Any] | None = None,
+) -> None:
+    """Write obj as JSON to path atomically: serialize fully, write a temp file in the same
+    directory in one call, then os.replace it over path. A crash leaves the old file (or none),
+    never a half-written one."""
+    payload = dumps_bytes(obj, indent=indent, default=default)
+    path = Path(path)
+    tmp_name = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    # os.open with 0o666 keeps the umask-derived permissions a plain open() would give.
+    fd = os.open(tmp_name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
@@ -10,6 +10,7 @@ etc.) and flags percent/rate StatVars that lack measurementDenominator
 
 Usage:
   python llm_schema_review.py --tmcf=path/to/file.tmcf [--output=report.json]
+  python llm_schema_review.py --tmcf=a.tmcf --tmcf=b.tmcf --llm-review   # LLM review as one Gemini batch job
   python llm_schema_review.py --tmcf=path/to/file.tmcf --csv=path/to/file.csv [--stat-vars-mcf=...] [--stat-vars-schema-mcf=...]
   python llm_schema_review.py --tmcf=path/to/file.tmcf --output=-
 
@@ -23,13 +24,27 @@ Output:
 """
 
 import argparse
+import asyncio
+import atexit
 import csv
+import functools
+import gzip
+import io
+import itertools
 import json
 import os
 import re
 import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
+_SCRIPT_DIR = Path(__file__).resolve().parent
+if str(_SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPT_DIR))
+
+import json_codec  # noqa: E402
+
 # Short TMCF/schema reference for the prompt (Data Commons).
 TMCF_SPEC = """
 TMCF (Table MCF) basics:
@@ -83,16 +98,30 @@ value: C:table->C4
 # Column reference in TMCF: C:tableName->columnId (captures until newline so column IDs with spaces e.g. "GDP (USD)" work)
 _COLUMN_REF_RE = re.compile(r"C:[^>]+->([^\n\r]+)")
 
-# variableMeasured in TMCF: literal (dcs:X or X) or column ref (C:table->col); value on same line only
-_VARIABLE_MEASURED_RE = re.compile(r"variableMeasured\s*:\s*([^\n\r#]+)", re.IGNORECASE)
+# variableMeasured in TMCF: literal (dcs:X or X) or column ref (C:table->col); value on same line only.
+# Matched case-sensitively (the schema casing); the IGNORECASE variant is only used when the
+# content also contains other casings (see _pick_property_re).
+_VARIABLE_MEASURED_RE = re.compile(r"variableMeasured\s*:\s*([^\n\r#]+)")
+_VARIABLE_MEASURED_ANYCASE_RE = re.compile(r"variableMeasured\s*:\s*([^\n\r#]+)", re.IGNORECASE)
 
 # observationDate literal: ISO 8601 YYYY, YYYY-MM, or YYYY-MM-DD only
-_OBSERVATION_DATE_ISO8601_RE = re.compile(r"^\d{4}(-\d{2}(-\d{2})?)?$")
+_OBSERVATION_DATE_ISO8601_RE = re.compile(r"^\d{4}(?:-\d{2}(?:-\d{2})?)?$")
+
+# observationDate property in TMCF; value on same line only (same case-sensitive/fallback split)
+_OBSERVATION_DATE_RE = re.compile(r"observationDate\s*:\s*([^\n\r#]+)")
+_OBSERVATION_DATE_ANYCASE_RE = re.compile(r"observationDate\s*:\s*([^\n\r#]+)", re.IGNORECASE)
+
+# Column id after -> in a variableMeasured column reference (C:table->columnId)
+_COLUMN_ID_AFTER_ARROW_RE = re.compile(r"->\s*([^\s#]+)")
+
+# StatVarObservation node and value-to-column mapping (value: C:table->columnId)
+_STATVAR_OBSERVATION_TYPE_RE = re.compile(r"typeOf\s*:\s*dcs:StatVarObservation")
+_VALUE_COLUMN_RE = re.compile(r"value\s*:\s*C:[^>]+->")
 
 # StatVar DCID: UpperCamelCase segments separated by underscores; decimal points allowed in
 # numeric portions (e.g. Count_Person, 1.38OrLessRatioToPovertyLine)
 _STATVAR_DCID_FORMAT_RE = re.compile(
-    r"^[A-Z0-9]([A-Za-z0-9]|\.[0-9]+)*(?:_[A-Z0-9]([A-Za-z0-9]|\.[0-9]+)*)*$"
+    r"^[A-Z0-9](?:[A-Za-z0-9]|\.[0-9]+)*(?:_[A-Z0-9](?:[A-Za-z0-9]|\.[0-9]+)*)*$"
 )
 
 
@@ -101,8 +130,45 @@ def _get_api_key() -> str | None:
     return os.environ.get("GEMINI_API_KEY") or os.environ.get("GOOGLE_API_KEY")
 
 
+# Progress lines are queued and written to stderr in one write per review call instead of one
+# flushed print per step; DC_VALIDATOR_QUIET=1 drops them. CLI errors in main() still print directly.
+_progress_lines: list[str] = []
+
+
+def _progress(message: str) -> None:
+    """Queue a progress line for stderr (written by _flush_progress)."""
+    _progress_lines.append(message)
+
+
+def _flush_progress() -> None:
+    """Write queued progress lines to stderr in one write, unless DC_VALIDATOR_QUIET=1."""
+    if not _progress_lines:
+        return
+    lines = _progress_lines[:]
+    del _progress_lines[: len(lines)]
+    if os.environ.get("DC_VALIDATOR_QUIET") != "1":
+        sys.stderr.write("\n".join(lines) + "\n")
+
+
+def _flushes_progress(func):
+    """Decorator: flush queued progress lines when func returns or raises."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _flush_progress()
+
+    return wrapper
+
+
 def _normalize_statvar_dcid(raw: str) -> str:
-    """Normalize StatVar DCID: strip dcid:, dcs:, and surrounding whitespace."""
+    """Normalize StatVar DCID: strip dcid:, dcs:, and surrounding whitespace.
+
+    Result is interned: the same DCIDs repeat across TMCF literals, CSV rows and MCF nodes,
+    so the sets built from them share one string object per DCID.
+    """
     if not raw or not isinstance(raw, str):
         return ""
     s = raw.strip()
@@ -110,7 +176,25 @@ def _normalize_statvar_dcid(raw: str) -> str:
         if s.lower().startswith(prefix.lower()):
             s = s[len(prefix) :].strip()
             break
-    return s
+    return sys.intern(s) if s else ""
+
+
+def _pick_property_re(content: str, prop: str, exact_re: re.Pattern, anycase_re: re.Pattern) -> re.Pattern:
+    """Return exact_re when every case-insensitive occurrence of prop is already in its exact casing.
+
+    Two substring counts are far cheaper than case-folding at every position with IGNORECASE,
+    and results are identical to always using anycase_re.
+    """
+    if content.count(prop) == content.lower().count(prop.lower()):
+        return exact_re
+    return anycase_re
+
+
+def _open_csv(csv_path: str | Path):
+    """Open a CSV (or .csv.gz) for text reading with a 64 KB buffer; rows are consumed lazily."""
+    if str(csv_path).endswith(".gz"):
+        return gzip.open(csv_path, "rt", encoding="utf-8", errors="replace", newline="")
+    return open(csv_path, encoding="utf-8", errors="replace", newline="", buffering=65536)
 
 
 def _extract_generated_statvar_dcids(tmcf_content: str, csv_path: str | Path | None) -> set[str]:
@@ -118,40 +202,57 @@ def _extract_generated_statvar_dcids(tmcf_content: str, csv_path: str | Path | N
     Extract StatVar DCIDs that are "generated" by the TMCF/CSV (used in variableMeasured).
     - From TMCF: literal variableMeasured values (e.g. dcs:Count_Person).
     - From CSV: when variableMeasured maps to a column (C:table->columnId), unique values in those columns.
-    Reads the CSV exactly once and extracts values for all referenced columns in a single pass.
+    Reads the CSV at most once per file version and extracts values for all referenced columns in a single pass.
     Returns set of normalized DCIDs (no dcid:/dcs: prefix).
     """
     dcids: set[str] = set()
-    # 1) Literals from TMCF (non–C: variableMeasured values)
-    for m in _VARIABLE_MEASURED_RE.finditer(tmcf_content):
-        val = m.group(1).strip().split("\n")[0].strip()
-        if not val or val.startswith("C:"):
-            continue
-        dcid = _normalize_statvar_dcid(val)
-        if dcid:
-            dcids.add(dcid)
-    # 2) Collect ALL column IDs referenced in variableMeasured C:table->columnId
     column_ids: set[str] = set()
-    for m in _VARIABLE_MEASURED_RE.finditer(tmcf_content):
+    vm_re = _pick_property_re(tmcf_content, "variableMeasured", _VARIABLE_MEASURED_RE, _VARIABLE_MEASURED_ANYCASE_RE)
+    for m in vm_re.finditer(tmcf_content):
         val = m.group(1).strip().split("\n")[0].strip()
-        if not val.startswith("C:") or "->" not in val:
+        if not val:
+            continue
+        if not val.startswith("C:"):
+            # 1) Literals from TMCF (non–C: variableMeasured values)
+            dcid = _normalize_statvar_dcid(val)
+            if dcid:
+                dcids.add(dcid)
             continue
-        col_ref = re.search(r"->\s*([^\s#]+)", val)
+        # 2) Collect ALL column IDs referenced in variableMeasured C:table->columnId
+        if "->" not in val:
+            continue
+        col_ref = _COLUMN_ID_AFTER_ARROW_RE.search(val)
         if not col_ref:
             continue
         col_id = col_ref.group(1).strip()
         if col_id:
             column_ids.add(col_id)
-    # 3) Read CSV exactly once; extract unique values for all referenced columns in a single pass
-    if not column_ids or not csv_path or not Path(csv_path).exists():
+    # 3) Unique values of all referenced columns, from one (cached) pass over the CSV
+    if not column_ids or not csv_path:
         return dcids
     try:
-        with open(csv_path, encoding="utf-8", errors="replace", newline="") as f:
+        st = Path(csv_path).stat()
+    except OSError:
+        return dcids
+    dcids.update(_read_csv_column_dcids(str(csv_path), st.st_mtime_ns, st.st_size, frozenset(column_ids)))
+    return dcids
+
+
+@functools.lru_cache(maxsize=4)
+def _read_csv_column_dcids(path: str, mtime_ns: int, size: int, column_ids: frozenset[str]) -> frozenset[str]:
+    """Normalized non-empty values of column_ids in the CSV at path, read in a single pass.
+
+    Cached like _read_csv_header_cached (mtime_ns/size in the key), so TMCFs that review the
+    same CSV (review_tmcfs, repeated calls) parse its rows once rather than once per TMCF.
+    """
+    dcids: set[str] = set()
+    try:
+        with _open_csv(path) as f:
             reader = csv.DictReader(f)
             fieldnames = reader.fieldnames or []
             cols_to_read = [c for c in column_ids if c in fieldnames]
             if not cols_to_read:
-                return dcids
+                return frozenset()
             for row in reader:
                 for col_id in cols_to_read:
                     v = (row.get(col_id) or "").strip()
@@ -159,9 +260,9 @@ def _extract_generated_statvar_dcids(tmcf_content: str, csv_path: str | Path | N
                         dcid = _normalize_statvar_dcid(v)
                         if dcid:
                             dcids.add(dcid)
-    except (OSError, csv.Error):
+    except (OSError, EOFError, csv.Error):
         pass
-    return dcids
+    return frozenset(dcids)
 
 
 def _extract_column_refs_from_tmcf(tmcf_content: str) -> list[str]:
@@ -185,12 +286,14 @@ def _extract_column_refs_from_tmcf(tmcf_content: str) -> list[str]:
 def _validate_column_refs_against_header(
     tmcf_content: str,
     header_columns: list[str],
+    column_refs: list[str] | None = None,
 ) -> list[dict]:
     """
     Deterministic check: column IDs referenced in TMCF must exist in header (case-sensitive).
     Returns list of schema blocker issues for missing columns (order of first appearance in TMCF).
+    If column_refs is provided, it is used (avoids re-scanning tmcf_content).
     """
-    refs_ordered = _extract_column_refs_from_tmcf(tmcf_content)
+    refs_ordered = column_refs if column_refs is not None else _extract_column_refs_from_tmcf(tmcf_content)
     header_set = {c.strip() for c in header_columns}
     missing = [r for r in refs_ordered if r not in header_set]
     if not missing:
@@ -210,12 +313,14 @@ def _validate_column_refs_against_header(
 def _find_unused_csv_columns(
     tmcf_content: str,
     header_columns: list[str],
+    column_refs: list[str] | None = None,
 ) -> list[dict]:
     """
     Deterministic check: CSV columns that are never referenced in TMCF (may indicate mapping mistake).
     Returns list of warning issues (one per unused column, up to 10).
+    If column_refs is provided, it is used (avoids re-scanning tmcf_content).
     """
-    refs_set = set(_extract_column_refs_from_tmcf(tmcf_content))
+    refs_set = set(column_refs if column_refs is not None else _extract_column_refs_from_tmcf(tmcf_content))
     unused = [c for c in header_columns if c and c not in refs_set]
     if not unused:
         return []
@@ -299,13 +404,12 @@ def _check_value_column_mapped(tmcf_content: str) -> list[dict]:
     Deterministic check: StatVarObservation nodes must map a value column (value: C:table->columnId).
     Returns one blocker if StatVarObservation appears but no value mapping is found.
     """
-    if not re.search(r"typeOf\s*:\s*dcs:StatVarObservation", tmcf_content):
+    if not _STATVAR_OBSERVATION_TYPE_RE.search(tmcf_content):
         return []
     # Look for a line that maps value to a CSV column (value: C:table->columnId)
-    value_column_re = re.compile(r"value\s*:\s*C:[^>]+->")
     for line in tmcf_content.splitlines():
         s = line.split("#", 1)[0].strip()
-        if value_column_re.search(s):
+        if _VALUE_COLUMN_RE.search(s):
             return []
     return [{
         "line": None,
@@ -322,7 +426,7 @@ def _validate_observation_date_literals(tmcf_content: str) -> list[dict]:
     Column mappings (C:table->columnId) are skipped. Invalid formats are flagged as format (warning).
     """
     issues: list[dict] = []
-    obs_re = re.compile(r"observationDate\s*:\s*([^\n\r#]+)", re.IGNORECASE)
+    obs_re = _pick_property_re(tmcf_content, "observationDate", _OBSERVATION_DATE_RE, _OBSERVATION_DATE_ANYCASE_RE)
     for line_no, line in enumerate(tmcf_content.splitlines(), start=1):
         m = obs_re.search(line.split("#", 1)[0])
         if not m:
@@ -539,21 +643,32 @@ def _check_percent_statvar_denominator(content: str, path: str) -> list[dict]:
 def _read_csv_header(csv_path: str | Path) -> list[str] | None:
     """Read first row of CSV using csv module (handles quoted commas). Returns None if file missing or empty."""
     path = Path(csv_path)
-    if not path.exists():
+    try:
+        st = path.stat()
+    except OSError:
         return None
+    header = _read_csv_header_cached(str(path), st.st_mtime_ns, st.st_size)
+    return list(header) if header is not None else None
+
+
+@functools.lru_cache(maxsize=32)
+def _read_csv_header_cached(path: str, mtime_ns: int, size: int) -> tuple[str, ...] | None:
+    """Header row of path; mtime_ns/size are part of the cache key so an edited file is re-read."""
     try:
-        with open(path, encoding="utf-8", errors="replace", newline="") as f:
-            reader = csv.reader(f)
-            header = next(reader, None)
+        with _open_csv(path) as f:
+            header = next(csv.reader(f), None)
         if not header:
             return None
-        return [c.strip() for c in header]
-    except (OSError, UnicodeDecodeError, csv.Error):
+        return tuple(c.strip() for c in header)
+    except (OSError, EOFError, UnicodeDecodeError, csv.Error):
         return None
 
 
 _LLM_FALLBACK_MODEL = "gemini-2.5-flash"
 
+# Upper bound on threads used for the independent deterministic checks in review_tmcf.
+_DETERMINISTIC_CHECK_WORKERS = 8
+
 # Exceptions that indicate the requested model is unavailable or over quota —
 # safe to retry with the fallback model.  Errors that reflect a bad API key
 # (PermissionDenied, Unauthenticated) or a malformed request (InvalidArgument)
@@ -580,6 +695,34 @@ def _is_model_availability_error(exc: BaseException) -> bool:
     ))
 
 
+@functools.lru_cache(maxsize=4)
+def _gemini_client(api_key: str):
+    """Return a google-genai Client for api_key, reused across calls in this process."""
+    try:
+        from google import genai
+    except ImportError as exc:
+        raise RuntimeError(
+            "google-genai is not installed. Run: pip install google-genai"
+        ) from exc
+    client = genai.Client(api_key=api_key)
+    # One client (and its pooled HTTPS connections) per key for the process; close it at exit.
+    # Older google-genai releases have no close().
+    if hasattr(client, "close"):
+        atexit.register(client.close)
+    return client
+
+
+@functools.lru_cache(maxsize=1)
+def _gemini_config():
+    """GenerateContentConfig with temperature=0, or None if the SDK does not expose it."""
+    # temperature=0 for deterministic schema linting (reproducible findings)
+    try:
+        from google.genai import types
+        return types.GenerateContentConfig(temperature=0)
+    except (ImportError, AttributeError):
+        return None
+
+
 def _call_gemini(
     tmcf_content: str,
     api_key: str,
@@ -593,26 +736,14 @@ def _call_gemini(
     Tries model_id first; falls back to gemini-2.5-flash only for quota or
     model-availability errors.  Auth errors and bad requests surface normally.
     """
-    try:
-        from google import genai
-    except ImportError as exc:
-        raise RuntimeError(
-            "google-genai is not installed. Run: pip install google-genai"
-        ) from exc
-
-    client = genai.Client(api_key=api_key)
+    client = _gemini_client(api_key)
     prompt = _build_prompt(
         tmcf_content,
         stat_vars_content=stat_vars_content,
         stat_vars_schema_content=stat_vars_schema_content,
         csv_header_columns=csv_header_columns,
     )
-    # temperature=0 for deterministic schema linting (reproducible findings)
-    try:
-        from google.genai import types
-        config = types.GenerateContentConfig(temperature=0)
-    except (ImportError, AttributeError):
-        config = None
+    config = _gemini_config()
 
     def _generate(mid: str) -> str:
         if config is not None:
@@ -626,21 +757,149 @@ def _call_gemini(
     except Exception as e:
         if model_id == _LLM_FALLBACK_MODEL or not _is_model_availability_error(e):
             raise
-        print(
-            f"Gemini model {model_id!r} unavailable ({e}); retrying with {_LLM_FALLBACK_MODEL!r}",
-            file=__import__("sys").stderr,
-            flush=True,
-        )
+        _progress(f"Gemini model {model_id!r} unavailable ({e}); retrying with {_LLM_FALLBACK_MODEL!r}")
         return _generate(_LLM_FALLBACK_MODEL)
 
 
-def _build_prompt(
-    tmcf_content: str,
+class _RpmLimiter:
+    """Paces request starts evenly so that at most rpm start per minute (rpm <= 0 disables pacing)."""
+
+    def __init__(self, rpm: int):
+        self._interval = 60.0 / rpm if rpm > 0 else 0.0
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if not self._interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next_start - now
+            self._next_start = max(now, self._next_start) + self._interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+async def _call_gemini_many_async(
+    prompts: list[str],
+    api_key: str,
+    model_id: str,
+    max_concurrency: int,
+    rpm: int,
+) -> list[str | BaseException]:
+    """Interactive Gemini calls for all prompts, at most max_concurrency in flight and rpm per minute."""
+    # Not the cached client: its async transport must belong to the event loop created by asyncio.run.
+    client = _gemini_client.__wrapped__(api_key)
+    config = _gemini_config()
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    limiter = _RpmLimiter(rpm)
+
+    async def _generate(mid: str, prompt: str) -> str:
+        await limiter.acquire()
+        if config is not None:
+            resp = await client.aio.models.generate_content(model=mid, contents=prompt, config=config)
+        else:
+            resp = await client.aio.models.generate_content(model=mid, contents=prompt)
+        return resp.text if resp.text else "[]"
+
+    async def _review_one(prompt: str) -> str:
+        async with semaphore:
+            try:
+                return await _generate(model_id, prompt)
+            except Exception as e:
+                if model_id == _LLM_FALLBACK_MODEL or not _is_model_availability_error(e):
+                    raise
+                _progress(f"Gemini model {model_id!r} unavailable ({e}); retrying with {_LLM_FALLBACK_MODEL!r}")
+                return await _generate(_LLM_FALLBACK_MODEL, prompt)
+
+    try:
+        return await asyncio.gather(*(_review_one(p) for p in prompts), return_exceptions=True)
+    finally:
+        # Release the async connection pool before asyncio.run closes its loop.
+        aclose = getattr(client.aio, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+def _call_gemini_many(
+    prompts: list[str],
+    api_key: str,
+    model_id: str = "gemini-2.5-pro",
+    max_concurrency: int = 8,
+    rpm: int = 60,
+) -> list[str | BaseException]:
+    """Run interactive Gemini calls for prompts concurrently (same result shape as _call_gemini_batch)."""
+    return asyncio.run(_call_gemini_many_async(prompts, api_key, model_id, max_concurrency, rpm))
+
+
+_BATCH_TERMINAL_STATES = frozenset({
+    "JOB_STATE_SUCCEEDED",
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED",
+})
+
+
+def _call_gemini_batch(
+    prompts: list[str],
+    api_key: str,
+    model_id: str = "gemini-2.5-pro",
+    poll_interval_sec: float = 10.0,
+    timeout_sec: float = 1800.0,
+) -> list[str | Exception]:
+    """Submit prompts as one Gemini inline batch job and wait for it to finish.
+
+    Returns one item per prompt, in order: the response text, or the per-request error.
+    Raises if the job itself fails, is cancelled, or does not finish within timeout_sec.
+    No model fallback here: batch jobs are queued, not subject to interactive quota errors.
+    """
+    client = _gemini_client(api_key)
+    # temperature=0 for deterministic schema linting (reproducible findings)
+    inlined_requests = [
+        {"contents": [{"role": "user", "parts": [{"text": prompt}]}], "config": {"temperature": 0}}
+        for prompt in prompts
+    ]
+    job = client.batches.create(
+        model=model_id,
+        src=inlined_requests,
+        config={"display_name": "dc-import-validator-tmcf-review"},
+    )
+    _progress(f"Gemini batch job {job.name} submitted ({len(prompts)} requests)")
+    _flush_progress()  # the job can queue for minutes; show progress so far now
+    deadline = time.monotonic() + timeout_sec
+    while job.state.name not in _BATCH_TERMINAL_STATES:
+        if time.monotonic() >= deadline:
+            try:
+                client.batches.cancel(name=job.name)
+            except Exception:
+                pass
+            raise TimeoutError(f"Gemini batch job {job.name} did not finish within {timeout_sec:.0f}s")
+        time.sleep(poll_interval_sec)
+        job = client.batches.get(name=job.name)
+
+    if job.state.name != "JOB_STATE_SUCCEEDED":
+        raise RuntimeError(f"Gemini batch job {job.name} ended in {job.state.name}: {job.error}")
+    inlined_responses = (job.dest.inlined_responses if job.dest else None) or []
+    if len(inlined_responses) != len(prompts):
+        raise RuntimeError(
+            f"Gemini batch job {job.name} returned {len(inlined_responses)} responses for {len(prompts)} requests"
+        )
+    results: list[str | Exception] = []
+    for item in inlined_responses:
+        if item.error:
+            results.append(RuntimeError(f"Gemini batch request failed: {item.error}"))
+        else:
+            text = item.response.text if item.response else None
+            results.append(text if text else "[]")
+    return results
+
+
+def _build_prompt_preamble(
     stat_vars_content: str | None = None,
     stat_vars_schema_content: str | None = None,
     csv_header_columns: list[str] | None = None,
 ) -> str:
-    """Build the prompt for the LLM."""
+    """Build the shared part of the LLM prompt (rules, references, examples) that precedes the TMCF content."""
     spec = TMCF_SPEC.strip()
     good = EXAMPLE_GOOD.strip()
     bad_typo = EXAMPLE_BAD_TYPO_OR_COLUMN.strip()
@@ -651,14 +910,14 @@ def _build_prompt(
     header_section = ""
     check5_and_9 = ""
     if csv_header_columns:
-        header_list = "\n".join(f"- {c}" for c in csv_header_columns)
-        header_section = (
+        header_buf = io.StringIO()
+        header_buf.write(
             "\n\nTable header (column IDs from CSV; matching is case-sensitive). "
             "Column references are validated against this list in a separate step; do not flag column-not-in-header here. "
             "CSV columns not referenced in the TMCF (unused columns) are also reported in a separate step; do not flag them here.\n"
-            + header_list
-            + "\n"
         )
+        header_buf.writelines(f"- {c}\n" for c in csv_header_columns)
+        header_section = header_buf.getvalue()
         check5_and_9 = """
 5. Column references (internal consistency only): flag obvious inconsistencies within the TMCF (e.g. same node using C1 in one place and C01 in another). Do not flag column-not-in-header—that is validated separately.
 9. Skip column-existence check (handled separately)."""
@@ -667,14 +926,20 @@ def _build_prompt(
 5. Column references (e.g. C:table->C1): must be consistent within the TMCF; flag references that look like typos (e.g. C99 when only C1–C5 appear elsewhere).
 9. If no table header list was provided, skip column-existence check."""
 
-    extra = "\n\nOptional reference — known StatVars/schema (use to check if TMCF StatVar DCIDs or types exist):\n"
-    extra += "Standard Data Commons schema types (treat as known; do not flag as unknown_statvar): dcs:StatisticalVariable, dcs:Percent, dcs:StatVarObservation.\n"
-    if stat_vars_content or stat_vars_schema_content:
-        if stat_vars_content:
-            extra += "--- stat_vars.mcf (excerpt) ---\n" + (stat_vars_content[:12000] or "") + "\n"
-            extra += "Note: this reference may be truncated. If a StatVar DCID does not appear above, do not assume it is unknown — it may have been omitted from the excerpt. Only flag unknown_statvar when you are confident the reference is complete.\n"
-        if stat_vars_schema_content:
-            extra += "--- stat_vars_schema.mcf (excerpt) ---\n" + (stat_vars_schema_content[:8000] or "") + "\n"
+    # StringIO avoids re-copying the (up to 20 KB) MCF excerpts on every += below.
+    extra_buf = io.StringIO()
+    extra_buf.write("\n\nOptional reference — known StatVars/schema (use to check if TMCF StatVar DCIDs or types exist):\n")
+    extra_buf.write("Standard Data Commons schema types (treat as known; do not flag as unknown_statvar): dcs:StatisticalVariable, dcs:Percent, dcs:StatVarObservation.\n")
+    if stat_vars_content:
+        extra_buf.write("--- stat_vars.mcf (excerpt) ---\n")
+        extra_buf.write(stat_vars_content[:12000])
+        extra_buf.write("\n")
+        extra_buf.write("Note: this reference may be truncated. If a StatVar DCID does not appear above, do not assume it is unknown — it may have been omitted from the excerpt. Only flag unknown_statvar when you are confident the reference is complete.\n")
+    if stat_vars_schema_content:
+        extra_buf.write("--- stat_vars_schema.mcf (excerpt) ---\n")
+        extra_buf.write(stat_vars_schema_content[:8000])
+        extra_buf.write("\n")
+    extra = extra_buf.getvalue()
 
     return f"""You are a strict linter for Data Commons TMCF (Table MCF) files. Your role is to apply only the validation rules listed below and report only issues that are directly verifiable from the provided TMCF content and those rules.
 
@@ -708,26 +973,78 @@ Examples — issues to flag:
 
 {bad_ns_dup}
 
-TMCF content to review:
+"""
+
+
+# Per-issue response rules shared by the single-file and multi-file prompts.
+_RESPONSE_ISSUE_RULES = """- Line number: Include the line number when the issue is on a specific line (e.g. duplicate property → line of the duplicate; typo → line with the wrong name; namespace → line with missing dcs:; naming → line with the unexpected property). Use null only for node-level issues where no single line is wrong (e.g. "missing required property" for a node — the node is incomplete, so null is fine).
+- Suggestion: Always provide a short fix when possible. For missing required property X: "Add X with a column mapping (e.g. X: C:table->columnId)." For duplicate: "Remove the duplicate line." For namespace: "Add dcs: prefix (e.g. dcs:Value)." For typo: give the correct spelling.
+- Use type: duplicate, required, namespace, format, typo, schema, naming, unknown_statvar, unused_column as defined in the checks.
+- Include a severity field for each finding ("blocker" or "warning"). Severity will be normalized by the system after parsing, so focus primarily on identifying the issue accurately."""
+
+
+def _build_prompt(
+    tmcf_content: str,
+    stat_vars_content: str | None = None,
+    stat_vars_schema_content: str | None = None,
+    csv_header_columns: list[str] | None = None,
+) -> str:
+    """Build the prompt for the LLM."""
+    preamble = _build_prompt_preamble(
+        stat_vars_content=stat_vars_content,
+        stat_vars_schema_content=stat_vars_schema_content,
+        csv_header_columns=csv_header_columns,
+    )
+    return f"""{preamble}TMCF content to review:
 ---
 {tmcf_content}
 ---
 
 Respond with a JSON array only.
 - Each item: "line" (integer line number in the TMCF content above, or null), "type", "message", "suggestion", "severity".
-- Line number: Include the line number when the issue is on a specific line (e.g. duplicate property → line of the duplicate; typo → line with the wrong name; namespace → line with missing dcs:; naming → line with the unexpected property). Use null only for node-level issues where no single line is wrong (e.g. "missing required property" for a node — the node is incomplete, so null is fine).
-- Suggestion: Always provide a short fix when possible. For missing required property X: "Add X with a column mapping (e.g. X: C:table->columnId)." For duplicate: "Remove the duplicate line." For namespace: "Add dcs: prefix (e.g. dcs:Value)." For typo: give the correct spelling.
-- Use type: duplicate, required, namespace, format, typo, schema, naming, unknown_statvar, unused_column as defined in the checks.
-- Include a severity field for each finding ("blocker" or "warning"). Severity will be normalized by the system after parsing, so focus primarily on identifying the issue accurately.
+{_RESPONSE_ISSUE_RULES}
 - If no issues found, respond with: []
 - Return only valid JSON, no markdown or extra text.
 - Report at most 25 issues; if more exist, list the first 25 and omit the rest."""
 
 
-def _parse_llm_response(text: str) -> list[dict]:
-    """Parse LLM response into structured list. Normalize severity (blocker/warning)."""
+def _build_marshaled_prompt(
+    tmcf_files: list[tuple[str, str]],
+    stat_vars_content: str | None = None,
+    stat_vars_schema_content: str | None = None,
+    csv_header_columns: list[str] | None = None,
+) -> str:
+    """Build one prompt reviewing several TMCFs given as (file_name, content).
+
+    Files are delimited by "=== FILE <file_id>: <name> ===" lines with file_id starting at 1;
+    the response must be an array of {"file_id", "issues"} objects (see _parse_marshaled_llm_response).
+    """
+    preamble = _build_prompt_preamble(
+        stat_vars_content=stat_vars_content,
+        stat_vars_schema_content=stat_vars_schema_content,
+        csv_header_columns=csv_header_columns,
+    )
+    files_buf = io.StringIO()
+    for file_id, (name, content) in enumerate(tmcf_files, start=1):
+        files_buf.write(f"=== FILE {file_id}: {name} ===\n")
+        files_buf.write(content)
+        if not content.endswith("\n"):
+            files_buf.write("\n")
+    return f"""{preamble}TMCF files to review ({len(tmcf_files)} files; review each file independently, applying the checks above to each one):
+---
+{files_buf.getvalue()}---
+
+Respond with a JSON array only, containing exactly one object per file: {{"file_id": <integer from the FILE line>, "issues": [...]}}.
+- Each issue: "line" (integer line number counted from the first line after that file's FILE line, or null), "type", "message", "suggestion", "severity".
+{_RESPONSE_ISSUE_RULES}
+- If a file has no issues, use "issues": [].
+- Return only valid JSON, no markdown or extra text.
+- Report at most 25 issues per file; if more exist, list the first 25 and omit the rest."""
+
+
+def _strip_code_fence(text: str) -> str:
+    """Remove a surrounding markdown code block from an LLM response, if present."""
     text = text.strip()
-    # Remove markdown code blocks if present
     if text.startswith("```"):
         lines = text.split("\n")
         if lines[0].startswith("```"):
@@ -735,15 +1052,58 @@ def _parse_llm_response(text: str) -> list[dict]:
         if lines and lines[-1].strip() == "```":
             lines = lines[:-1]
         text = "\n".join(lines)
+    return text
+
+
+def _parse_llm_response(text: str) -> list[dict]:
+    """Parse LLM response into structured list. Normalize severity (blocker/warning)."""
+    text = _strip_code_fence(text)
     try:
-        result = json.loads(text)
+        result = json_codec.loads(text)
         if isinstance(result, list):
             issues = result
         else:
             issues = [result] if isinstance(result, dict) else []
     except json.JSONDecodeError:
         return [{"type": "parse_error", "message": "Could not parse LLM response", "raw": text[:200], "severity": "blocker"}]
+    return _normalize_llm_issues(issues)
+
+
+def _parse_marshaled_llm_response(text: str, file_count: int) -> dict[int, list[dict]] | None:
+    """Parse a multi-file response ([{"file_id": n, "issues": [...]}, ...]) into normalized issues per file_id.
+
+    Returns None if the response is not valid JSON of that shape; file_ids outside 1..file_count
+    are ignored, and files missing from the response are simply absent from the result.
+    """
+    try:
+        result = json_codec.loads(_strip_code_fence(text))
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(result, list):
+        return None
+    per_file: dict[int, list[dict]] = {}
+    for item in result:
+        if not isinstance(item, dict) or not isinstance(item.get("issues"), list):
+            return None
+        try:
+            file_id = int(item.get("file_id"))
+        except (TypeError, ValueError):
+            return None
+        if 1 <= file_id <= file_count:
+            issues = [i for i in item["issues"] if isinstance(i, dict)]
+            per_file[file_id] = _normalize_llm_issues(issues)
+    return per_file
+
+
+# Issue types whose severity is always blocker, and types that default to warning
+# (the LLM may escalate those to blocker when the issue breaks schema).
+_FORCE_BLOCKER_TYPES = frozenset({"typo", "schema", "unknown_statvar", "duplicate", "required", "namespace"})
+_SOFT_SEVERITY_TYPES = frozenset({"naming", "unused_column", "format"})
+_SEVERITIES = frozenset({"blocker", "warning"})
+
 
+def _normalize_llm_issues(issues: list[dict]) -> list[dict]:
+    """Cap LLM issues and normalize their severity (blocker/warning)."""
     # Cap issue count to avoid flooding UI/reports
     MAX_ISSUES = 25
     if len(issues) > MAX_ISSUES:
@@ -752,16 +1112,140 @@ def _parse_llm_response(text: str) -> list[dict]:
     # Normalize severity: typo/schema/unknown_statvar/duplicate/required/namespace -> blocker; naming/unused_column/format -> warning unless LLM set blocker
     for i in issues:
         t = i.get("type")
-        if t in ("typo", "schema", "unknown_statvar", "duplicate", "required", "namespace"):
+        if not isinstance(t, str):
+            t = None  # LLM JSON can carry lists/objects here; keep set lookups hashable
+        sev = i.get("severity")
+        if not isinstance(sev, str):
+            sev = None
+        if t in _FORCE_BLOCKER_TYPES:
             i["severity"] = "blocker"
-        elif t in ("naming", "unused_column", "format"):
+        elif t in _SOFT_SEVERITY_TYPES:
             # Respect prompt: naming/unused_column/format -> warning unless it breaks schema; let LLM escalate to blocker when needed
-            i["severity"] = i.get("severity") if i.get("severity") in ("blocker", "warning") else "warning"
-        elif i.get("severity") not in ("blocker", "warning"):
+            i["severity"] = sev if sev in _SEVERITIES else "warning"
+        elif sev not in _SEVERITIES:
             i["severity"] = i.get("severity", "warning")
     return issues
 
 
+def _read_text_or_none(path: str | Path | None) -> str | None:
+    """Read a text file, or None if path is empty or not a readable file (one open, no separate exists())."""
+    if not path:
+        return None
+    try:
+        return Path(path).read_text(encoding="utf-8", errors="replace")
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        return None
+
+
+def _read_tmcf(tmcf_path: str) -> tuple[str, tuple[list[dict], bool, str | None] | None]:
+    """Read TMCF content. Second item is the final review result when the file is missing or empty."""
+    content = _read_text_or_none(tmcf_path)
+    if content is None:
+        return "", ([{"type": "error", "message": f"File not found: {tmcf_path}", "severity": "blocker", "source": "deterministic"}], False, None)
+
+    if not content.strip():
+        return content, ([{"type": "info", "message": "Empty TMCF file", "severity": "warning", "source": "deterministic"}], True, None)
+    return content, None
+
+
+def _run_deterministic_checks(
+    content: str,
+    tmcf_path: str,
+    stat_vars_content: str | None,
+    stat_vars_mcf_path: str | None,
+    stat_vars_schema_content: str | None,
+    stat_vars_schema_mcf_path: str | None,
+    csv_path: str | None,
+    csv_header_columns: list[str] | None,
+) -> list[dict]:
+    """Run all deterministic (no LLM) checks on already-read inputs; issues are tagged source=deterministic."""
+    # Each check is an independent scan of the same immutable strings, so they run
+    # concurrently; only the DCID format check depends on generated_dcids (the CSV read).
+    # Results are collected in submission order so issue ordering is stable.
+    python_issues: list[dict] = []
+    with ThreadPoolExecutor(max_workers=_DETERMINISTIC_CHECK_WORKERS) as executor:
+        # Reuse generated_dcids for format check so CSV is read at most once
+        generated_future = executor.submit(_extract_generated_statvar_dcids, content, csv_path)
+        before_format = []
+        if csv_header_columns:
+            column_refs = _extract_column_refs_from_tmcf(content)
+            before_format.append(executor.submit(_validate_column_refs_against_header, content, csv_header_columns, column_refs))
+            before_format.append(executor.submit(_find_unused_csv_columns, content, csv_header_columns, column_refs))
+        before_format.append(executor.submit(_check_value_column_mapped, content))
+        before_format.append(executor.submit(_check_statvar_observation_required_props, content, tmcf_path))
+        before_format.append(executor.submit(_validate_observation_date_literals, content))
+        after_format = []
+        if stat_vars_content and stat_vars_mcf_path:
+            after_format.append(executor.submit(_validate_stat_vars_mcf, stat_vars_content, stat_vars_mcf_path))
+            # Percent/rate StatVars in stat_vars MCF should have measurementDenominator
+            after_format.append(executor.submit(_check_percent_statvar_denominator, stat_vars_content, stat_vars_mcf_path))
+        if stat_vars_schema_content and stat_vars_schema_mcf_path:
+            after_format.append(executor.submit(_validate_stat_vars_mcf, stat_vars_schema_content, stat_vars_schema_mcf_path))
+
+        for future in before_format:
+            python_issues.extend(future.result())
+        python_issues.extend(
+            _validate_statvar_dcid_format(content, csv_path, generated_dcids=generated_future.result())
+        )
+        for future in after_format:
+            python_issues.extend(future.result())
+
+    for i in python_issues:
+        i["source"] = "deterministic"
+
+    n = len(python_issues)
+    if n == 0:
+        _progress("✔ Deterministic checks passed (0 issues)")
+    else:
+        _progress(f"✖ Deterministic checks found {n} issue(s)")
+    return python_issues
+
+
+@functools.lru_cache(maxsize=1024)
+def _norm_msg(message: str) -> str:
+    """Collapse whitespace in an issue message (dedup key); the same messages recur across files."""
+    return " ".join(message.split())
+
+
+def _merge_llm_issues(python_issues: list[dict], llm_issues: list[dict]) -> list[dict]:
+    """Merge parsed LLM issues after the deterministic issues (capped and deduplicated)."""
+    for i in llm_issues:
+        i["source"] = "llm"
+    # Deterministic issues first (never truncated); LLM issues fill the remaining slots up to
+    # MAX_ISSUES so they don't flood. Deduplicate by (type, normalized message) so whitespace
+    # variance doesn't create duplicates; the insertion-ordered dict keeps the first issue per
+    # key, and the loop stops as soon as the cap is reached.
+    MAX_ISSUES = 25
+    limit = max(MAX_ISSUES, len(python_issues))
+    unique: dict[tuple, dict] = {}
+    for i in itertools.chain(python_issues, llm_issues):
+        if len(unique) >= limit:
+            break
+        unique.setdefault((i.get("type"), _norm_msg(i.get("message") or ""), i.get("file")), i)
+    issues = list(unique.values())
+    blocker_count = sum(1 for i in issues if (i.get("severity") or "").lower() == "blocker")
+    advisory_count = len(issues) - blocker_count
+    if blocker_count and advisory_count:
+        _progress(f"✔ LLM review completed ({len(issues)} issues: {blocker_count} blocking, {advisory_count} advisory)")
+    elif blocker_count:
+        _progress(f"✔ LLM review completed ({blocker_count} blocking issue{'s' if blocker_count != 1 else ''})")
+    else:
+        _progress(f"✔ LLM review completed ({advisory_count} advisory finding{'s' if advisory_count != 1 else ''})")
+    return issues
+
+
+def _llm_failure_result(python_issues: list[dict], exc: BaseException) -> tuple[list[dict], bool, str | None]:
+    """LLM failure (timeout, network, API error) must NOT fail the pipeline.
+    Return deterministic issues only; add a warning so the report shows the failure."""
+    _progress(f"Gemini review failed (pipeline continues): {exc}")
+    return (
+        python_issues + [{"type": "error", "message": str(exc), "severity": "warning", "source": "deterministic"}],
+        True,
+        None,
+    )
+
+
+@_flushes_progress
 def review_tmcf(
     tmcf_path: str,
     model_id: str = "gemini-2.5-pro",
@@ -776,113 +1260,191 @@ def review_tmcf(
     Returns (issues_list, success, skip_reason).
     skip_reason "api_key_missing" when use_llm=True but no key (output still has deterministic issues).
     """
-    path = Path(tmcf_path)
-    if not path.exists():
-        return [{"type": "error", "message": f"File not found: {tmcf_path}", "severity": "blocker", "source": "deterministic"}], False, None
-
-    content = path.read_text(encoding="utf-8", errors="replace")
-    if not content.strip():
-        return [{"type": "info", "message": "Empty TMCF file", "severity": "warning", "source": "deterministic"}], True, None
+    content, early_result = _read_tmcf(tmcf_path)
+    if early_result is not None:
+        return early_result
 
-    stat_vars_content: str | None = None
-    stat_vars_schema_content: str | None = None
-    if stat_vars_mcf_path and Path(stat_vars_mcf_path).exists():
-        stat_vars_content = Path(stat_vars_mcf_path).read_text(encoding="utf-8", errors="replace")
-    if stat_vars_schema_mcf_path and Path(stat_vars_schema_mcf_path).exists():
-        stat_vars_schema_content = Path(stat_vars_schema_mcf_path).read_text(encoding="utf-8", errors="replace")
+    stat_vars_content = _read_text_or_none(stat_vars_mcf_path)
+    stat_vars_schema_content = _read_text_or_none(stat_vars_schema_mcf_path)
 
     csv_header_columns = _read_csv_header(csv_path) if csv_path else None
 
-    # Deterministic checks (no LLM) — always run
-    python_issues: list[dict] = []
-    if csv_header_columns:
-        python_issues.extend(_validate_column_refs_against_header(content, csv_header_columns))
-        python_issues.extend(_find_unused_csv_columns(content, csv_header_columns))
-    python_issues.extend(_check_value_column_mapped(content))
-    python_issues.extend(_check_statvar_observation_required_props(content, tmcf_path))
-    python_issues.extend(_validate_observation_date_literals(content))
-    # Reuse generated_dcids for format check and (below) stat_vars comparison so CSV is read at most once
-    generated_dcids = _extract_generated_statvar_dcids(content, csv_path)
-    python_issues.extend(_validate_statvar_dcid_format(content, csv_path, generated_dcids=generated_dcids))
-
-    if stat_vars_content and stat_vars_mcf_path:
-        python_issues.extend(_validate_stat_vars_mcf(stat_vars_content, stat_vars_mcf_path))
-        # Percent/rate StatVars in stat_vars MCF should have measurementDenominator
-        python_issues.extend(
-            _check_percent_statvar_denominator(stat_vars_content, stat_vars_mcf_path)
+    # The Gemini round-trip dominates latency, so start it now and let the deterministic
+    # checks run while it is in flight; errors surface from result() below.
+    api_key = _get_api_key() if use_llm else None
+    llm_future: Future[str] | None = None
+    if api_key:
+        llm_executor = ThreadPoolExecutor(max_workers=1)
+        llm_future = llm_executor.submit(
+            _call_gemini,
+            content,
+            api_key,
+            model_id,
+            stat_vars_content=stat_vars_content,
+            stat_vars_schema_content=stat_vars_schema_content,
+            csv_header_columns=csv_header_columns,
         )
-    if stat_vars_schema_content and stat_vars_schema_mcf_path:
-        python_issues.extend(_validate_stat_vars_mcf(stat_vars_schema_content, stat_vars_schema_mcf_path))
-
-    for i in python_issues:
-        i["source"] = "deterministic"
-
-    n = len(python_issues)
-    if n == 0:
-        print("✔ Deterministic checks passed (0 issues)", file=sys.stderr, flush=True)
-    else:
-        print(f"✖ Deterministic checks found {n} issue(s)", file=sys.stderr, flush=True)
+        llm_executor.shutdown(wait=False)
+
+    python_issues = _run_deterministic_checks(
+        content,
+        tmcf_path,
+        stat_vars_content,
+        stat_vars_mcf_path,
+        stat_vars_schema_content,
+        stat_vars_schema_mcf_path,
+        csv_path,
+        csv_header_columns,
+    )
 
     if not use_llm:
-        print("LLM review disabled", file=sys.stderr, flush=True)
+        _progress("LLM review disabled")
         return python_issues, True, None
 
-    api_key = _get_api_key()
-    if not api_key:
-        print("LLM review skipped (no API key)", file=sys.stderr, flush=True)
+    if llm_future is None:
+        _progress("LLM review skipped (no API key)")
         return python_issues, True, "api_key_missing"
 
     try:
-        response_text = _call_gemini(
+        return _merge_llm_issues(python_issues, _parse_llm_response(llm_future.result())), True, None
+    except Exception as e:
+        return _llm_failure_result(python_issues, e)
+
+
+@_flushes_progress
+def review_tmcfs(
+    tmcf_paths: list[str],
+    model_id: str = "gemini-2.5-pro",
+    stat_vars_mcf_path: str | None = None,
+    stat_vars_schema_mcf_path: str | None = None,
+    csv_path: str | None = None,
+    use_llm: bool = True,
+    tmcfs_per_prompt: int = 1,
+    llm_mode: str = "batch",
+    max_concurrency: int = 8,
+    rpm: int = 60,
+) -> list[tuple[list[dict], bool, str | None]]:
+    """
+    Review several TMCFs that share the same CSV and stat_vars inputs.
+    Deterministic checks run per file as in review_tmcf. With llm_mode="batch" the LLM portion for
+    all files is submitted as one Gemini inline batch job (discounted, not bound by the interactive
+    rate limit); with llm_mode="concurrent" prompts are sent as interactive calls, at most
+    max_concurrency in flight and rpm per minute (lower latency, standard pricing).
+    With tmcfs_per_prompt > 1, up to that many TMCFs are marshaled into each prompt (4-8 is a
+    reasonable start for many small files); a file whose result cannot be unmarshaled is re-reviewed
+    with its own interactive call.
+    A single path goes through review_tmcf so it keeps interactive latency.
+    Returns one (issues_list, success, skip_reason) per path, in order.
+    """
+    if len(tmcf_paths) <= 1:
+        return [
+            review_tmcf(
+                p,
+                model_id=model_id,
+                stat_vars_mcf_path=stat_vars_mcf_path,
+                stat_vars_schema_mcf_path=stat_vars_schema_mcf_path,
+                csv_path=csv_path,
+                use_llm=use_llm,
+            )
+            for p in tmcf_paths
+        ]
+
+    stat_vars_content = _read_text_or_none(stat_vars_mcf_path)
+    stat_vars_schema_content = _read_text_or_none(stat_vars_schema_mcf_path)
+
+    csv_header_columns = _read_csv_header(csv_path) if csv_path else None
+
+    results: list[tuple[list[dict], bool, str | None] | None] = [None] * len(tmcf_paths)
+    pending: list[tuple[int, str, list[dict]]] = []  # (index, content, deterministic issues)
+    for idx, tmcf_path in enumerate(tmcf_paths):
+        content, early_result = _read_tmcf(tmcf_path)
+        if early_result is not None:
+            results[idx] = early_result
+            continue
+        python_issues = _run_deterministic_checks(
             content,
-            api_key,
-            model_id,
-            stat_vars_content=stat_vars_content,
-            stat_vars_schema_content=stat_vars_schema_content,
-            csv_header_columns=csv_header_columns,
+            tmcf_path,
+            stat_vars_content,
+            stat_vars_mcf_path,
+            stat_vars_schema_content,
+            stat_vars_schema_mcf_path,
+            csv_path,
+            csv_header_columns,
         )
-        llm_issues = _parse_llm_response(response_text)
-        for i in llm_issues:
-            i["source"] = "llm"
-        # Prepend deterministic issues; cap total so LLM issues don't flood
-        MAX_ISSUES = 25
-        remaining = max(0, MAX_ISSUES - len(python_issues))
-        combined = python_issues + llm_issues[:remaining]
-        # Deduplicate by (type, normalized message) so whitespace variance doesn't create duplicates
-        def _norm_msg(s):
-            return " ".join((s or "").split())
-
-        seen = set()
-        issues = []
-        for i in combined:
-            key = (i.get("type"), _norm_msg(i.get("message")), i.get("file"))
-            if key in seen:
-                continue
-            seen.add(key)
-            issues.append(i)
-        blocker_count = sum(1 for i in issues if (i.get("severity") or "").lower() == "blocker")
-        advisory_count = len(issues) - blocker_count
-        if blocker_count and advisory_count:
-            print(f"✔ LLM review completed ({len(issues)} issues: {blocker_count} blocking, {advisory_count} advisory)", file=sys.stderr, flush=True)
-        elif blocker_count:
-            print(f"✔ LLM review completed ({blocker_count} blocking issue{'s' if blocker_count != 1 else ''})", file=sys.stderr, flush=True)
+        pending.append((idx, content, python_issues))
+
+    api_key = _get_api_key() if use_llm else None
+    if not pending or not api_key:
+        if not use_llm:
+            _progress("LLM review disabled")
+        elif pending:
+            _progress("LLM review skipped (no API key)")
+        skip_reason = "api_key_missing" if use_llm and not api_key else None
+        for idx, _, python_issues in pending:
+            results[idx] = (python_issues, True, skip_reason)
+        return results
+
+    reference_kwargs = {
+        "stat_vars_content": stat_vars_content,
+        "stat_vars_schema_content": stat_vars_schema_content,
+        "csv_header_columns": csv_header_columns,
+    }
+    group_size = max(1, tmcfs_per_prompt)
+    groups = [pending[i : i + group_size] for i in range(0, len(pending), group_size)]
+    prompts = [
+        _build_prompt(group[0][1], **reference_kwargs)
+        if len(group) == 1
+        else _build_marshaled_prompt([(Path(tmcf_paths[idx]).name, content) for idx, content, _ in group], **reference_kwargs)
+        for group in groups
+    ]
+    try:
+        if llm_mode == "concurrent":
+            responses = _call_gemini_many(prompts, api_key, model_id, max_concurrency=max_concurrency, rpm=rpm)
         else:
-            print(f"✔ LLM review completed ({advisory_count} advisory finding{'s' if advisory_count != 1 else ''})", file=sys.stderr, flush=True)
-        return issues, True, None
+            responses = _call_gemini_batch(prompts, api_key, model_id)
     except Exception as e:
-        # LLM failure (timeout, network, API error) must NOT fail the pipeline.
-        # Return deterministic issues only; add a warning so the report shows the failure.
-        print(f"Gemini review failed (pipeline continues): {e}", file=sys.stderr, flush=True)
-        return (
-            python_issues + [{"type": "error", "message": str(e), "severity": "warning", "source": "deterministic"}],
-            True,
-            None,
-        )
+        for idx, _, python_issues in pending:
+            results[idx] = _llm_failure_result(python_issues, e)
+        return results
+
+    for group, response in zip(groups, responses):
+        if len(group) == 1:
+            idx, _, python_issues = group[0]
+            if isinstance(response, BaseException):
+                results[idx] = _llm_failure_result(python_issues, response)
+            else:
+                results[idx] = (_merge_llm_issues(python_issues, _parse_llm_response(response)), True, None)
+            continue
+        per_file = None if isinstance(response, BaseException) else _parse_marshaled_llm_response(response, len(group))
+        for file_id, (idx, content, python_issues) in enumerate(group, start=1):
+            if per_file is not None and file_id in per_file:
+                results[idx] = (_merge_llm_issues(python_issues, per_file[file_id]), True, None)
+                continue
+            # Unusable multi-file result for this file: fall back to a single-file prompt.
+            try:
+                response_text = _call_gemini(content, api_key, model_id, **reference_kwargs)
+                results[idx] = (_merge_llm_issues(python_issues, _parse_llm_response(response_text)), True, None)
+            except Exception as e:
+                results[idx] = _llm_failure_result(python_issues, e)
+    return results
+
+
+def _write_output(issues: list[dict], output: str) -> None:
+    """Print issues as JSON to stdout (output "-") or write them to output atomically."""
+    if output == "-":
+        print(json_codec.dumps(issues, indent=True))
+    else:
+        json_codec.dump_path(issues, output, indent=True)
 
 
 def main():
     parser = argparse.ArgumentParser(description="Gemini Review (schema/typo) for TMCF")
-    parser.add_argument("--tmcf", required=True, help="Path to TMCF file")
+    parser.add_argument(
+        "--tmcf",
+        required=True,
+        action="append",
+        help="Path to TMCF file (repeat to review several TMCFs; their LLM review is sent as one Gemini batch job)",
+    )
     parser.add_argument("--output", "-o", default="-", help="Output path (default: stdout, use - for stdout)")
     parser.add_argument(
         "--model",
@@ -904,6 +1466,31 @@ def main():
         default="",
         help="Optional path to CSV file; first line (header) is used to validate column references in TMCF",
     )
+    parser.add_argument(
+        "--tmcfs-per-prompt",
+        type=int,
+        default=1,
+        help="With several --tmcf, marshal up to this many TMCFs into each Gemini prompt (default: 1, one prompt per file)",
+    )
+    parser.add_argument(
+        "--llm-mode",
+        choices=("batch", "concurrent"),
+        default="batch",
+        help="With several --tmcf: 'batch' submits one Gemini batch job (cheaper, queued); "
+        "'concurrent' makes interactive calls in parallel (faster). Default: batch",
+    )
+    parser.add_argument(
+        "--llm-max-concurrency",
+        type=int,
+        default=8,
+        help="Max interactive Gemini calls in flight with --llm-mode=concurrent (default: 8)",
+    )
+    parser.add_argument(
+        "--llm-rpm",
+        type=int,
+        default=60,
+        help="Max Gemini requests started per minute with --llm-mode=concurrent; 0 disables pacing (default: 60)",
+    )
     parser.add_argument(
         "--llm-review",
         action="store_true",
@@ -915,27 +1502,34 @@ def main():
     stat_vars_schema = args.stat_vars_schema_mcf.strip() or None
     csv_path = args.csv.strip() or None
 
-    issues, success, skip_reason = review_tmcf(
+    results = review_tmcfs(
         args.tmcf,
         model_id=args.model,
         stat_vars_mcf_path=stat_vars,
         stat_vars_schema_mcf_path=stat_vars_schema,
         csv_path=csv_path,
         use_llm=args.llm_review,
+        tmcfs_per_prompt=args.tmcfs_per_prompt,
+        llm_mode=args.llm_mode,
+        max_concurrency=args.llm_max_concurrency,
+        rpm=args.llm_rpm,
     )
 
-    source_file = Path(args.tmcf).name
-    for i in issues:
-        i.setdefault("file", source_file)
+    issues: list[dict] = []
+    success = True
+    skip_reason: str | None = None
+    for tmcf_path, (file_issues, file_success, file_skip_reason) in zip(args.tmcf, results):
+        source_file = Path(tmcf_path).name
+        for i in file_issues:
+            i.setdefault("file", source_file)
+        issues.extend(file_issues)
+        success = success and file_success
+        skip_reason = skip_reason or file_skip_reason
 
     if skip_reason == "api_key_missing":
         print("Skip: GEMINI_API_KEY or GOOGLE_API_KEY not set. Set it to enable Gemini review.", file=sys.stderr)
         # Still write deterministic issues (already in issues)
-        output_json = json.dumps(issues, indent=2)
-        if args.output != "-":
-            Path(args.output).write_text(output_json, encoding="utf-8")
-        else:
-            print(output_json)
+        _write_output(issues, args.output)
         has_blockers = any(
             i.get("severity") == "blocker"
             and i.get("source") == "deterministic"
@@ -946,18 +1540,10 @@ def main():
 
     if not success:
         print("Error: Gemini review failed.", file=sys.stderr)
-        output_json = json.dumps(issues, indent=2)
-        if args.output == "-":
-            print(output_json)
-        else:
-            Path(args.output).write_text(output_json, encoding="utf-8")
+        _write_output(issues, args.output)
         sys.exit(1)
 
-    output_json = json.dumps(issues, indent=2)
-    if args.output == "-":
-        print(output_json)
-    else:
-        Path(args.output).write_text(output_json, encoding="utf-8")
+    _write_output(issues, args.output)
 
     # Exit 1 if any deterministic blocker (LLM issues must not block)
     has_blockers = any(
@@ -16,19 +16,33 @@ Usage:
     --validation_config=config.json --validation_output=out.json [--lint_report=...] [--stats_summary=...] [--differ_output=...]
 """
 
+import contextlib
+import functools
+import io
 import json
 import os
+import stat
 import subprocess
 import sys
 import tempfile
+from collections import Counter
 from pathlib import Path
 
+_SCRIPT_DIR = Path(__file__).resolve().parent
+if str(_SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPT_DIR))
+
+import json_codec  # noqa: E402
+
 # Custom validator names that we run in this repo (DC runner does not know them).
 CUSTOM_VALIDATORS = frozenset({"STRUCTURAL_LINT_ERROR_COUNT", "OBSERVATION_DATE_GRANULARITY"})
 
 # Validators implemented in this repository (not handled by the DC runner).
 DC_EXCLUDE_VALIDATORS = frozenset({"LINT_ERROR_COUNT", "STRUCTURAL_LINT_ERROR_COUNT"})
 
+# Custom validators that read the lint report; it is only parsed when one of them is enabled.
+_LINT_REPORT_CONSUMERS = frozenset({"STRUCTURAL_LINT_ERROR_COUNT"})
+
 
 def _load_config(path: str) -> dict:
     with open(path, encoding="utf-8") as f:
@@ -139,6 +153,51 @@ def _split_rules(config: dict) -> tuple[list, list]:
     return dc_rules, custom_rules
 
 
+def _run_dc_runner_in_process(
+    data_repo: str,
+    config_path: str,
+    output_path: str,
+    stats_summary: str | None,
+    lint_report: str | None,
+    differ_output: str | None,
+) -> bool:
+    """Run the DC ValidationRunner inside this interpreter (cwd = data_repo), skipping the
+    interpreter start-up and module imports of a subprocess.
+
+    Returns False when the runner cannot be loaded or constructed here, in which case the
+    caller falls back to the subprocess. The runner writes output_path itself either way.
+    Like the subprocess (capture_output=True), the runner's stdout is discarded and its
+    stderr is only replayed when it fails, so it never reaches the streamed run log.
+    """
+    if data_repo not in sys.path:
+        sys.path.insert(0, data_repo)
+    captured_err = io.StringIO()
+    with contextlib.chdir(data_repo):
+        try:
+            from tools.import_validation import runner as dc_runner
+
+            validation_runner = dc_runner.ValidationRunner(
+                validation_config_path=config_path,
+                differ_output=differ_output,
+                stats_summary=stats_summary,
+                lint_report=lint_report,
+                validation_output=output_path,
+            )
+        except Exception as exc:
+            print(f"DC runner not usable in-process ({exc}); running it as a subprocess", file=sys.stderr)
+            return False
+        try:
+            with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(captured_err):
+                validation_runner.run_validations()
+        except (Exception, SystemExit) as exc:
+            # Same outcome as a crashed subprocess: whatever output exists is used and
+            # missing rules are reported as FAILED by the caller.
+            print(f"DC runner raised {type(exc).__name__}: {exc}", file=sys.stderr)
+            if captured_err.getvalue():
+                print(captured_err.getvalue(), file=sys.stderr)
+        return True
+
+
 def _run_dc_runner(
     data_repo: str,
     config_path: str,
@@ -148,46 +207,77 @@ def _run_dc_runner(
     differ_output: str | None,
     python: str,
 ) -> list:
-    """Run the DC runner; return list of result dicts."""
-    cmd = [
-        python, "-m", "tools.import_validation.runner",
-        "--validation_config", config_path,
-        "--validation_output", output_path,
-    ]
-    if stats_summary and os.path.isfile(stats_summary):
-        cmd.extend(["--stats_summary", stats_summary])
-    if lint_report and os.path.isfile(lint_report):
-        cmd.extend(["--lint_report", lint_report])
-    if differ_output is not None:
-        cmd.extend(["--differ_output", differ_output or ""])
-
-    result = subprocess.run(
-        cmd,
-        cwd=data_repo,
-        capture_output=True,
-        text=True,
+    """Run the DC runner; return list of result dicts.
+
+    Runs in-process when the data repo's runner can be imported (set DC_RUNNER_SUBPROCESS=1
+    to always use a subprocess), otherwise as `python -m tools.import_validation.runner`.
+    """
+    if stats_summary and not os.path.isfile(stats_summary):
+        stats_summary = None
+    if lint_report and not os.path.isfile(lint_report):
+        lint_report = None
+
+    ran_in_process = os.environ.get("DC_RUNNER_SUBPROCESS") != "1" and _run_dc_runner_in_process(
+        data_repo, config_path, output_path, stats_summary, lint_report, differ_output
     )
-    if result.returncode != 0:
-        if result.returncode == 1:
-            print("Validation rules reported failures (exit code 1)", file=sys.stderr)
-        else:
-            print(f"DC runner exited with code {result.returncode}", file=sys.stderr)
-        if result.stderr:
-            print(result.stderr, file=sys.stderr)
+    if not ran_in_process:
+        cmd = [
+            python, "-m", "tools.import_validation.runner",
+            "--validation_config", config_path,
+            "--validation_output", output_path,
+        ]
+        if stats_summary:
+            cmd.extend(["--stats_summary", stats_summary])
+        if lint_report:
+            cmd.extend(["--lint_report", lint_report])
+        if differ_output is not None:
+            cmd.extend(["--differ_output", differ_output or ""])
+
+        result = subprocess.run(
+            cmd,
+            cwd=data_repo,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            if result.returncode == 1:
+                print("Validation rules reported failures (exit code 1)", file=sys.stderr)
+            else:
+                print(f"DC runner exited with code {result.returncode}", file=sys.stderr)
+            if result.stderr:
+                print(result.stderr, file=sys.stderr)
 
     if not os.path.isfile(output_path):
         return []
     try:
-        with open(output_path, encoding="utf-8") as f:
+        with open(output_path, "rb") as f:
             raw = f.read().strip()
         if not raw:
             return []
-        data = json.loads(raw)
+        data = json_codec.loads(raw)
     except (json.JSONDecodeError, OSError):
         return []
     return data if isinstance(data, list) else []
 
 
+def _load_lint_report(path: str) -> dict | None:
+    """Parse the lint report at path (None if missing). Parsed once per file version per process;
+    callers share the returned dict and must not mutate it."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    return _load_lint_report_cached(path, st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_lint_report_cached(path: str, mtime_ns: int, size: int) -> dict | None:
+    with open(path, "rb") as f:
+        return json_codec.loads(f.read())
+
+
 def _run_custom_validators(
     custom_rules: list[dict],
     lint_report_path: str | None,
@@ -200,9 +290,8 @@ def _run_custom_validators(
 
     results = []
     report = None
-    if lint_report_path and os.path.isfile(lint_report_path):
-        with open(lint_report_path, encoding="utf-8") as f:
-            report = json.load(f)
+    if lint_report_path and any(r.get("validator") in _LINT_REPORT_CONSUMERS for r in custom_rules):
+        report = _load_lint_report(lint_report_path)
 
     for rule in custom_rules:
         validator = rule.get("validator")
@@ -351,8 +440,7 @@ def main() -> int:
 
     out_path = Path(output_path)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(combined, f, indent=2, default=str)
+    json_codec.dump_path(combined, out_path, indent=True, default=str)
 
     # PASSED and WARNING are non-blocking; FAILED and CONFIG_ERROR cause exit 1.
     # CONFIG_ERROR is returned by SQL_VALIDATOR when the query is malformed (syntax
@@ -360,9 +448,15 @@ def main() -> int:
     # bad custom SQL rules are never silently ignored.
     # Partial DC runner output is handled above by injecting synthetic FAILED entries,
     # so combined always reflects the true state of every rule.
-    _PASSING_STATUSES = frozenset({"PASSED", "WARNING"})
-    all_passed = all(r.get("status") in _PASSING_STATUSES for r in combined)
-    return 0 if all_passed else 1
+    # One pass over the results gives both the exit decision and the summary line.
+    status_counts = Counter(r.get("status") for r in combined)
+    blocking = len(combined) - status_counts["PASSED"] - status_counts["WARNING"]
+    print(
+        f"Validation: {len(combined)} rule(s): {status_counts['PASSED']} passed, "
+        f"{status_counts['WARNING']} warning, {blocking} blocking",
+        file=sys.stderr,
+    )
+    return 0 if blocking == 0 else 1
 
 
 if __name__ == "__main__":
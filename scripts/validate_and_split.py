@@ -46,13 +46,18 @@ from __future__ import annotations
 
 import argparse
 import csv
-import hashlib
 import json
 import os
 import sys
 import time
 from pathlib import Path
 
+_SCRIPT_DIR = Path(__file__).resolve().parent
+if str(_SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPT_DIR))
+
+from csv_quality import duplicate_column_names, is_numeric, row_fingerprint  # noqa: E402
+
 
 _DEFAULT_ROWS_PER_SHARD = 1_000_000
 _DEFAULT_THRESHOLD_ROWS = 5_000_000
@@ -62,20 +67,6 @@ def _log(msg: str) -> None:
     print(f"[VALIDATE+SPLIT] {msg}", flush=True)
 
 
-def _is_empty(s: str) -> bool:
-    return not s or not s.strip()
-
-
-def _is_numeric(s: str) -> bool:
-    if _is_empty(s):
-        return True
-    try:
-        float(s.strip())
-        return True
-    except ValueError:
-        return False
-
-
 def _write_details(
     path: str,
     *,
@@ -203,11 +194,7 @@ def run(
                 return 1
 
             # ── Duplicate column check (header only) ─────────────────────────
-            seen_names: dict[str, list[int]] = {}
-            for i, col in enumerate(header):
-                name = (col or "").strip()
-                seen_names.setdefault(name, []).append(i)
-            duplicate_columns = [n for n, idxs in seen_names.items() if len(idxs) > 1]
+            duplicate_columns = duplicate_column_names(header)
 
             # ── Pre-compute column indices for the hot path ───────────────────
             # Using list indices (not dict) avoids per-row dict allocation.
@@ -215,6 +202,8 @@ def run(
                 (col, i) for i, col in enumerate(header) if col
             ]
             all_key_col_names: list[str] = [col for col, _ in key_col_pairs]
+            key_idx: list[int] = [idx for _, idx in key_col_pairs]
+            width = len(header)
             check_value_col = bool(value_column and value_column in header)
             value_col_idx = header.index(value_column) if check_value_col else -1
 
@@ -239,11 +228,9 @@ def run(
                 # 2. Duplicate row detection (fail-fast; hash set stops growing
                 #    after the first duplicate is found)
                 if not no_dup_check and first_dup_row is None:
-                    key = tuple(
-                        row[idx].strip() if idx < len(row) else ""
-                        for _, idx in key_col_pairs
-                    )
-                    h = hashlib.blake2b(repr(key).encode(), digest_size=16).digest()
+                    # Missing cells count as "" here; pad a copy so shards keep the row as read.
+                    cells = row if len(row) >= width else row + [""] * (width - len(row))
+                    h = row_fingerprint(cells, key_idx)
                     if h in seen_row_hashes:
                         first_dup_row = row_num
                     else:
@@ -252,7 +239,7 @@ def run(
                 # 3. Non-numeric value column
                 if check_value_col and value_col_idx >= 0:
                     val = row[value_col_idx] if value_col_idx < len(row) else ""
-                    if not _is_numeric(val):
+                    if not is_numeric(val):
                         bad_rows.append(row_num)
 
                 # 4. Shard writer — roll over when current shard is full
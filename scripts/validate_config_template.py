@@ -16,6 +16,12 @@ import re
 import sys
 from pathlib import Path
 
+_SCRIPT_DIR = Path(__file__).resolve().parent
+if str(_SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPT_DIR))
+
+import json_codec  # noqa: E402
+
 
 REQUIRED_TOP_LEVEL = ("rules",)
 OPTIONAL_TOP_LEVEL = ("schema_version",)
@@ -23,6 +29,59 @@ REQUIRED_RULE_KEYS = ("rule_id", "description", "validator", "scope", "params")
 OPTIONAL_RULE_KEYS = ("enabled",)  # enabled: false to disable a rule without removing it
 VALID_DATA_SOURCES = ("stats", "lint", "differ")
 RULE_ID_PATTERN = r"^[a-z][a-z0-9_]*$"  # snake_case, starts with letter
+_RULE_ID_RE = re.compile(RULE_ID_PATTERN)
+
+
+# Per-key rule checks: each takes (value, rule_ids seen so far) and returns an error message
+# (without the "path: rules[i]: " prefix) or None. One dict lookup per key; keys missing from
+# the table are unknown.
+def _check_rule_id(rv, seen_rule_ids: set[str]) -> str | None:
+    if not isinstance(rv, str) or not rv.strip():
+        return "rule_id must be a non-empty string"
+    if not _RULE_ID_RE.match(rv):
+        return "rule_id should be snake_case (e.g. check_min_value)"
+    if rv in seen_rule_ids:
+        return f"duplicate rule_id {rv!r} (rule_id must be unique)"
+    seen_rule_ids.add(rv)
+    return None
+
+
+def _check_description(rv, seen_rule_ids: set[str]) -> str | None:
+    return None if isinstance(rv, str) else "description must be a string"
+
+
+def _check_validator(rv, seen_rule_ids: set[str]) -> str | None:
+    return None if isinstance(rv, str) and rv.strip() else "validator must be a non-empty string"
+
+
+def _check_scope(rv, seen_rule_ids: set[str]) -> str | None:
+    if not isinstance(rv, dict):
+        return "scope must be an object"
+    if "data_source" in rv and rv["data_source"] not in VALID_DATA_SOURCES:
+        # data_source is enforced here for schema consistency and documentation of rule intent.
+        # The upstream DC validation runner may determine data source from validator type;
+        # this field may not influence execution but keeps config self-describing.
+        return f"scope.data_source must be one of {VALID_DATA_SOURCES}"
+    return None
+
+
+def _check_params(rv, seen_rule_ids: set[str]) -> str | None:
+    return None if isinstance(rv, dict) else "params must be an object"
+
+
+def _check_enabled(rv, seen_rule_ids: set[str]) -> str | None:
+    return None if isinstance(rv, bool) else "enabled must be a boolean"
+
+
+_RULE_KEY_CHECKS = {
+    "rule_id": _check_rule_id,
+    "description": _check_description,
+    "validator": _check_validator,
+    "scope": _check_scope,
+    "params": _check_params,
+    "enabled": _check_enabled,
+}
+_ALLOWED_RULE_KEYS = list(REQUIRED_RULE_KEYS) + list(OPTIONAL_RULE_KEYS)
 
 
 def _validate_config(config: dict, path: str) -> list[str]:
@@ -56,37 +115,13 @@ def _validate_config(config: dict, path: str) -> list[str]:
             if rk not in rule:
                 errors.append(f"{prefix}: missing required key '{rk}'")
         for rk, rv in rule.items():
-            if rk == "rule_id":
-                if not isinstance(rv, str) or not rv.strip():
-                    errors.append(f"{prefix}: rule_id must be a non-empty string")
-                elif not re.match(RULE_ID_PATTERN, rv):
-                    errors.append(f"{prefix}: rule_id should be snake_case (e.g. check_min_value)")
-                elif rv in seen_rule_ids:
-                    errors.append(f"{prefix}: duplicate rule_id {rv!r} (rule_id must be unique)")
-                else:
-                    seen_rule_ids.add(rv)
-            elif rk == "description":
-                if not isinstance(rv, str):
-                    errors.append(f"{prefix}: description must be a string")
-            elif rk == "validator":
-                if not isinstance(rv, str) or not rv.strip():
-                    errors.append(f"{prefix}: validator must be a non-empty string")
-            elif rk == "scope":
-                if not isinstance(rv, dict):
-                    errors.append(f"{prefix}: scope must be an object")
-                elif "data_source" in rv and rv["data_source"] not in VALID_DATA_SOURCES:
-                    # data_source is enforced here for schema consistency and documentation of rule intent.
-                    # The upstream DC validation runner may determine data source from validator type;
-                    # this field may not influence execution but keeps config self-describing.
-                    errors.append(f"{prefix}: scope.data_source must be one of {VALID_DATA_SOURCES}")
-            elif rk == "params":
-                if not isinstance(rv, dict):
-                    errors.append(f"{prefix}: params must be an object")
-            elif rk == "enabled":
-                if not isinstance(rv, bool):
-                    errors.append(f"{prefix}: enabled must be a boolean")
-            elif rk not in REQUIRED_RULE_KEYS and rk not in OPTIONAL_RULE_KEYS:
-                errors.append(f"{prefix}: unknown rule key '{rk}' (allowed: {list(REQUIRED_RULE_KEYS) + list(OPTIONAL_RULE_KEYS)})")
+            check = _RULE_KEY_CHECKS.get(rk)
+            if check is None:
+                errors.append(f"{prefix}: unknown rule key '{rk}' (allowed: {_ALLOWED_RULE_KEYS})")
+                continue
+            message = check(rv, seen_rule_ids)
+            if message:
+                errors.append(f"{prefix}: {message}")
 
     if "schema_version" in config and not isinstance(config["schema_version"], str):
         errors.append(f"{path}: schema_version must be a string")
@@ -114,12 +149,13 @@ def main():
     if not path:
         parser.error("Provide config_path or --path")
     path = str(path)
-    if not Path(path).exists():
+    # Open directly (no separate exists() stat); a missing file is reported as before.
+    try:
+        with open(path, "rb") as f:
+            config = json_codec.loads(f.read())
+    except FileNotFoundError:
         print(f"Error: file not found: {path}", file=sys.stderr)
         sys.exit(1)
-    try:
-        with open(path, encoding="utf-8") as f:
-            config = json.load(f)
     except (OSError, json.JSONDecodeError) as e:
         print(f"Error reading {path}: {e}", file=sys.stderr)
         sys.exit(1)
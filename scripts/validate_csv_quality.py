@@ -22,27 +22,18 @@ Usage:
 
 import argparse
 import csv
-import hashlib
-import json
 import sys
 from pathlib import Path
 
+_SCRIPT_DIR = Path(__file__).resolve().parent
+if str(_SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPT_DIR))
 
-def _is_empty(s: str) -> bool:
-    return s is None or (isinstance(s, str) and not s.strip())
+import json_codec  # noqa: E402
+from csv_quality import duplicate_column_names, is_empty, is_numeric, row_fingerprint  # noqa: E402
 
-
-def _is_numeric(s: str) -> bool:
-    if _is_empty(s):
-        return True
-    s = str(s).strip()
-    if not s:
-        return True
-    try:
-        float(s)
-        return True
-    except ValueError:
-        return False
+# --output-details is indented only up to this many list entries in total.
+_PRETTY_DETAILS_MAX_ENTRIES = 1000
 
 
 def validate_csv(
@@ -67,22 +58,19 @@ def validate_csv(
     if not path.exists():
         return ([f"CSV file not found: {csv_path}"], details)
 
-    # Single file open for all checks. csv.DictReader reads the header row the
-    # first time .fieldnames is accessed (before any data rows are iterated), so
-    # the duplicate-column check and the streaming data pass share one open().
-    # No row is held in memory beyond the current loop iteration — the original
-    # list(csv.DictReader(...)) pattern loaded the entire CSV as a list of dicts,
-    # which cost ~7–8× the raw CSV size in Python object overhead on large files.
+    # Single file open and a single streaming pass for all checks. csv.reader yields
+    # plain lists, so cells are read by position (no per-row dict as with DictReader)
+    # and no row is held in memory beyond the current loop iteration.
     #
     # Memory profile of the streaming approach:
-    #   Duplicate columns: O(columns) — header dict only
-    #   Empty columns:     O(columns) — seen_nonempty set, never grows with row count
-    #   Duplicate rows:    O(N) ints — one 8-byte hash per unique row (vs O(N×cols×val_len)
-    #                      for full tuple storage); stops growing after first duplicate found
+    #   Duplicate columns: O(columns) — header only
+    #   Empty columns:     O(columns) — positions still waiting for a non-empty value;
+    #                      the list only shrinks, and the check stops once it is empty
+    #   Duplicate rows:    O(N) — one 16-byte digest per unique row (vs O(N×cols×val_len)
+    #                      for full tuple storage); freed once the first duplicate is found
     #   Non-numeric:       O(bad_rows) — only offending row numbers; empty for valid data
     key_cols: list[str] = []
-    seen_nonempty: set[str] = set()     # columns that have received at least one non-empty value
-    seen_row_hashes: set[bytes] = set() # row fingerprints: blake2b-128 of repr(key)
+    seen_row_hashes: set[bytes] = set() # row fingerprints: blake2b-128 of the row key
     first_dup_row: int | None = None
     bad_rows: list[int] = []
     row_count = 0
@@ -90,72 +78,61 @@ def validate_csv(
 
     try:
         with open(path, encoding="utf-8", newline="") as f:
-            reader = csv.DictReader(f)
-
-            # Accessing .fieldnames reads the header row from the file. All
-            # subsequent iterations start from the first data row automatically.
-            raw_fieldnames = reader.fieldnames
-            if not raw_fieldnames:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            if not header:
                 return (errors + ["CSV has no header row"], details)
-            header = list(raw_fieldnames)
 
             # 1. Duplicate column names — inspects header only, O(columns)
-            seen: dict[str, list[int]] = {}
-            for i, col in enumerate(header):
-                name = (col or "").strip()
-                if name not in seen:
-                    seen[name] = []
-                seen[name].append(i)
-            dupes = [name for name, indices in seen.items() if len(indices) > 1]
+            dupes = duplicate_column_names(header)
             if dupes:
-                details["duplicate_columns"] = list(dupes)
+                details["duplicate_columns"] = dupes
                 errors.append(f"Duplicate column name(s): {', '.join(repr(d) for d in dupes)}")
 
+            # Column name -> position, resolved once. When a name repeats, the last
+            # occurrence wins (same cell a DictReader row would return for that name).
+            col_idx = {col: i for i, col in enumerate(header)}
             key_cols = [c for c in header if c]
-            check_value_col = bool(value_column and value_column in header)
-
-            # Streaming pass: checks 2, 3, and 4 run concurrently in one loop.
-            for i, row in enumerate(reader):
+            key_idx = [col_idx[c] for c in key_cols]
+            value_idx = col_idx[value_column] if value_column and value_column in col_idx else -1
+            width = len(header)
+            pending_empty = list(dict.fromkeys(key_idx))  # positions with no non-empty cell yet
+
+            # Streaming pass: checks 2, 3, and 4 run together in one loop.
+            for row in reader:
+                if not row:
+                    continue  # blank line
                 row_count += 1
-                row_num = i + 2  # 1-based; header is row 1
-
-                # 2. Empty column tracking: add a column to seen_nonempty the
-                #    first time a non-empty value is encountered. The inner loop
-                #    short-circuits once all columns are accounted for.
-                if len(seen_nonempty) < len(key_cols):
-                    for col in key_cols:
-                        if col not in seen_nonempty and not _is_empty(row.get(col, "")):
-                            seen_nonempty.add(col)
-
-                # 3. Duplicate row detection: store a 128-bit blake2b digest of
-                #    repr(key) instead of the full tuple.
-                #
-                #    Why repr(key) rather than "|".join(key): Python's tuple repr
-                #    quotes and escapes each element individually, making the encoding
-                #    unambiguous — ("a|b", "c") and ("a", "|b|c") produce different
-                #    reprs regardless of separator choice.
-                #
-                #    Why blake2b digest_size=16 rather than hash(): Python's hash()
-                #    space is 2^61 (sys.hash_info.modulus is a Mersenne prime). The
-                #    birthday-paradox collision probability at 30M rows is ~1 in 5,000
-                #    — non-trivial for a validator that must not produce false positives.
-                #    A 128-bit digest reduces that probability to ~10^-24.
+                row_num = row_count + 1  # 1-based; header is row 1
+                if len(row) < width:
+                    row += [None] * (width - len(row))  # short row: missing cells are None
+
+                # 2. Empty column tracking: drop a position from pending_empty the
+                #    first time it holds a non-empty value; skipped once all are seen.
+                if pending_empty:
+                    pending_empty = [i for i in pending_empty if is_empty(row[i])]
+
+                # 3. Duplicate row detection: store a 128-bit digest of the row key
+                #    (see csv_quality.row_fingerprint for the encoding) instead of
+                #    the full tuple.
                 #
-                #    Memory: 16 bytes per unique row seen. Stops accumulating after
-                #    the first duplicate is found (fail-fast, same behaviour as before).
+                #    Memory: 16 bytes per unique row seen, until the first duplicate is
+                #    found; after that only the first duplicate is reported, so the set
+                #    is released and rows are no longer hashed.
                 if first_dup_row is None:
-                    key = tuple(str(row.get(c, "")).strip() for c in key_cols)
-                    h = hashlib.blake2b(repr(key).encode(), digest_size=16).digest()
+                    h = row_fingerprint(row, key_idx)
                     if h in seen_row_hashes:
                         first_dup_row = row_num
+                        # No further hashing: release the digests while checks 2 and 4
+                        # finish the pass.
+                        seen_row_hashes.clear()
                     else:
                         seen_row_hashes.add(h)
 
                 # 4. Non-numeric value column: accumulate all offending row
                 #    numbers; only bad rows consume memory.
-                if check_value_col:
-                    if not _is_numeric(row.get(value_column, "")):
-                        bad_rows.append(row_num)
+                if value_idx >= 0 and not is_numeric(row[value_idx]):
+                    bad_rows.append(row_num)
 
     except (OSError, csv.Error, UnicodeDecodeError) as e:
         return (errors + [f"Error reading CSV rows: {e}"], details)
@@ -164,8 +141,9 @@ def validate_csv(
         return (errors, details)
 
     # 2. Empty columns — assemble results after the streaming pass
+    empty_idx = set(pending_empty)
     for col in key_cols:
-        if col not in seen_nonempty:
+        if col_idx[col] in empty_idx:
             details["empty_columns"].append(col)
             if not allow_empty_columns:
                 errors.append(f"Column is entirely empty: {col!r}")
@@ -234,8 +212,12 @@ def main():
         if write_details:
             try:
                 out_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(out_path, "w", encoding="utf-8") as f:
-                    json.dump(merged_details, f, indent=2)
+                # Pretty-print small details; large ones (e.g. 10^5 non-numeric row numbers)
+                # are written compact, since indentation would put each number on its own line.
+                n_entries = sum(len(v) for v in merged_details.values())
+                json_codec.dump_path(
+                    merged_details, out_path, indent=n_entries <= _PRETTY_DETAILS_MAX_ENTRIES
+                )
             except OSError:
                 pass
 
@@ -16,9 +16,29 @@ Usage:
 
 import argparse
 import json
+import os
 import sys
 from pathlib import Path
 
+_TMCF_SUFFIXES = frozenset({".tmcf", ".mcf"})
+_CSV_SUFFIXES = frozenset({".csv"})
+_MCF_SUFFIXES = frozenset({".mcf"})
+
+
+def _check_file(
+    path: str,
+    shown: str,
+    label: str,
+    suffixes: frozenset[str],
+    suffix_desc: str,
+    errors: list[str],
+) -> None:
+    """Append an error if path is missing or its extension is not in suffixes (one stat call)."""
+    if not os.path.exists(path):
+        errors.append(f"{label} not found: {shown}")
+    elif Path(path).suffix.lower() not in suffixes:
+        errors.append(f"{label} must have {suffix_desc} extension: {shown}")
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -37,30 +57,16 @@ def main():
 
     errors = []
 
-    tmcf = Path(args.tmcf)
-    if not tmcf.exists():
-        errors.append(f"TMCF file not found: {args.tmcf}")
-    elif tmcf.suffix.lower() not in (".tmcf", ".mcf"):
-        errors.append(f"TMCF file must have .tmcf or .mcf extension: {args.tmcf}")
-
+    _check_file(args.tmcf, args.tmcf, "TMCF file", _TMCF_SUFFIXES, ".tmcf or .mcf", errors)
     for csv_arg in args.csv:
-        csv_path = Path(csv_arg)
-        if not csv_path.exists():
-            errors.append(f"CSV file not found: {csv_arg}")
-        elif csv_path.suffix.lower() != ".csv":
-            errors.append(f"CSV file must have .csv extension: {csv_arg}")
-
+        _check_file(csv_arg, csv_arg, "CSV file", _CSV_SUFFIXES, ".csv", errors)
     for label, path_arg in (
         ("stat_vars.mcf", args.stat_vars_mcf),
         ("stat_vars_schema.mcf", args.stat_vars_schema_mcf),
     ):
-        if not path_arg or not path_arg.strip():
-            continue
-        p = Path(path_arg.strip())
-        if not p.exists():
-            errors.append(f"{label} not found: {path_arg}")
-        elif p.suffix.lower() != ".mcf":
-            errors.append(f"{label} must have .mcf extension: {path_arg}")
+        path = (path_arg or "").strip()
+        if path:
+            _check_file(path, path_arg, label, _MCF_SUFFIXES, ".mcf", errors)
 
     if errors:
         if (args.output_errors or "").strip():
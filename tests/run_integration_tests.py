@@ -14,13 +14,22 @@ Requirements:
   - ./run_e2e_test.sh and ./setup.sh already run once (venv, JAR, etc.)
 """
 
-import json
 import os
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import json_codec  # noqa: E402
+
+# Environment snapshot taken once; run_e2e passes it as-is (subprocess does not modify it)
+# and tests that need changes build {**_BASE_ENV, ...} instead of copying os.environ.
+_BASE_ENV = dict(os.environ)
+
 
 def project_root() -> Path:
     root = Path(__file__).resolve().parent.parent
@@ -28,69 +37,71 @@ def project_root() -> Path:
     return root
 
 
-def run_e2e(dataset: str, *extra_args: str, env: dict | None = None) -> tuple[int, str]:
-    """Run run_e2e_test.sh with dataset and optional args. Returns (returncode, combined stdout+stderr)."""
+def run_e2e(dataset: str, *extra_args: str, env: dict | None = None) -> tuple[int, bytes]:
+    """Run run_e2e_test.sh with dataset and optional args. Returns (returncode, combined stdout+stderr).
+
+    Output stays bytes: assertions only test for substrings (bytes needles), and only the
+    tail shown on failure is decoded (see _tail).
+    """
     root = project_root()
     script = root / "run_e2e_test.sh"
     cmd = ["bash", str(script), dataset, *extra_args]
-    env = env if env is not None else os.environ.copy()
+    env = env if env is not None else _BASE_ENV
     result = subprocess.run(
         cmd,
         cwd=str(root),
         capture_output=True,
-        text=True,
         timeout=300,
         env=env,
     )
-    out = (result.stdout or "") + (result.stderr or "")
-    return result.returncode, out
+    return result.returncode, result.stdout + result.stderr
+
+
+def _tail(out: bytes, n: int) -> str:
+    """Last n bytes of output, decoded for an assertion message."""
+    return out[-n:].decode("utf-8", errors="replace")
 
 
 def test_child_birth_pass() -> None:
     """Dataset child_birth with --no-llm-review: expect PASS, exit 0, step markers."""
     code, out = run_e2e("child_birth", "--no-llm-review")
-    assert code == 0, f"child_birth (no LLM) expected exit 0, got {code}\n{out[-2000:]}"
-    assert "Validation PASSED" in out or "✓ Validation PASSED" in out, f"Expected PASSED in output\n{out[-1500:]}"
-    assert "::STEP::" in out or "Step 1" in out, "Expected step markers or Step 1 in output"
+    assert code == 0, f"child_birth (no LLM) expected exit 0, got {code}\n{_tail(out, 2000)}"
+    assert b"Validation PASSED" in out or "✓ Validation PASSED".encode() in out, f"Expected PASSED in output\n{_tail(out, 1500)}"
+    assert b"::STEP::" in out or b"Step 1" in out, "Expected step markers or Step 1 in output"
 
 
 def test_no_api_key_skips_llm() -> None:
     """With GEMINI_API_KEY unset and --llm-review: LLM is skipped; exit 0 or 1 from deterministic only."""
-    env = os.environ.copy()
-    env.pop("GEMINI_API_KEY", None)
-    env.pop("GOOGLE_API_KEY", None)
+    env = {k: v for k, v in _BASE_ENV.items() if k not in ("GEMINI_API_KEY", "GOOGLE_API_KEY")}
     code, out = run_e2e("child_birth", "--llm-review", env=env)
-    assert "LLM review skipped" in out or "no API key" in out, f"Expected LLM skip message in output\n{out[-1500:]}"
+    assert b"LLM review skipped" in out or b"no API key" in out, f"Expected LLM skip message in output\n{_tail(out, 1500)}"
     # child_birth is clean so deterministic passes → exit 0
-    assert code == 0, f"child_birth with no API key expected exit 0 (deterministic pass), got {code}\n{out[-1500:]}"
+    assert code == 0, f"child_birth with no API key expected exit 0 (deterministic pass), got {code}\n{_tail(out, 1500)}"
 
 
 def test_step_protocol_labels() -> None:
     """Output should contain formal step labels (::STEP::N:Label) matching the pipeline."""
     code, out = run_e2e("child_birth", "--no-llm-review")
     assert code == 0, f"child_birth expected exit 0, got {code}"
-    assert "::STEP::0:Pre-Import Checks" in out, "Expected ::STEP::0:Pre-Import Checks"
-    assert "::STEP::1:Gemini Review" in out, "Expected ::STEP::1:Gemini Review"
-    assert "::STEP::2:DC Import Tool" in out, "Expected ::STEP::2:DC Import Tool"
-    assert "::STEP::3:DC Import Validation" in out, "Expected ::STEP::3:DC Import Validation"
-    assert "::STEP::4:Results" in out, "Expected ::STEP::4:Results"
+    assert b"::STEP::0:Pre-Import Checks" in out, "Expected ::STEP::0:Pre-Import Checks"
+    assert b"::STEP::1:Gemini Review" in out, "Expected ::STEP::1:Gemini Review"
+    assert b"::STEP::2:DC Import Tool" in out, "Expected ::STEP::2:DC Import Tool"
+    assert b"::STEP::3:DC Import Validation" in out, "Expected ::STEP::3:DC Import Validation"
+    assert b"::STEP::4:Results" in out, "Expected ::STEP::4:Results"
 
 
 def test_deterministic_mode_no_existence_counters() -> None:
     """With LOCAL + existence-checks=false, run passes and report has no existence-related lint counters."""
-    env = os.environ.copy()
-    env["IMPORT_RESOLUTION_MODE"] = "LOCAL"
-    env["IMPORT_EXISTENCE_CHECKS"] = "false"
+    env = {**_BASE_ENV, "IMPORT_RESOLUTION_MODE": "LOCAL", "IMPORT_EXISTENCE_CHECKS": "false"}
     code, out = run_e2e("child_birth", "--no-llm-review", env=env)
-    assert code == 0, f"deterministic mode expected exit 0, got {code}\n{out[-2000:]}"
-    assert "Validation PASSED" in out or "✓ Validation PASSED" in out
+    assert code == 0, f"deterministic mode expected exit 0, got {code}\n{_tail(out, 2000)}"
+    assert b"Validation PASSED" in out or "✓ Validation PASSED".encode() in out
 
     root = project_root()
     report_path = root / "output" / "child_birth_genmcf" / "report.json"
     assert report_path.exists(), f"report.json not found at {report_path}"
 
-    with open(report_path, encoding="utf-8") as f:
-        report = json.load(f)
+    report = json_codec.loads(report_path.read_bytes())
     cmd = report.get("commandArgs", {})
     assert cmd.get("existenceChecks") is False, "expected existenceChecks=false in report commandArgs"
 
@@ -107,39 +118,60 @@ def test_deterministic_mode_no_existence_counters() -> None:
 
 def test_full_mode_smoke() -> None:
     """FULL resolution mode: pipeline runs to completion (smoke test; may require network)."""
-    env = os.environ.copy()
-    env["IMPORT_RESOLUTION_MODE"] = "FULL"
+    env = {**_BASE_ENV, "IMPORT_RESOLUTION_MODE": "FULL"}
     code, out = run_e2e("child_birth", "--no-llm-review", env=env)
-    assert code in (0, 1), f"FULL mode expected exit 0 or 1, got {code}\n{out[-2000:]}"
-    assert "::STEP::2:DC Import Tool" in out, "Expected Step 2 in output"
-    assert "::STEP::3:DC Import Validation" in out or "::STEP::4:Results" in out, (
+    assert code in (0, 1), f"FULL mode expected exit 0 or 1, got {code}\n{_tail(out, 2000)}"
+    assert b"::STEP::2:DC Import Tool" in out, "Expected Step 2 in output"
+    assert b"::STEP::3:DC Import Validation" in out or b"::STEP::4:Results" in out, (
         "Expected Step 3 or 4 (pipeline progressed)"
     )
 
 
-def main() -> int:
-    root = project_root()
-    os.chdir(root)
-    tests = [
-        ("child_birth PASS", test_child_birth_pass),
-        ("no API key skips LLM", test_no_api_key_skips_llm),
-        ("step protocol labels", test_step_protocol_labels),
-        ("deterministic mode (LOCAL, no existence counters)", test_deterministic_mode_no_existence_counters),
-        ("FULL mode smoke", test_full_mode_smoke),
-    ]
+# Tests sharing a dataset write the same output/<dataset>_genmcf/ directory, so they run
+# one after another; different datasets run concurrently (at most this many at a time).
+MAX_PARALLEL_DATASETS = 4
+
+
+def _run_group(tests: list[tuple[str, object]], print_lock: threading.Lock) -> list[tuple[str, AssertionError]]:
+    """Run one dataset's tests sequentially; print each result line as it finishes."""
     failed = []
     for name, fn in tests:
-        print(f"  Running: {name}...", end=" ", flush=True)
         start = time.perf_counter()
+        error = None
         try:
             fn()
-            elapsed = time.perf_counter() - start
-            print(f"OK ({elapsed:.1f}s)")
         except AssertionError as e:
-            elapsed = time.perf_counter() - start
-            print(f"FAIL ({elapsed:.1f}s)")
-            print(f"       {e}")
-            failed.append((name, e))
+            error = e
+        elapsed = time.perf_counter() - start
+        with print_lock:
+            if error is None:
+                print(f"  {name}: OK ({elapsed:.1f}s)", flush=True)
+            else:
+                print(f"  {name}: FAIL ({elapsed:.1f}s)")
+                print(f"       {error}", flush=True)
+                failed.append((name, error))
+    return failed
+
+
+def main() -> int:
+    root = project_root()
+    os.chdir(root)
+    # (dataset, name, test): dataset groups tests that share an output directory.
+    tests = [
+        ("child_birth", "child_birth PASS", test_child_birth_pass),
+        ("child_birth", "no API key skips LLM", test_no_api_key_skips_llm),
+        ("child_birth", "step protocol labels", test_step_protocol_labels),
+        ("child_birth", "deterministic mode (LOCAL, no existence counters)", test_deterministic_mode_no_existence_counters),
+        ("child_birth", "FULL mode smoke", test_full_mode_smoke),
+    ]
+    groups: dict[str, list[tuple[str, object]]] = {}
+    for dataset, name, fn in tests:
+        groups.setdefault(dataset, []).append((name, fn))
+    print(f"  Running {len(tests)} test(s) across {len(groups)} dataset(s)...", flush=True)
+    print_lock = threading.Lock()
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_DATASETS, len(groups))) as executor:
+        futures = [executor.submit(_run_group, group, print_lock) for group in groups.values()]
+        failed = [f for future in futures for f in future.result()]
     if failed:
         print(f"\n{len(failed)} test(s) failed")
         return 1
@@ -0,0 +1,125 @@
+"""Tests for the logging layer (ui/app_logging.py)."""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from ui import app_logging
+
+
+def _record(**extra) -> logging.LogRecord:
+    record = logging.LogRecord("t", logging.INFO, __file__, 1, "msg", None, None)
+    record.__dict__.update(extra)
+    return record
+
+
+class TestSessionFilter(unittest.TestCase):
+    def tearDown(self) -> None:
+        app_logging.clear_request_id()
+
+    def test_adds_session_and_request_id(self) -> None:
+        app_logging.set_request_id("req123")
+        record = _record()
+        self.assertTrue(app_logging.SessionFilter("sess").filter(record))
+        self.assertEqual(record.server_session_id, "sess")
+        self.assertEqual(record.request_id, "req123")
+
+    def test_request_id_empty_outside_request(self) -> None:
+        record = _record()
+        app_logging.SessionFilter("sess").filter(record)
+        self.assertEqual(record.request_id, "")
+
+    def test_keeps_fields_passed_via_extra(self) -> None:
+        app_logging.set_request_id("req123")
+        record = _record(request_id="run-7", server_session_id="other")
+        app_logging.SessionFilter("sess").filter(record)
+        self.assertEqual(record.request_id, "run-7")
+        self.assertEqual(record.server_session_id, "other")
+
+
+class TestConfigureLogging(unittest.TestCase):
+    def setUp(self) -> None:
+        root = logging.getLogger()
+        saved = (root.level, root.handlers[:])
+
+        def restore() -> None:
+            app_logging._stop_queue_listener()
+            root.setLevel(saved[0])
+            root.handlers[:] = saved[1]
+
+        self.addCleanup(restore)
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        env = patch.dict(os.environ, {"LOG_LEVEL": "INFO"})
+        env.start()
+        self.addCleanup(env.stop)
+        os.environ.pop("K_SERVICE", None)
+
+    def test_records_written_by_listener_with_caller_request_id(self) -> None:
+        app_root = Path(self._tmp.name)
+        with patch("sys.stdout"):
+            session = app_logging.configure_logging(app_root)
+            queue_handlers = [h for h in logging.getLogger().handlers if getattr(h, "dc_import_validator_marker", False)]
+            self.assertEqual([type(h) for h in queue_handlers], [logging.handlers.QueueHandler])
+
+            def log_in_request() -> None:
+                app_logging.set_request_id("req-thread")
+                logging.getLogger("t").info("hello %s", "world")
+
+            worker = threading.Thread(target=log_in_request)
+            worker.start()
+            worker.join()
+            app_logging._stop_queue_listener()  # flushes the queue
+
+        text = (app_root / "logs" / "dc_import_validator.log").read_text(encoding="utf-8")
+        self.assertIn(f"session={session} request_id=req-thread t: hello world", text)
+
+    def test_debug_goes_to_stdout_only(self) -> None:
+        app_root = Path(self._tmp.name)
+        with patch.dict(os.environ, {"LOG_LEVEL": "DEBUG"}), patch("sys.stdout") as stdout:
+            app_logging.configure_logging(app_root)
+            logging.getLogger("t").debug("detail")
+            logging.getLogger("t").info("summary")
+            app_logging._stop_queue_listener()
+        written = "".join(call.args[0] for call in stdout.write.call_args_list)
+        self.assertIn("t: detail", written)
+        text = (app_root / "logs" / "dc_import_validator.log").read_text(encoding="utf-8")
+        self.assertNotIn("detail", text)
+        self.assertIn("t: summary", text)
+
+    def test_cloud_run_stdout_has_no_asctime(self) -> None:
+        with patch.dict(os.environ, {"K_SERVICE": "svc"}), patch("sys.stdout") as stdout:
+            session = app_logging.configure_logging(Path(self._tmp.name))
+            logging.getLogger("t").info("hello")
+            app_logging._stop_queue_listener()
+        written = "".join(call.args[0] for call in stdout.write.call_args_list)
+        self.assertEqual(written, f"[INFO] session={session} request_id= t: hello\n")
+        self.assertFalse((Path(self._tmp.name) / "logs").exists())
+
+
+class TestBufferedFileHandler(unittest.TestCase):
+    def test_buffered_until_flush_thread_or_close(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "app.log"
+            handler = app_logging._BufferedTimedRotatingFileHandler(
+                path, when="midnight", encoding="utf-8", flush_interval=3600
+            )
+            handler.emit(_record())
+            self.assertEqual(path.read_text(encoding="utf-8"), "")
+            handler.close()
+            self.assertEqual(path.read_text(encoding="utf-8"), "msg\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
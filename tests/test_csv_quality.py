@@ -0,0 +1,58 @@
+"""Tests for scripts/csv_quality.py (primitives shared by the CSV quality checks).
+
+Run with:
+    python -m unittest tests.test_csv_quality
+"""
+
+from __future__ import annotations
+
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT / "scripts") not in sys.path:
+    sys.path.insert(0, str(ROOT / "scripts"))
+
+from csv_quality import duplicate_column_names, is_empty, is_numeric, row_fingerprint
+
+
+class TestCellChecks(unittest.TestCase):
+    def test_is_empty(self):
+        for cell in (None, "", "  ", "\t"):
+            self.assertTrue(is_empty(cell), repr(cell))
+        self.assertFalse(is_empty(" x "))
+
+    def test_is_numeric(self):
+        for cell in ("1", " 2.5 ", "1e3", "nan", "", "   ", None, "\x1c1"):
+            self.assertTrue(is_numeric(cell), repr(cell))
+        for cell in ("x", "1 2", "-"):
+            self.assertFalse(is_numeric(cell), repr(cell))
+
+
+class TestDuplicateColumnNames(unittest.TestCase):
+    def test_stripped_names_in_first_appearance_order(self):
+        self.assertEqual(duplicate_column_names(["b", "a ", " a", "b", "c"]), ["b", "a"])
+        self.assertEqual(duplicate_column_names(["a", "b"]), [])
+
+
+class TestRowFingerprint(unittest.TestCase):
+    def test_equal_after_strip(self):
+        self.assertEqual(row_fingerprint([" a", "b "], [0, 1]), row_fingerprint(["a", "b"], [0, 1]))
+
+    def test_only_selected_columns(self):
+        self.assertEqual(row_fingerprint(["a", "x"], [0]), row_fingerprint(["a", "y"], [0]))
+
+    def test_cell_boundaries_are_unambiguous(self):
+        self.assertNotEqual(
+            row_fingerprint(["a\x00b", "c"], [0, 1]), row_fingerprint(["a", "b\x00c"], [0, 1])
+        )
+        self.assertNotEqual(row_fingerprint(["a\x00", ""], [0, 1]), row_fingerprint(["a", "\x00"], [0, 1]))
+
+    def test_missing_cell_differs_from_empty(self):
+        self.assertNotEqual(row_fingerprint(["a", None], [0, 1]), row_fingerprint(["a", ""], [0, 1]))
+        self.assertEqual(row_fingerprint(["a", None], [0, 1]), row_fingerprint(["a ", None], [0, 1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
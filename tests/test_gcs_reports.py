@@ -0,0 +1,246 @@
+"""Tests for GCS report upload/serve helpers (ui/gcs_reports.py).
+
+GCS is never contacted: the bucket access check, storage.Client and transfer_manager
+are patched.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from ui import gcs_reports
+
+
+class TestDeferredUpload(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.out = Path(self._tmp.name)
+        env = patch.dict(os.environ, {"GCS_REPORTS_BUCKET": "bucket"})
+        env.start()
+        self.addCleanup(env.stop)
+        access = patch.object(gcs_reports, "_get_client_and_bucket", return_value=(None, None))
+        access.start()
+        self.addCleanup(access.stop)
+        self.addCleanup(self._tmp.cleanup)
+        gcs_reports._reset_client_cache()
+        self.addCleanup(gcs_reports._reset_client_cache)
+        client = patch("google.cloud.storage.Client")
+        self.bucket = bucket = client.start().return_value.bucket.return_value
+        bucket.list_blobs.return_value = []
+        bucket.blob.side_effect = lambda name: SimpleNamespace(name=name, content_type=None)
+        self.addCleanup(client.stop)
+
+    @staticmethod
+    def _uploaded(upload_many: MagicMock) -> dict[str, str]:
+        """{blob name: content type} across all upload_many calls."""
+        return {
+            blob.name: blob.content_type
+            for call in upload_many.call_args_list
+            for _src, blob in call.args[0]
+        }
+
+    def test_uploads_small_artifacts_and_mcf(self) -> None:
+        input_csv = self.out / "data.csv"
+        input_csv.write_text("a\n1\n")
+        (self.out / "report.json").write_text(
+            json.dumps({"commandArgs": {"inputFiles": ["x.tmcf", str(input_csv)]}})
+        )
+        (self.out / "validation_warnings_and_advisories.csv").write_text("w\n")
+        (self.out / "gc.log").write_text("gc\n")
+        for i in range(3):
+            (self.out / f"shard_{i}.mcf").write_text("Node: x\n")
+
+        with patch("google.cloud.storage.transfer_manager.upload_many") as upload_many:
+            n = gcs_reports.upload_deferred_artifacts_to_gcs(self.out, "run1", "ds")
+
+        self.assertEqual(n, 6)
+        for call in upload_many.call_args_list:
+            self.assertTrue(call.kwargs["raise_exception"])
+        self.assertEqual(
+            self._uploaded(upload_many),
+            {
+                "reports/run1/ds/validation_warnings_and_advisories.csv": "text/csv",
+                "reports/run1/ds/input.csv": "text/csv",
+                "reports/run1/ds/gc.log": "text/plain",
+                "reports/run1/ds/shard_0.mcf": "text/plain",
+                "reports/run1/ds/shard_1.mcf": "text/plain",
+                "reports/run1/ds/shard_2.mcf": "text/plain",
+            },
+        )
+
+    def test_critical_phase_picks_present_files(self) -> None:
+        (self.out / "validation_report.html").write_text("<html>")
+        (self.out / "report.json").write_text("{}")
+        (self.out / "differ_output").mkdir()
+        (self.out / "differ_output" / "obs_diff_summary.csv").write_text("a\n")
+        (self.out / "summary_report.html").mkdir()  # not a file: ignored
+        with patch("google.cloud.storage.transfer_manager.upload_many") as upload_many:
+            n = gcs_reports.upload_critical_reports_to_gcs(self.out, "run1", "ds")
+        self.assertEqual(n, 3)
+        self.assertEqual(
+            self._uploaded(upload_many),
+            {
+                "reports/run1/ds/validation_report.html": "text/html",
+                "reports/run1/ds/report.json": "application/json",
+                "reports/run1/ds/differ_output/obs_diff_summary.csv": "text/csv",
+            },
+        )
+
+    def test_skips_files_already_in_gcs(self) -> None:
+        same = self.out / "validation_warnings_and_advisories.csv"
+        same.write_bytes(b"w\n")
+        (self.out / "gc.log").write_bytes(b"gc\n")
+        md5 = base64.b64encode(hashlib.md5(b"w\n").digest()).decode()
+        self.bucket.list_blobs.return_value = [
+            SimpleNamespace(name="reports/run1/ds/validation_warnings_and_advisories.csv", size=2, md5_hash=md5),
+            SimpleNamespace(name="reports/run1/ds/gc.log", size=3, md5_hash=md5),  # same size, other bytes
+        ]
+        with patch("google.cloud.storage.transfer_manager.upload_many") as upload_many:
+            n = gcs_reports.upload_deferred_artifacts_to_gcs(self.out, "run1", "ds")
+        self.assertEqual(n, 2)
+        self.assertEqual(self._uploaded(upload_many), {"reports/run1/ds/gc.log": "text/plain"})
+        self.assertEqual(self.bucket.list_blobs.call_args.kwargs["prefix"], "reports/run1/ds/")
+
+    def test_upload_error_propagates(self) -> None:
+        (self.out / "validation_warnings_and_advisories.csv").write_text("w\n")
+        with patch("google.cloud.storage.transfer_manager.upload_many", side_effect=RuntimeError("boom")):
+            with self.assertRaises(RuntimeError):
+                gcs_reports.upload_deferred_artifacts_to_gcs(self.out, "run1", "ds")
+
+
+class TestClientCache(unittest.TestCase):
+    def setUp(self) -> None:
+        env = patch.dict(os.environ, {"GCS_REPORTS_BUCKET": "bucket"})
+        env.start()
+        self.addCleanup(env.stop)
+        gcs_reports._reset_client_cache()
+        self.addCleanup(gcs_reports._reset_client_cache)
+
+    def test_client_created_and_checked_once(self) -> None:
+        with patch("google.cloud.storage.Client") as client_cls:
+            first = gcs_reports._get_client_and_bucket()
+            second = gcs_reports._get_client_and_bucket()
+        self.assertIs(first, second)
+        client_cls.assert_called_once()
+        first[1].reload.assert_called_once()
+
+    def test_client_pool_sized_for_upload_workers(self) -> None:
+        from google.cloud import storage
+
+        with patch.object(storage, "Client", side_effect=storage.Client.create_anonymous_client):
+            client, _ = gcs_reports._get_bucket_handle()
+        adapter = client._http.get_adapter("https://storage.googleapis.com/")
+        self.assertEqual(adapter._pool_maxsize, gcs_reports._HTTP_POOL_SIZE)
+
+    def test_missing_library_raises_access_error(self) -> None:
+        with patch.object(gcs_reports, "storage", None):
+            with self.assertRaises(gcs_reports.GCSAccessError):
+                gcs_reports._get_client_and_bucket()
+
+    def test_access_failure_not_cached(self) -> None:
+        with patch("google.cloud.storage.Client") as client_cls:
+            client_cls.return_value.bucket.return_value.reload.side_effect = [RuntimeError("403"), None]
+            with self.assertRaises(gcs_reports.GCSAccessError):
+                gcs_reports._get_client_and_bucket()
+            _, bucket = gcs_reports._get_client_and_bucket()
+        self.assertIsNotNone(bucket)
+        client_cls.assert_called_once()
+        self.assertEqual(bucket.reload.call_count, 2)
+
+
+class TestReportReads(unittest.TestCase):
+    def setUp(self) -> None:
+        env = patch.dict(os.environ, {"GCS_REPORTS_BUCKET": "bucket"})
+        env.start()
+        self.addCleanup(env.stop)
+        gcs_reports._reset_client_cache()
+        self.addCleanup(gcs_reports._reset_client_cache)
+        client = patch("google.cloud.storage.Client")
+        self.bucket = client.start().return_value.bucket.return_value
+        self.addCleanup(client.stop)
+        gcs_reports._updated_cache.clear()
+        self.addCleanup(gcs_reports._updated_cache.clear)
+        gcs_reports._content_cache_clear()
+        self.addCleanup(gcs_reports._content_cache_clear)
+
+    def test_read_skips_access_check(self) -> None:
+        self.bucket.blob.return_value.download_as_bytes.return_value = b"<html>"
+        self.assertEqual(gcs_reports.get_report_from_gcs("run1", "ds", "validation_report.html"), b"<html>")
+        self.bucket.blob.assert_called_with("reports/run1/ds/validation_report.html")
+        self.bucket.reload.assert_not_called()
+
+    def test_report_content_cached_until_busted(self) -> None:
+        download = self.bucket.blob.return_value.download_as_bytes
+        download.return_value = b"[]"
+        for _ in range(3):
+            self.assertEqual(gcs_reports.get_report_from_gcs("run1", "ds", "validation_output.json"), b"[]")
+        download.assert_called_once()
+        gcs_reports.bust_report_cache("run1", "ds")
+        gcs_reports.get_report_from_gcs("run1", "ds", "validation_output.json")
+        self.assertEqual(download.call_count, 2)
+        self.assertEqual(gcs_reports._content_cache_bytes, 2)
+
+    def test_content_cache_bounded(self) -> None:
+        download = self.bucket.blob.return_value.download_as_bytes
+        download.return_value = b"x" * 10
+        with patch.object(gcs_reports, "_CONTENT_CACHE_MAX_BYTES", 25), patch.object(
+            gcs_reports, "_CONTENT_CACHE_MAX_OBJECT", 10
+        ):
+            for name in ("a.json", "b.json", "c.json"):
+                gcs_reports.get_report_from_gcs("run1", "ds", name)
+            self.assertEqual([k[3] for k in gcs_reports._content_cache], ["b.json", "c.json"])
+            download.return_value = b"x" * 11  # over the per-object limit: not cached
+            gcs_reports.get_report_from_gcs("run1", "ds", "big.csv")
+            gcs_reports.get_report_from_gcs("run1", "ds", "big.csv")
+        self.assertEqual(download.call_count, 5)
+        self.assertEqual(gcs_reports._content_cache_bytes, 20)
+
+    def test_missing_report_is_none(self) -> None:
+        from google.cloud.exceptions import NotFound
+
+        blob = self.bucket.blob.return_value
+        blob.download_as_bytes.side_effect = NotFound("no such object")
+        self.assertIsNone(gcs_reports.get_report_from_gcs("run1", "ds", "summary_report.html"))
+        blob.exists.assert_not_called()
+
+    def test_updated_timestamp_cached_until_busted(self) -> None:
+        from datetime import datetime, timezone
+
+        updated = datetime(2024, 1, 2, tzinfo=timezone.utc)
+        self.bucket.get_blob.return_value = SimpleNamespace(updated=updated)
+        for _ in range(3):
+            ts = gcs_reports.get_report_updated_from_gcs("run1", "ds", "validation_report.html")
+        self.assertEqual(ts, updated.timestamp())
+        self.bucket.get_blob.assert_called_once()
+        gcs_reports.bust_report_cache("run1", "ds")
+        gcs_reports.get_report_updated_from_gcs("run1", "ds", "validation_report.html")
+        self.assertEqual(self.bucket.get_blob.call_count, 2)
+
+    def test_updated_cache_evicts_oldest_when_full(self) -> None:
+        self.bucket.get_blob.return_value = None
+        with patch.object(gcs_reports, "_UPDATED_CACHE_MAX", 2):
+            for name in ("a.html", "b.html", "c.html"):
+                gcs_reports.get_report_updated_from_gcs("run1", "ds", name)
+        self.assertEqual([k[3] for k in gcs_reports._updated_cache], ["b.html", "c.html"])
+
+    def test_read_failure_raises_access_error(self) -> None:
+        self.bucket.get_blob.side_effect = RuntimeError("403 Forbidden")
+        with self.assertRaises(gcs_reports.GCSAccessError):
+            gcs_reports.get_report_updated_from_gcs("run1", "ds", "validation_report.html")
+
+
+if __name__ == "__main__":
+    unittest.main()
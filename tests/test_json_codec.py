@@ -0,0 +1,88 @@
+"""Tests for scripts/json_codec.py (orjson fast path and stdlib fallback).
+
+Run with:
+    python -m unittest tests.test_json_codec
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT / "scripts") not in sys.path:
+    sys.path.insert(0, str(ROOT / "scripts"))
+
+import json_codec
+
+
+_SAMPLE = {"rules": [{"rule_id": "check_min_value", "params": {"minimum": 0}}], "note": "… and 2 more"}
+
+
+class _CodecCases:
+    def test_round_trip(self):
+        self.assertEqual(json_codec.loads(json_codec.dumps(_SAMPLE)), _SAMPLE)
+
+    def test_loads_accepts_bytes_and_memoryview(self):
+        raw = json.dumps(_SAMPLE).encode("utf-8")
+        self.assertEqual(json_codec.loads(raw), _SAMPLE)
+        self.assertEqual(json_codec.loads(memoryview(raw)), _SAMPLE)
+
+    def test_indent_is_two_spaces(self):
+        self.assertIn('\n  "rules": [', json_codec.dumps(_SAMPLE, indent=True))
+
+    def test_default_handles_unknown_types(self):
+        self.assertEqual(json_codec.loads(json_codec.dumps({"d": date(2024, 1, 2)}, default=str)), {"d": "2024-01-02"})
+
+    def test_non_string_keys_are_stringified(self):
+        self.assertEqual(json_codec.loads(json_codec.dumps({1: "a"})), {"1": "a"})
+
+    def test_loads_accepts_nan_and_infinity(self):
+        raw = json.dumps([{"details": {"pct": float("inf"), "low": float("-inf"), "x": float("nan")}}]).encode()
+        details = json_codec.loads(raw)[0]["details"]
+        self.assertEqual((details["pct"], details["low"]), (float("inf"), float("-inf")))
+        self.assertNotEqual(details["x"], details["x"])  # NaN
+
+    def test_decode_error_is_json_decode_error(self):
+        with self.assertRaises(json.JSONDecodeError):
+            json_codec.loads("not json")
+
+    def test_dump_path_replaces_file_and_leaves_no_temp(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "out.json"
+            path.write_text("old")
+            json_codec.dump_path(_SAMPLE, path, indent=True)
+            self.assertEqual(json.loads(path.read_text(encoding="utf-8")), _SAMPLE)
+            self.assertEqual(os.listdir(td), ["out.json"])
+
+    def test_dump_path_failure_keeps_previous_file(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "out.json"
+            path.write_text("old")
+            with patch.object(json_codec.os, "replace", side_effect=OSError("disk full")):
+                with self.assertRaises(OSError):
+                    json_codec.dump_path(_SAMPLE, path)
+            self.assertEqual(path.read_text(), "old")
+            self.assertEqual(os.listdir(td), ["out.json"])
+
+
+@unittest.skipIf(json_codec.orjson is None, "orjson not installed")
+class TestOrjsonPath(_CodecCases, unittest.TestCase):
+    pass
+
+
+class TestStdlibFallback(_CodecCases, unittest.TestCase):
+    def setUp(self):
+        patcher = patch.object(json_codec, "orjson", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+if __name__ == "__main__":
+    unittest.main()
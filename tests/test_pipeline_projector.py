@@ -87,6 +87,7 @@ class TestProgressProjectorLegacyMarkers(unittest.TestCase):
     def test_unknown_line_not_handled(self) -> None:
         p = ProgressProjector(registry=self.registry)
         self.assertFalse(p.feed_line("[INFO] hello").handled)
+        self.assertFalse(p.feed_line('{"v": 1, "step_id": "import_tool"}').handled)
 
     def test_full_legacy_marker_sequence(self) -> None:
         p = ProgressProjector(registry=self.registry, run_id="run-abc", dataset="custom")
@@ -0,0 +1,94 @@
+"""Tests for the combined review summary builders (ui/services/review_summary.py)."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from ui.services import review_summary
+from ui.services.review_summary import (
+    build_review_summary,
+    build_review_summary_from_data,
+    review_summary_to_markdown,
+)
+
+RESULTS = [
+    {"validation_name": "r1", "status": "PASSED"},
+    {"validation_name": "r2", "status": "WARNING"},
+    {"validation_name": "r3", "status": "WARNING"},
+    {"validation_name": "r4", "status": "FAILED"},
+    {"validation_name": "r5", "status": "SKIPPED"},
+]
+
+
+class TestBuildReviewSummaryFromData(unittest.TestCase):
+    def test_status_counts_and_overall(self) -> None:
+        data = build_review_summary_from_data("child_birth", RESULTS, [], None)
+        self.assertEqual(
+            {k: data["summary"][k] for k in ("blockers", "warnings", "passed")},
+            {"blockers": 1, "warnings": 2, "passed": 1},
+        )
+        self.assertEqual(data["overall"], "FAIL")
+        data = build_review_summary_from_data("child_birth", RESULTS[:3], [], None)
+        self.assertEqual(data["overall"], "PASS (with 2 warnings)")
+        data = build_review_summary_from_data("child_birth", "not a list", [], None)
+        self.assertEqual((data["overall"], data["validation_result"]), ("PASS", []))
+
+
+
+class TestBuildReviewSummaryCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.out = Path(self._tmp.name)
+        review_summary._SUMMARY_CACHE.clear()
+        self.addCleanup(review_summary._SUMMARY_CACHE.clear)
+
+    def _write(self, name: str, obj) -> None:
+        path = self.out / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(obj))
+        # Distinct mtimes even on coarse-grained filesystems.
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    def test_reused_until_a_source_changes(self) -> None:
+        self.assertIsNone(build_review_summary("child_birth", self.out))
+        self._write("validation_output.json", RESULTS)
+        first = build_review_summary("child_birth", self.out)
+        self.assertIs(build_review_summary("child_birth", self.out), first)
+        self._write("schema_review.json", [{"type": "typo"}])
+        second = build_review_summary("child_birth", self.out)
+        self.assertIsNot(second, first)
+        self.assertEqual(second["summary"]["ai_review_issues"], 1)
+        self._write("differ_output/differ_summary.json", {"previous_obs_size": 10})
+        self.assertEqual(build_review_summary("child_birth", self.out)["differ_stats"], {"previous_obs_size": 10})
+
+
+class TestReviewSummaryMarkdown(unittest.TestCase):
+    def test_sections(self) -> None:
+        data = build_review_summary_from_data(
+            "child_birth",
+            [{"validation_name": "r1", "status": "FAILED", "message": "x" * 100}],
+            [{"severity": "warning", "type": "typo", "message": "Spelling"}],
+            None,
+        )
+        data["rule_failure_samples"][0]["message"] = None
+        md = review_summary_to_markdown(data)
+        self.assertTrue(md.startswith("# Review Summary\n\n**Dataset:** child_birth\n**Overall:** FAIL\n"))
+        self.assertIn("\n- [FAILED] r1: " + "x" * 80 + "\n", md)
+        self.assertIn("\n- [warning] typo: Spelling\n", md)
+        self.assertIn("\n- No significant fluctuations.\n", md)
+        self.assertTrue(md.endswith("## Blocking Rule Failures\n\n- r1: "))
+
+
+if __name__ == "__main__":
+    unittest.main()
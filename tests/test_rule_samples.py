@@ -0,0 +1,128 @@
+"""Tests for rule failure sample enrichment (ui/services/rule_samples.py)."""
+
+from __future__ import annotations
+
+import copy
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from ui.services import rule_samples
+from ui.services.rule_samples import (
+    enrich_rule_failure_samples,
+    enrich_rule_failure_samples_from_bytes,
+    get_csv_path,
+)
+
+CSV_BYTES = (
+    "variableMeasured,observationAbout,observationDate,value\r\n"
+    "Count_Person,geoId/06,2020,5\r\n"
+    "dcid:Count_Birth,geoId/01,2021,-3\r\n"
+).encode()
+RESULTS = [{"validation_name": "check_min_value", "status": "FAILED", "validation_params": {"minimum": 0}}]
+SAMPLES = [
+    {"statVar": "Count_Birth", "rule": "check_min_value"},
+    {"statVar": "Count_Person", "rule": "check_other"},
+    {"statVar": "Count_Missing", "rule": "check_other"},
+]
+
+
+class TestEnrichRuleFailureSamples(unittest.TestCase):
+    def test_bytes_match_file_enrichment(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            out = Path(tmp)
+            (out / "input.csv").write_bytes(CSV_BYTES)
+            (out / "report.json").write_text(
+                json.dumps({"commandArgs": {"inputFiles": [str(out / "input.csv")]}})
+            )
+            from_file = copy.deepcopy(SAMPLES)
+            enrich_rule_failure_samples(from_file, out, RESULTS)
+        from_bytes = copy.deepcopy(SAMPLES)
+        enrich_rule_failure_samples_from_bytes(from_bytes, CSV_BYTES, RESULTS)
+        self.assertEqual(from_bytes, from_file)
+        self.assertEqual(
+            from_bytes[0],
+            {
+                "statVar": "Count_Birth",
+                "rule": "check_min_value",
+                "location": "geoId/01",
+                "date": "2021",
+                "sourceRow": "input.csv:3",
+            },
+        )
+        self.assertEqual(from_bytes[1]["sourceRow"], "input.csv:2")
+        self.assertNotIn("sourceRow", from_bytes[2])
+
+    def test_csv_path_from_parsed_report(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            out = Path(tmp)
+            csv_path = out / "input.csv"
+            csv_path.write_bytes(CSV_BYTES)
+            # No report.json on disk: the caller's parsed copy is used as-is.
+            report = {"commandArgs": {"inputFiles": [str(out / "input.tmcf"), str(csv_path)]}}
+            self.assertEqual(get_csv_path(out, report), csv_path)
+            self.assertIsNone(get_csv_path(out))
+            self.assertIsNone(get_csv_path(out, []))
+
+    def test_samples_sharing_a_stat_var(self) -> None:
+        csv_bytes = (
+            "variableMeasured,observationAbout,observationDate,value\n"
+            "dcid:ns/Count_Birth,geoId/01,2020,4\n"
+            "dcid:ns/Count_Birth,geoId/02,2021,-1\n"
+        ).encode()
+        samples = [
+            {"statVar": "Count_Birth", "rule": "check_min_value"},
+            {"statVar": " ns/Count_Birth ", "rule": "check_other"},
+            {"statVar": "Birth", "rule": "check_other"},
+            {"statVar": "ns/Count_Birth", "rule": "check_min_value"},
+        ]
+        enrich_rule_failure_samples_from_bytes(samples, csv_bytes, RESULTS)
+        self.assertEqual(
+            [s.get("sourceRow") for s in samples], ["input.csv:3", "input.csv:2", None, "input.csv:3"]
+        )
+
+    def test_unit_consistency_expanded_from_summary_report(self) -> None:
+        rule_samples._read_summary_statvar_units.cache_clear()
+        with tempfile.TemporaryDirectory() as tmp:
+            out = Path(tmp)
+            (out / "input.csv").write_bytes(CSV_BYTES)
+            report = {"commandArgs": {"inputFiles": [str(out / "input.csv")]}}
+            (out / "summary_report.csv").write_text("StatVar,Units\nCount_A,Person\nCount_B,\n")
+            unit = {"statVar": None, "rule": "check_unit_consistency", "message": "m"}
+            samples = [dict(unit), dict(unit)]
+            enrich_rule_failure_samples(samples, out, RESULTS, report)
+        self.assertEqual([(s["statVar"], s["value"]) for s in samples], [("Count_A", "Person"), ("Count_B", "(missing)")] * 2)
+        self.assertEqual(rule_samples._read_summary_statvar_units.cache_info().misses, 1)
+
+    def test_repeat_enrichment_reuses_scan(self) -> None:
+        rule_samples._scan_csv_file.cache_clear()
+        with tempfile.TemporaryDirectory() as tmp:
+            out = Path(tmp)
+            csv_path = out / "input.csv"
+            csv_path.write_bytes(CSV_BYTES)
+            (out / "report.json").write_text(json.dumps({"commandArgs": {"inputFiles": [str(csv_path)]}}))
+            first, second = copy.deepcopy(SAMPLES), copy.deepcopy(SAMPLES)
+            enrich_rule_failure_samples(first, out, RESULTS)
+            enrich_rule_failure_samples(second, out, RESULTS)
+            self.assertEqual(first, second)
+            self.assertEqual(rule_samples._scan_csv_file.cache_info().hits, 1)
+            # A rewritten CSV (new size) is scanned again.
+            csv_path.write_bytes(CSV_BYTES.replace(b"geoId/01", b"geoId/001"))
+            third = copy.deepcopy(SAMPLES)
+            enrich_rule_failure_samples(third, out, RESULTS)
+            self.assertEqual(third[0]["location"], "geoId/001")
+
+    def test_undecodable_bytes_leave_samples_unchanged(self) -> None:
+        samples = copy.deepcopy(SAMPLES)
+        enrich_rule_failure_samples_from_bytes(samples, b"variableMeasured\n\xff\xfe\n", RESULTS)
+        self.assertEqual(samples, SAMPLES)
+
+
+if __name__ == "__main__":
+    unittest.main()
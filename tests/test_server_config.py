@@ -0,0 +1,125 @@
+"""Tests for the validation-config helpers in ui/server.py."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from ui import server
+
+BASE_CONFIG = {
+    "schema_version": "1.0",
+    "rules": [
+        {"rule_id": "rule_a", "validator": "MIN_VALUE_CHECK", "params": {"minimum": 0}},
+        {"rule_id": "rule_b", "validator": "NUM_OBSERVATIONS_CHECK", "params": {"minimum": 1}},
+    ],
+}
+
+
+class TestBaseConfigCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.config_dir = Path(self._tmp.name)
+        self.config_file = self.config_dir / "new_import_config.json"
+        self.config_file.write_text(json.dumps(BASE_CONFIG), encoding="utf-8")
+        self.cache_dir = self.config_dir / ".cfg_cache"
+        for target, value in (("CONFIG_DIR", self.config_dir), ("_CFG_CACHE_DIR", self.cache_dir)):
+            p = patch.object(server, target, value)
+            p.start()
+            self.addCleanup(p.stop)
+        server._load_config_file.cache_clear()
+        self.addCleanup(server._load_config_file.cache_clear)
+
+    def _read(self, path: Path) -> dict:
+        self.addCleanup(path.unlink, missing_ok=True)
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def test_base_config_parsed_once(self) -> None:
+        for _ in range(3):
+            server._create_filtered_config("child_birth", ["rule_a"])
+        self.assertEqual(server._load_config_file.cache_info().misses, 1)
+
+    def test_merged_config_file_shared_by_content(self) -> None:
+        first = server._create_filtered_config("child_birth", ["rule_a"])
+        self.assertEqual(first.parent, self.cache_dir)
+        self.assertEqual(server._create_merged_config("child_birth", ["rule_a"], []), first)
+        self.assertNotEqual(server._create_filtered_config("child_birth", ["rule_b"]), first)
+        self.assertEqual(sorted(p.suffix for p in self.cache_dir.iterdir()), [".json", ".json"])
+        # Shared files survive run cleanup; per-run files are deleted.
+        self.assertIsNone(server._ephemeral_config(first))
+        server._discard_config(first)
+        self.assertTrue(first.exists())
+        goldens = server._inject_goldens_into_config(first, ["g.csv"], "child_birth")
+        self.assertEqual(server._ephemeral_config(goldens), goldens)
+        server._discard_config(goldens)
+        self.assertFalse(goldens.exists())
+
+    def test_custom_rules_config_is_per_run(self) -> None:
+        custom = [{"rule_id": "sql_1", "validator": "SQL_VALIDATOR", "params": {"query": "SELECT 1"}}]
+        path = server._create_merged_config("child_birth", ["rule_a"], custom)
+        self.assertNotEqual(path.parent, self.cache_dir)
+        self.assertEqual(server._ephemeral_config(path), path)
+        server._discard_config(path)
+        self.assertFalse(path.exists())
+        self.assertFalse(self.cache_dir.exists())
+
+    def test_edited_config_is_reloaded(self) -> None:
+        self.assertEqual(len(server._dataset_base_config("child_birth")["rules"]), 2)
+        edited = {**BASE_CONFIG, "rules": BASE_CONFIG["rules"][:1]}
+        self.config_file.write_text(json.dumps(edited), encoding="utf-8")
+        st = self.config_file.stat()
+        os.utime(self.config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        self.assertEqual(len(server._dataset_base_config("child_birth")["rules"]), 1)
+
+    def test_callers_do_not_mutate_cached_config(self) -> None:
+        merged = self._read(server._create_filtered_config("child_birth", ["rule_b"]))
+        self.assertEqual([r["rule_id"] for r in merged["rules"]], ["rule_b"])
+        goldens = self._read(server._inject_goldens_into_config(None, ["g.csv"], "child_birth"))
+        self.assertEqual(
+            [r["rule_id"] for r in goldens["rules"]], ["rule_a", "rule_b", "check_uploaded_golden_files"]
+        )
+        self.assertEqual(server._dataset_base_config("child_birth"), BASE_CONFIG)
+
+    def test_missing_config_file(self) -> None:
+        self.config_file.unlink()
+        self.assertIsNone(server._create_filtered_config("child_birth", ["rule_a"]))
+
+
+class TestConfigEndpoints(unittest.TestCase):
+    def setUp(self) -> None:
+        from fastapi.testclient import TestClient
+
+        self.client = TestClient(server.app)
+
+    def test_datasets_listed(self) -> None:
+        resp = self.client.get("/api/datasets")
+        self.assertEqual(resp.status_code, 200)
+        self.assertIn("child_birth", [d["id"] for d in resp.json()["datasets"]])
+
+    def test_config_not_modified_when_etag_matches(self) -> None:
+        resp = self.client.get("/api/config/child_birth")
+        self.assertEqual(resp.status_code, 200)
+        self.assertIn("rules", resp.json())
+        etag = resp.headers["etag"]
+        resp = self.client.get("/api/config/child_birth", headers={"If-None-Match": etag})
+        self.assertEqual(resp.status_code, 304)
+        self.assertEqual(resp.content, b"")
+        resp = self.client.get("/api/config/child_birth", headers={"If-None-Match": 'W/"0"'})
+        self.assertEqual(resp.status_code, 200)
+
+    def test_unknown_dataset(self) -> None:
+        self.assertEqual(self.client.get("/api/config/nope").status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
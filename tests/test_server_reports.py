@@ -0,0 +1,272 @@
+"""Tests for the report read endpoints in ui/server.py (local output, no GCS)."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from fastapi.testclient import TestClient
+
+from ui import server
+
+
+class _LocalOutputTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.output_dir = Path(self._tmp.name)
+        self.canonical = self.output_dir / "child_birth_genmcf"
+        self.canonical.mkdir()
+        self.per_run = self.output_dir / "child_birth" / "run1"
+        self.per_run.mkdir(parents=True)
+        env = patch.dict(os.environ, {"GCS_REPORTS_BUCKET": ""})
+        env.start()
+        self.addCleanup(env.stop)
+        for target, value in (
+            ("OUTPUT_DIR", self.output_dir),
+            ("DATASET_OUTPUT_MAP", {"child_birth": self.canonical}),
+        ):
+            p = patch.object(server, target, value)
+            p.start()
+            self.addCleanup(p.stop)
+        server._local_artifact_cache_clear()
+        self.addCleanup(server._local_artifact_cache_clear)
+        self.client = TestClient(server.app)
+
+
+class TestReportInfo(_LocalOutputTestCase):
+    def _info(self) -> dict:
+        return self.client.get("/api/report-info/child_birth", params={"run_id": "run1"}).json()
+
+    def test_per_run_files_in_order(self) -> None:
+        review = self.per_run / "schema_review.json"
+        review.write_text("[]")
+        os.utime(review, (100, 100))
+        self.assertEqual(self._info(), {"exists": True, "mtime": 100})
+        report = self.per_run / "validation_report.html"
+        report.write_text("<html>")
+        os.utime(report, (200, 200))
+        self.assertEqual(self._info(), {"exists": True, "mtime": 200})
+
+    def test_falls_back_to_canonical(self) -> None:
+        self.assertEqual(self._info(), {"exists": False})
+        report = self.canonical / "validation_report.html"
+        report.write_text("<html>")
+        os.utime(report, (300, 300))
+        self.assertEqual(self._info(), {"exists": True, "mtime": 300})
+
+    def test_not_modified_until_report_changes(self) -> None:
+        report = self.per_run / "validation_report.html"
+        report.write_text("<html>")
+        os.utime(report, (100, 100))
+        url, params = "/api/report-info/child_birth", {"run_id": "run1"}
+        etag = self.client.get(url, params=params).headers["etag"]
+        resp = self.client.get(url, params=params, headers={"If-None-Match": etag})
+        self.assertEqual((resp.status_code, resp.content), (304, b""))
+        os.utime(report, (200, 200))
+        resp = self.client.get(url, params=params, headers={"If-None-Match": etag})
+        self.assertEqual(resp.json(), {"exists": True, "mtime": 200})
+
+    def test_unsafe_run_id(self) -> None:
+        resp = self.client.get("/api/report-info/child_birth", params={"run_id": "../x"})
+        self.assertEqual(resp.json(), {"exists": False})
+
+    def test_run_id_allowlist(self) -> None:
+        for ok in ("run1", "r0123456789ab", "bulk0123456789ab", "a_b-C", "x" * 64):
+            self.assertTrue(server._run_id_safe(ok), ok)
+        for bad in (None, "", "..", "a/b", "a\\b", "a\x00", "a.b", "x" * 65, "run1\n"):
+            self.assertFalse(server._run_id_safe(bad), bad)
+
+
+class TestResolveArtifact(_LocalOutputTestCase):
+    def test_local_reads_shared_until_file_changes(self) -> None:
+        path = self.per_run / "validation_output.json"
+        path.write_bytes(b"[1]")
+        with patch.object(Path, "read_bytes", autospec=True, side_effect=Path.read_bytes) as read:
+            for _ in range(3):
+                self.assertEqual(server._resolve_artifact("child_birth", "run1", "validation_output.json"), b"[1]")
+        self.assertEqual(read.call_count, 1)
+        path.write_bytes(b"[1, 2]")
+        self.assertEqual(server._resolve_artifact("child_birth", "run1", "validation_output.json"), b"[1, 2]")
+        self.assertEqual(len(server._local_artifact_cache), 1)
+
+    def test_local_cache_bounded_by_bytes(self) -> None:
+        for name in ("report.json", "schema_review.json", "validation_output.json"):
+            (self.per_run / name).write_bytes(b"x" * 10)
+        with patch.object(server, "_LOCAL_ARTIFACT_CACHE_MAX_BYTES", 25):
+            for name in ("report.json", "schema_review.json", "validation_output.json"):
+                server._resolve_artifact("child_birth", "run1", name)
+        self.assertEqual(
+            [Path(k).name for k in server._local_artifact_cache], ["schema_review.json", "validation_output.json"]
+        )
+        self.assertEqual(server._local_artifact_cache_bytes, 20)
+
+    def test_canonical_fallback(self) -> None:
+        (self.canonical / "report.json").write_bytes(b"{}")
+        self.assertEqual(server._resolve_artifact("child_birth", "run1", "report.json"), b"{}")
+        self.assertIsNone(server._resolve_artifact("child_birth", "run1", "schema_review.json"))
+        self.assertIsNone(server._resolve_artifact("child_birth", None, "report.json"))
+
+
+class TestValidationResult(_LocalOutputTestCase):
+    def _result(self, raw: bytes) -> dict:
+        (self.per_run / "validation_output.json").write_bytes(raw)
+        resp = self.client.get("/api/validation-result/child_birth", params={"run_id": "run1"})
+        self.assertEqual(resp.status_code, 200)
+        return resp.json()
+
+    def test_array_passed_through(self) -> None:
+        rows = [{"validation_name": "r1", "status": "FAILED", "message": "caf\u00e9"}]
+        raw = json.dumps(rows, indent=2).encode() + b"\n"
+        self.assertEqual(self._result(raw), {"exists": True, "results": rows})
+
+    def test_not_modified_when_etag_matches(self) -> None:
+        self._result(b"[]")
+        url, params = "/api/validation-result/child_birth", {"run_id": "run1"}
+        etag = self.client.get(url, params=params).headers["etag"]
+        resp = self.client.get(url, params=params, headers={"If-None-Match": etag})
+        self.assertEqual(resp.status_code, 304)
+        self.assertEqual(self._result(b"[1]"), {"exists": True, "results": [1]})
+
+    def test_malformed_output_is_empty(self) -> None:
+        for raw in (b'[{"validation_name": ', b'{"a": 1}', b"\xff"):
+            self.assertEqual(self._result(raw), {"exists": True, "results": []})
+
+    def test_missing_output(self) -> None:
+        resp = self.client.get("/api/validation-result/child_birth", params={"run_id": "run1"})
+        self.assertEqual(resp.json(), {"exists": False, "results": []})
+
+
+class TestLlmReport(_LocalOutputTestCase):
+    def _report(self, issues) -> dict:
+        (self.per_run / "schema_review.json").write_text(json.dumps(issues))
+        return self.client.get("/api/llm-report/child_birth", params={"run_id": "run1"}).json()
+
+    def test_blocker_classification(self) -> None:
+        issues = [
+            {"type": "typo"},  # blocker by type
+            {"type": "typo", "severity": "warning"},
+            {"type": "info", "severity": "blocker"},  # info never blocks
+            {"type": "style", "severity": "blocker"},
+            {"type": "style"},
+        ]
+        data = self._report(issues)
+        self.assertEqual((data["passed"], data["ai_advisory_count"]), (False, 3))
+        data = self._report(issues[1:3] + issues[4:])
+        self.assertEqual((data["passed"], data["ai_advisory_count"]), (True, 3))
+
+    def test_single_issue_object(self) -> None:
+        data = self._report({"type": "schema"})
+        self.assertEqual(data["issues"], [{"type": "schema"}])
+        self.assertFalse(data["passed"])
+
+
+class TestReviewSummary(_LocalOutputTestCase):
+    def test_gcs_artifacts_fetched_together(self) -> None:
+        blobs = {"validation_output.json": b'[{"validation_name": "r1", "status": "FAILED"}]'}
+        with patch.object(
+            server.gcs_reports, "get_report_from_gcs", side_effect=lambda _r, _d, name: blobs.get(name)
+        ) as get_report, patch.object(server._gcs_baselines, "list_baseline_versions", return_value=[]):
+            resp = self.client.get("/api/review-summary/child_birth", params={"run_id": "run1"})
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(
+            sorted(c.args[2] for c in get_report.call_args_list),
+            ["report.json", "schema_review.json", "validation_output.json"],
+        )
+
+    def test_not_modified_when_summary_unchanged(self) -> None:
+        (self.per_run / "validation_output.json").write_text('[{"validation_name": "r1", "status": "PASSED"}]')
+        url, params = "/api/review-summary/child_birth", {"run_id": "run1"}
+        resp = self.client.get(url, params=params)
+        self.assertEqual(resp.json()["overall"], "PASS")
+        etag = resp.headers["etag"]
+        resp = self.client.get(url, params=params, headers={"If-None-Match": etag})
+        self.assertEqual((resp.status_code, resp.content), (304, b""))
+        md = self.client.get(url, params={**params, "format": "md"}, headers={"If-None-Match": etag})
+        self.assertEqual(md.status_code, 200)
+        self.assertTrue(md.text.startswith("# Review Summary"))
+        self.assertNotEqual(md.headers["etag"], etag)
+
+    def test_local_fallback_and_missing(self) -> None:
+        resp = self.client.get("/api/review-summary/child_birth", params={"run_id": "run1"})
+        self.assertEqual(resp.status_code, 404)
+        (self.per_run / "validation_output.json").write_text("[]")
+        resp = self.client.get("/api/review-summary/child_birth", params={"run_id": "run1"})
+        self.assertEqual(resp.status_code, 200)
+
+
+
+class TestRuleFailureSamples(_LocalOutputTestCase):
+    def _samples(self, results: list) -> tuple[list, list]:
+        blobs = {"validation_output.json": json.dumps(results).encode(), "input.csv": b"variableMeasured\nCount_X\n"}
+        with patch.object(server, "is_gcs_configured", return_value=True), patch.object(
+            server.gcs_reports, "get_report_from_gcs", side_effect=lambda _r, _d, name: blobs.get(name)
+        ) as get_report:
+            resp = self.client.get("/api/rule-failure-samples/child_birth", params={"run_id": "run1"})
+        return resp.json()["samples"], [c.args[2] for c in get_report.call_args_list]
+
+    def test_csv_fetched_only_when_samples_can_match(self) -> None:
+        samples, fetched = self._samples([{"validation_name": "check_structural_lint_error_count", "status": "FAILED"}])
+        self.assertEqual(fetched, ["validation_output.json"])
+        self.assertEqual(len(samples), 1)
+        samples, fetched = self._samples(
+            [{"validation_name": "r", "status": "FAILED", "details": {"failing_rows": [{"StatVar": "Count_X"}]}}]
+        )
+        self.assertEqual(fetched, ["validation_output.json", "input.csv"])
+        self.assertEqual(samples[0]["sourceRow"], "input.csv:2")
+
+
+class TestHtmlReports(_LocalOutputTestCase):
+    def test_conditional_get(self) -> None:
+        report = self.canonical / "validation_report.html"
+        report.write_text("<html>report</html>")
+        os.utime(report, (100, 100))
+        resp = self.client.get("/report/child_birth")
+        self.assertEqual((resp.status_code, resp.text), (200, "<html>report</html>"))
+        self.assertEqual(resp.headers["cache-control"], "no-cache")
+        last_modified, etag = resp.headers["last-modified"], resp.headers["etag"]
+        for headers in ({"If-None-Match": etag}, {"If-Modified-Since": last_modified}):
+            resp = self.client.get("/report/child_birth", headers=headers)
+            self.assertEqual((resp.status_code, resp.content), (304, b""))
+        # If-None-Match wins over a matching If-Modified-Since (same-second rewrites).
+        resp = self.client.get(
+            "/report/child_birth", headers={"If-None-Match": 'W/"0-0"', "If-Modified-Since": last_modified}
+        )
+        self.assertEqual(resp.status_code, 200)
+
+    def test_per_run_report_link_rewritten(self) -> None:
+        report = self.per_run / "validation_report.html"
+        report.write_bytes(b'<a href="/summary-report/child_birth">full</a>')
+        resp = self.client.get("/report/child_birth/run1")
+        self.assertEqual(resp.text, '<a href="/summary-report/child_birth/run1">full</a>')
+        report.write_bytes(b"<html>no link</html>")
+        self.assertEqual(self.client.get("/report/child_birth/run1").text, "<html>no link</html>")
+        report.write_bytes(b"")
+        self.assertEqual(self.client.get("/report/child_birth/run1").status_code, 200)
+        report.unlink()
+        self.assertEqual(self.client.get("/report/child_birth/run1").status_code, 404)
+
+    def test_per_run_summary_report(self) -> None:
+        self.assertEqual(self.client.get("/summary-report/child_birth/run1").status_code, 404)
+        (self.per_run / "summary_report.html").write_text("<html>run summary</html>")
+        self.assertEqual(self.client.get("/summary-report/child_birth/run1").text, "<html>run summary</html>")
+        self.assertEqual(self.client.get("/summary-report/child_birth/a.b").status_code, 400)
+
+    def test_missing_summary_report(self) -> None:
+        resp = self.client.get("/summary-report/child_birth")
+        self.assertEqual(resp.status_code, 404)
+        (self.canonical / "summary_report.html").write_text("<html>summary</html>")
+        self.assertEqual(self.client.get("/summary-report/child_birth").text, "<html>summary</html>")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+"""Tests for custom-run request handling (form parsing, upload staging) in ui/server.py."""
+
+from __future__ import annotations
+
+import io
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from fastapi import HTTPException, UploadFile
+
+from ui import server
+
+
+class TestStreamUploadToFile(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.dest = Path(self._tmp.name) / "out.tmcf"
+
+    async def test_copies_upload(self) -> None:
+        upload = UploadFile(io.BytesIO(b"Node: E:t->E0\n"), filename="a.tmcf")
+        await server._stream_upload_to_file(upload, self.dest, 1024, "too big")
+        self.assertEqual(self.dest.read_bytes(), b"Node: E:t->E0\n")
+
+    async def test_rejects_oversized_upload(self) -> None:
+        upload = UploadFile(io.BytesIO(b"x" * 11), filename="a.tmcf")
+        with self.assertRaises(HTTPException) as ctx:
+            await server._stream_upload_to_file(upload, self.dest, 10, "too big")
+        self.assertEqual((ctx.exception.status_code, ctx.exception.detail), (400, "too big"))
+
+
+class TestParseCustomRulesJson(unittest.TestCase):
+    def test_empty_field(self) -> None:
+        self.assertEqual(server._parse_custom_rules_json(None), [])
+        self.assertEqual(server._parse_custom_rules_json(""), [])
+
+    def test_invalid_field_is_400(self) -> None:
+        for raw, detail in (
+            ("{", "custom_rules_json is not valid JSON"),
+            ('{"a": 1}', "custom_rules_json must be a JSON array"),
+        ):
+            with self.assertRaises(HTTPException) as ctx:
+                server._parse_custom_rules_json(raw)
+            self.assertEqual((ctx.exception.status_code, ctx.exception.detail), (400, detail))
+
+
+class TestUploadSizeLimit(unittest.TestCase):
+    def test_oversized_body_rejected_before_parsing(self) -> None:
+        from fastapi.testclient import TestClient
+
+        client = TestClient(server.app)
+        with patch.object(server, "MAX_UPLOAD_BYTES", 10):
+            resp = client.post("/api/run/custom", files={"tmcf": ("a.tmcf", b"x" * 100)})
+        self.assertEqual(resp.status_code, 413)
+        self.assertIn("Upload too large", resp.json()["detail"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,6 +5,7 @@ Covers:
   - _validate_custom_rules: rule_id required, early rejection
   - _create_merged_config: template-valid output, description defaults, built-in rules unchanged
   - run_validation._run_dc_runner partial results: synthetic FAILED injection for missing rules
+  - run_validation._run_dc_runner_in_process: runner output kept out of the streamed log
 
 Run with:
     python tests/test_validation_pipeline.py
@@ -305,6 +306,73 @@ class TestPartialResultsInjection(unittest.TestCase):
         ))
 
 
+# ─── run_validation in-process DC runner ─────────────────────────────────────
+
+_FAKE_DC_RUNNER = """
+import json, sys
+
+class ValidationRunner:
+    def __init__(self, validation_config_path, differ_output, stats_summary, lint_report, validation_output):
+        self.out = validation_output
+
+    def run_validations(self):
+        print("runner chatter on stdout")
+        print("runner log line", file=sys.stderr)
+        with open(self.out, "w") as f:
+            json.dump([{"validation_name": "check_a", "status": "PASSED"}], f)
+        if "fail" in self.out:
+            raise RuntimeError("boom")
+"""
+
+
+class TestDcRunnerInProcess(unittest.TestCase):
+    """The in-process runner keeps the subprocess output contract: stdout dropped, stderr on failure."""
+
+    def setUp(self):
+        import io
+
+        import scripts.run_validation as rv
+
+        self.rv = rv
+        td = tempfile.TemporaryDirectory()
+        self.addCleanup(td.cleanup)
+        self.tmp = Path(td.name)
+        pkg = self.tmp / "repo" / "tools" / "import_validation"
+        pkg.mkdir(parents=True)
+        (pkg.parent / "__init__.py").write_text("")
+        (pkg / "__init__.py").write_text("")
+        (pkg / "runner.py").write_text(_FAKE_DC_RUNNER)
+        self.repo = str(self.tmp / "repo")
+        self.addCleanup(self._forget_fake_repo)
+        self.out, self.err = io.StringIO(), io.StringIO()
+        for name, stream in (("stdout", self.out), ("stderr", self.err)):
+            p = patch.object(sys, name, stream)
+            p.start()
+            self.addCleanup(p.stop)
+
+    def _forget_fake_repo(self):
+        for mod in ("tools.import_validation.runner", "tools.import_validation", "tools"):
+            sys.modules.pop(mod, None)
+        if self.repo in sys.path:
+            sys.path.remove(self.repo)
+
+    def _run(self, name: str) -> bool:
+        return self.rv._run_dc_runner_in_process(
+            self.repo, str(self.tmp / "config.json"), str(self.tmp / name), None, None, None
+        )
+
+    def test_runner_output_not_streamed(self):
+        self.assertTrue(self._run("out.json"))
+        self.assertEqual((self.out.getvalue(), self.err.getvalue()), ("", ""))
+        self.assertTrue((self.tmp / "out.json").exists())
+
+    def test_stderr_replayed_on_failure(self):
+        self.assertTrue(self._run("fail.json"))
+        self.assertEqual(self.out.getvalue(), "")
+        self.assertIn("DC runner raised RuntimeError: boom", self.err.getvalue())
+        self.assertIn("runner log line", self.err.getvalue())
+
+
 # ─── _post_validate_sql_rule ─────────────────────────────────────────────────
 
 class TestPostValidateSqlRule(unittest.TestCase):
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import sys
 import unittest
@@ -15,7 +16,9 @@ from pipeline.progress import build_failure_event, build_progress_event, format_
 from pipeline.projector import ProgressProjector
 from pipeline.registry import load_registry
 from ui.services.validation_runner import (
+    _DONE_PREFIX,
     _failure_dict_from_state,
+    _stream_run_output,
     _infer_step_fallback,
     _maybe_emit_step_ndjson,
     _new_projector,
@@ -133,6 +136,58 @@ class TestInferStepFallback(unittest.TestCase):
         step, _ = _infer_step_fallback("Step 2 completed in 42s")
         self.assertEqual(step, 2)
 
+    def test_legacy_step_marker_with_label(self) -> None:
+        self.assertEqual(_infer_step_fallback("::STEP::2:Import tool\n"), (2, "Import tool"))
+
+class _FakeProc:
+    def __init__(self) -> None:
+        self.stdout = asyncio.StreamReader()
+        self.returncode = None
+        self.killed = False
+
+    def kill(self) -> None:
+        self.killed = True
+
+    async def wait(self) -> int:
+        self.returncode = -9 if self.killed else 0
+        return self.returncode
+
+
+class TestStreamBatching(unittest.IsolatedAsyncioTestCase):
+    async def test_lines_coalesced_and_done_alone(self) -> None:
+        proc = _FakeProc()
+        proc.stdout.feed_data(b"".join(b"log %d\n" % i for i in range(5)))
+        chunks = []
+
+        async def feeder() -> None:
+            await asyncio.sleep(0.2)
+            proc.stdout.feed_data(b"::STEP::2:Import tool\nlate\n")
+            proc.stdout.feed_eof()
+
+        task = asyncio.create_task(feeder())
+        async for chunk in _stream_run_output(proc, ROOT):
+            chunks.append(chunk)
+        await task
+        events = [[json.loads(l) for l in c.splitlines()] for c in chunks]
+        # Buffered lines are flushed while the subprocess is quiet, not held until the next line.
+        self.assertEqual([e["v"] for e in events[0]], [f"log {i}\n" for i in range(5)])
+        # A step event flushes immediately; the marker line itself follows it, as before batching.
+        self.assertEqual([e["t"] for e in events[1]], ["step"])
+        self.assertEqual([e["v"] for e in events[2]], ["::STEP::2:Import tool\n", "late\n"])
+        self.assertEqual([[e["t"] for e in c] for c in events[3:]], [["done"]])
+        # run_validation_process only parses chunks that start with the done prefix.
+        self.assertTrue(chunks[-1].startswith(_DONE_PREFIX))
+
+    async def test_timeout_kills_process(self) -> None:
+        proc = _FakeProc()
+        proc.stdout.feed_data(b"started\n")
+        chunks = [chunk async for chunk in _stream_run_output(proc, ROOT, timeout_sec=0.2)]
+        self.assertTrue(proc.killed)
+        done = json.loads(chunks[-1])
+        self.assertEqual((done["t"], done["timeout"], done["success"]), ("done", True, False))
+        self.assertEqual(json.loads(chunks[0])["v"], "started\n")
+
+
 class TestNewProjector(unittest.TestCase):
     def test_loads_registry_from_app_root(self) -> None:
         p = _new_projector(ROOT)
@@ -143,6 +198,9 @@ class TestStripAnsi(unittest.TestCase):
     def test_strips_color_codes(self) -> None:
         self.assertEqual(_strip_ansi("\x1b[32mhello\x1b[0m"), "hello")
 
+    def test_plain_line_unchanged(self) -> None:
+        self.assertEqual(_strip_ansi("plain [32m line\n"), "plain [32m line\n")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -4,18 +4,29 @@ When the service starts we assign a random server session ID and configure handl
 
 - Cloud Run (K_SERVICE set): StreamHandler(sys.stdout) only. Cloud Run captures stdout and
   sends it to Cloud Logging; no file handler (ephemeral disk) and no CloudLoggingHandler.
+  Lines carry no asctime: Cloud Logging timestamps each entry itself.
 - Local / VM: TimedRotatingFileHandler to logs/dc_import_validator.log (daily rotation,
-  keep 30 days). Optional StreamHandler for console during development.
+  keep 30 days), buffered and flushed about once a second. Optional StreamHandler for
+  console during development.
 
-Log level is read from LOG_LEVEL (default INFO). Example: LOG_LEVEL=DEBUG.
+Handlers are driven by a QueueListener thread: the root logger only has a QueueHandler, so
+a log call enqueues the record and returns instead of blocking on write()/rollover. The
+session/request IDs are attached before the record is queued (the request_id ContextVar is
+only visible on the calling thread).
+
+Log level is read from LOG_LEVEL (default INFO). Example: LOG_LEVEL=DEBUG. The log file
+never records below INFO; DEBUG output goes to stdout only.
 
 Each request (and each validation run) gets a request_id so logs can be correlated.
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 import sys
+import threading
 import uuid
 from contextvars import ContextVar
 from pathlib import Path
@@ -40,6 +51,22 @@ _server_session_id: str = ""
 
 # Request/run ID: set per request by middleware, so all logs in that request carry it.
 _request_id_ctx: ContextVar[str] = ContextVar("request_id", default="")
+# Bound once for SessionFilter, which runs on every record (get_request_id stays for callers).
+_get_request_id_ctx = _request_id_ctx.get
+
+# Background listener writing queued records to the real handlers (see configure_logging).
+_queue_listener: logging.handlers.QueueListener | None = None
+
+
+@atexit.register
+def _stop_queue_listener() -> None:
+    """Flush queued records and stop the listener thread (at exit, or before reconfiguring)."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
 
 
 def _new_session_id() -> str:
@@ -75,21 +102,57 @@ class SessionFilter(logging.Filter):
         self._server_session_id = server_session_id
 
     def filter(self, record: logging.LogRecord) -> bool:
-        record.server_session_id = getattr(record, "server_session_id", self._server_session_id)
-        record.request_id = getattr(record, "request_id", get_request_id())
+        # Only fill in missing fields: a caller may pass either field via extra=.
+        # LogRecord has neither by default.
+        if not hasattr(record, "server_session_id"):
+            record.server_session_id = self._server_session_id
+        if not hasattr(record, "request_id"):
+            record.request_id = _get_request_id_ctx() or ""
         return True
 
 
+class _BufferedTimedRotatingFileHandler(logging.handlers.TimedRotatingFileHandler):
+    """TimedRotatingFileHandler that writes through a 64 KiB buffer.
+
+    StreamHandler.emit flushes after every record (one write() syscall per line). Here that
+    flush is a no-op and a daemon thread flushes every flush_interval seconds instead, so
+    the file lags by at most that long; rollover and close still flush everything.
+    """
+
+    _BUFFER_SIZE = 64 * 1024
+
+    def __init__(self, *args, flush_interval: float = 1.0, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._flush_interval = flush_interval
+        self._stop_flushing = threading.Event()
+        threading.Thread(target=self._flush_loop, name="log-file-flush", daemon=True).start()
+
+    def _open(self):
+        return open(
+            self.baseFilename, self.mode, buffering=self._BUFFER_SIZE,
+            encoding=self.encoding, errors=self.errors,
+        )
+
+    def flush(self) -> None:
+        """Skipped per record; see _flush_loop."""
+
+    def _flush_loop(self) -> None:
+        while not self._stop_flushing.wait(self._flush_interval):
+            super().flush()  # takes the handler lock, so never interleaves with emit
+
+    def close(self) -> None:
+        self._stop_flushing.set()
+        super().close()  # closing the stream writes out the buffer
+
+
 def configure_logging(app_root: Path) -> str:
     """Configure app-wide logging: stdout on Cloud Run, file (+ optional console) locally. Returns server session ID."""
-    global _server_session_id
+    global _server_session_id, _queue_listener
     _server_session_id = _new_session_id()
     level = _get_log_level()
 
-    formatter = logging.Formatter(
-        "%(asctime)s [%(levelname)s] session=%(server_session_id)s request_id=%(request_id)s %(name)s: %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    fields = "[%(levelname)s] session=%(server_session_id)s request_id=%(request_id)s %(name)s: %(message)s"
+    formatter = logging.Formatter(f"%(asctime)s {fields}", datefmt="%Y-%m-%d %H:%M:%S")
     session_filter = SessionFilter(_server_session_id)
 
     root = logging.getLogger()
@@ -99,38 +162,40 @@ def configure_logging(app_root: Path) -> str:
         if getattr(h, "dc_import_validator_marker", False):
             root.removeHandler(h)
 
+    _stop_queue_listener()
+
     is_cloud_run = bool(os.environ.get("K_SERVICE"))
 
-    if is_cloud_run:
-        stream_handler = logging.StreamHandler(sys.stdout)
-        stream_handler.setLevel(level)
-        stream_handler.setFormatter(formatter)
-        stream_handler.addFilter(session_filter)
-        stream_handler.dc_import_validator_marker = True  # type: ignore[attr-defined]
-        root.addHandler(stream_handler)
-    else:
+    handlers: list[logging.Handler] = []
+    if not is_cloud_run:
         logs_dir = app_root / "logs"
         logs_dir.mkdir(parents=True, exist_ok=True)
         log_file = logs_dir / "dc_import_validator.log"
-        file_handler = logging.handlers.TimedRotatingFileHandler(
+        file_handler = _BufferedTimedRotatingFileHandler(
             log_file,
             when="midnight",
             interval=1,
             backupCount=30,
             encoding="utf-8",
         )
-        file_handler.setLevel(level)
-        file_handler.setFormatter(formatter)
-        file_handler.addFilter(session_filter)
-        file_handler.dc_import_validator_marker = True  # type: ignore[attr-defined]
-        root.addHandler(file_handler)
-        # Optional console so devs see logs in terminal
-        stream_handler = logging.StreamHandler(sys.stdout)
-        stream_handler.setLevel(level)
-        stream_handler.setFormatter(formatter)
-        stream_handler.addFilter(session_filter)
-        stream_handler.dc_import_validator_marker = True  # type: ignore[attr-defined]
-        root.addHandler(stream_handler)
+        file_handler.setLevel(max(level, logging.INFO))  # DEBUG volume stays off the disk
+        handlers.append(file_handler)
+    # stdout: the only handler on Cloud Run; locally an optional console so devs see logs in terminal
+    handlers.append(logging.StreamHandler(sys.stdout))
+    for handler in handlers:
+        if handler.level == logging.NOTSET:
+            handler.setLevel(level)
+        # Without %(asctime)s, Formatter skips localtime()/strftime() for every record.
+        handler.setFormatter(logging.Formatter(fields) if is_cloud_run else formatter)
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setLevel(level)
+    queue_handler.addFilter(session_filter)
+    queue_handler.dc_import_validator_marker = True  # type: ignore[attr-defined]
+    root.addHandler(queue_handler)
+    _queue_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
 
     return _server_session_id
 
@@ -13,38 +13,105 @@ If the bucket is not accessible (missing, permission denied, network error), fun
 raise so callers can log or surface the error clearly instead of failing silently.
 """
 
+import base64
+import hashlib
 import json
 import logging
 import os
+import sys
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict
 from pathlib import Path
 
+try:
+    from google.cloud import storage
+    from google.cloud.exceptions import NotFound
+    from google.cloud.storage import transfer_manager
+    from requests.adapters import HTTPAdapter
+except ImportError:  # optional: only needed when GCS_REPORTS_BUCKET is set
+    storage = None
+    NotFound = None
+    transfer_manager = None
+    HTTPAdapter = None
+
+_APP_ROOT = Path(__file__).resolve().parent.parent
+if str(_APP_ROOT) not in sys.path:
+    sys.path.insert(0, str(_APP_ROOT))
+
+from scripts import json_codec  # noqa: E402
+
 _log = logging.getLogger(__name__)
 
 
-def _upload_mcf_file(mcf_path: Path, bucket_name: str, blob_path: str) -> None:
-    """Upload one MCF file to GCS.
+def _is_unchanged(src: Path, remote: tuple[int | None, str | None] | None) -> bool:
+    """True if the remote (size, base64 MD5) matches src. Only hashes when sizes match."""
+    if remote is None or remote[1] is None:
+        return False
+    try:
+        if src.stat().st_size != remote[0]:
+            return False
+        with open(src, "rb") as f:
+            md5 = hashlib.file_digest(f, "md5").digest()
+    except OSError:
+        return False
+    return base64.b64encode(md5).decode("ascii") == remote[1]
 
-    Creates its own storage.Client so it is safe to call from multiple threads
-    concurrently — storage.Client (and its underlying requests.Session) is not
-    thread-safe when shared across threads.
+
+def _file_names(directory: Path) -> set[str]:
+    """Names of the regular files in directory (empty if it does not exist).
+
+    One scandir listing replaces an exists() stat per candidate file.
     """
-    from google.cloud import storage as _gcs
-    blob = _gcs.Client().bucket(bucket_name).blob(blob_path)
-    blob.upload_from_filename(str(mcf_path), content_type="text/plain")
+    try:
+        with os.scandir(directory) as it:
+            return {e.name for e in it if e.is_file()}
+    except OSError:
+        return set()
 
 
-def _upload_one_file(
-    src_path: Path,
+def _upload_files_parallel(
+    candidates: list[tuple[Path, str, str]],
     bucket_name: str,
-    blob_path: str,
-    content_type: str,
-) -> None:
-    """Upload a single file to GCS with its own storage.Client (thread-safe)."""
-    from google.cloud import storage as _gcs
-    blob = _gcs.Client().bucket(bucket_name).blob(blob_path)
-    blob.upload_from_filename(str(src_path), content_type=content_type)
+    max_workers: int,
+) -> int:
+    """Upload (src_path, blob_path, content_type) candidates concurrently.
+
+    Uses google-cloud-storage's transfer_manager (thread workers sharing the cached client
+    and its connection pool, see _new_client), so wall time is roughly the slowest file rather than the sum.
+    Files already in GCS with the same size and MD5 (e.g. a retried run) are skipped, found
+    with one listing of the candidates' common prefix. Raises the first upload exception.
+    Returns the number of files now in GCS (uploaded or already identical).
+    """
+    if not candidates:
+        return 0
+    _, bucket = _get_bucket_handle()
+    prefix = os.path.commonprefix([blob_path for _, blob_path, _ in candidates])
+    prefix = prefix[: prefix.rfind("/") + 1]
+    existing = {
+        b.name: (b.size, b.md5_hash)
+        for b in bucket.list_blobs(prefix=prefix, fields="items(name,size,md5Hash),nextPageToken")
+    }
+    file_blob_pairs = []
+    for src, blob_path, ct in candidates:
+        if _is_unchanged(src, existing.get(blob_path)):
+            continue
+        blob = bucket.blob(blob_path)
+        blob.content_type = ct  # used by upload_from_filename when no content_type is passed
+        file_blob_pairs.append((str(src), blob))
+    if len(file_blob_pairs) < len(candidates):
+        _log.info(
+            "[upload] %d of %d file(s) unchanged in gs://%s/%s; skipped",
+            len(candidates) - len(file_blob_pairs), len(candidates), bucket_name, prefix,
+        )
+    if file_blob_pairs:
+        transfer_manager.upload_many(
+            file_blob_pairs,
+            max_workers=min(max_workers, len(file_blob_pairs)),
+            worker_type=transfer_manager.THREAD,
+            raise_exception=True,
+        )
+    return len(candidates)
 
 
 def _get_bucket():
@@ -62,28 +129,83 @@ class GCSAccessError(Exception):
     """Raised when GCS_REPORTS_BUCKET is set but the bucket is not accessible."""
 
 
-def _get_client_and_bucket():
-    """Return (client, bucket) for the configured bucket, or (None, None) if not configured.
-    Raises GCSAccessError if GCS_REPORTS_BUCKET is set but the bucket is not accessible."""
+# (client, bucket) per bucket name, created once per process so report reads do not pay
+# client construction on every request. The bucket.reload() access check runs once per
+# bucket, and only on paths that need it up front (uploads, MCF download): hot reads go
+# straight to the object RPC, which reports access problems itself.
+_client_cache: dict[str, tuple] = {}
+_verified_buckets: set[str] = set()
+_client_lock = threading.Lock()
+
+
+def _reset_client_cache() -> None:
+    """Drop cached clients (tests, or after credentials change)."""
+    with _client_lock:
+        _client_cache.clear()
+        _verified_buckets.clear()
+
+
+def _access_error(bucket_name: str, exc: Exception) -> GCSAccessError:
+    return GCSAccessError(f"GCS bucket {bucket_name!r} is not accessible: {exc}")
+
+
+# HTTP connections kept per client. requests' default (10) is below the 16 MCF upload
+# workers, which would then queue for a connection or reconnect; the cached client also
+# serves report reads concurrently with uploads.
+_HTTP_POOL_SIZE = 32
+
+
+def _new_client():
+    """storage.Client whose HTTP session pools _HTTP_POOL_SIZE connections."""
+    client = storage.Client()
+    # client._http is the AuthorizedSession all requests go through (created on first access).
+    client._http.mount(
+        "https://", HTTPAdapter(pool_connections=_HTTP_POOL_SIZE, pool_maxsize=_HTTP_POOL_SIZE)
+    )
+    return client
+
+
+def _get_bucket_handle():
+    """Return cached (client, bucket) without any network call, or (None, None) if not configured.
+    Raises GCSAccessError if google-cloud-storage is missing or the client cannot be created."""
     bucket_name = _get_bucket()
     if not bucket_name:
         return None, None
-    try:
-        from google.cloud import storage
-    except ImportError:
+    cached = _client_cache.get(bucket_name)
+    if cached is not None:
+        return cached
+    if storage is None:
         raise GCSAccessError(
             "GCS_REPORTS_BUCKET is set but google-cloud-storage is not installed. Install it or unset GCS_REPORTS_BUCKET."
         )
+    with _client_lock:
+        cached = _client_cache.get(bucket_name)
+        if cached is not None:
+            return cached
+        try:
+            client = _new_client()
+            bucket = client.bucket(bucket_name)
+        except Exception as e:
+            raise _access_error(bucket_name, e) from e
+        cached = _client_cache[bucket_name] = (client, bucket)
+        return cached
+
+
+def _get_client_and_bucket():
+    """Return (client, bucket) for the configured bucket, or (None, None) if not configured.
+    Raises GCSAccessError if GCS_REPORTS_BUCKET is set but the bucket is not accessible
+    (checked with bucket.reload() the first time per process)."""
+    handle = _get_bucket_handle()
+    bucket = handle[1]
+    if bucket is None or bucket.name in _verified_buckets:
+        return handle
     try:
-        client = storage.Client()
-        bucket = client.bucket(bucket_name)
         # Lightweight access check so we fail clearly if bucket is missing or inaccessible
         bucket.reload()
-        return client, bucket
     except Exception as e:
-        raise GCSAccessError(
-            f"GCS bucket {bucket_name!r} is not accessible: {e}"
-        ) from e
+        raise _access_error(bucket.name, e) from e
+    _verified_buckets.add(bucket.name)
+    return handle
 
 
 def upload_merged_config_to_gcs(run_id: str, config_path: "Path") -> str:
@@ -136,39 +258,32 @@ def upload_critical_reports_to_gcs(
     prefix = f"reports/{run_id}/{dataset}"
 
     candidates: list[tuple[Path, str, str]] = []  # (src_path, blob_path, content_type)
+    present = _file_names(output_dir)
 
     for filename in ("validation_report.html", "summary_report.html"):
-        path = output_dir / filename
-        if path.exists():
-            candidates.append((path, f"{prefix}/{filename}", "text/html"))
+        if filename in present:
+            candidates.append((output_dir / filename, f"{prefix}/{filename}", "text/html"))
 
     for filename in ("validation_output.json", "report.json", "schema_review.json"):
-        path = output_dir / filename
-        if path.exists():
-            candidates.append((path, f"{prefix}/{filename}", "application/json"))
+        if filename in present:
+            candidates.append((output_dir / filename, f"{prefix}/{filename}", "application/json"))
 
     differ_dir = output_dir / "differ_output"
+    differ_present = _file_names(differ_dir)
     for filename, ct in (
         ("differ_summary.json", "application/json"),
         ("obs_diff_summary.csv", "text/csv"),
     ):
-        path = differ_dir / filename
-        if path.exists():
-            candidates.append((path, f"{prefix}/differ_output/{filename}", ct))
+        if filename in differ_present:
+            candidates.append((differ_dir / filename, f"{prefix}/differ_output/{filename}", ct))
 
     if not candidates:
         _log.info("upload_critical_reports: no files found in %s [run_id=%s]", output_dir, run_id)
         return 0
 
     t0 = time.monotonic()
-    n_workers = min(8, len(candidates))
-    with ThreadPoolExecutor(max_workers=n_workers) as executor:
-        futures = [
-            executor.submit(_upload_one_file, src, bucket_name, blob_path, ct)
-            for src, blob_path, ct in candidates
-        ]
-        for future in as_completed(futures):
-            future.result()  # re-raises any upload exception immediately
+    _upload_files_parallel(candidates, bucket_name, max_workers=8)
+    bust_report_cache(run_id, dataset)
 
     elapsed = time.monotonic() - t0
     _log.info(
@@ -202,28 +317,30 @@ def upload_deferred_artifacts_to_gcs(
     _get_client_and_bucket()
 
     prefix = f"reports/{run_id}/{dataset}"
-    uploaded = 0
 
     t0 = time.monotonic()
 
+    # Small artifacts are collected first and uploaded together (see _upload_files_parallel).
+    candidates: list[tuple[Path, str, str]] = []  # (src_path, blob_path, content_type)
+    present = _file_names(output_dir)
+
     # Warnings/advisories CSV
-    csv_path = output_dir / "validation_warnings_and_advisories.csv"
-    if csv_path.exists():
-        _upload_one_file(csv_path, bucket_name, f"{prefix}/validation_warnings_and_advisories.csv", "text/csv")
-        uploaded += 1
+    if "validation_warnings_and_advisories.csv" in present:
+        candidates.append((
+            output_dir / "validation_warnings_and_advisories.csv",
+            f"{prefix}/validation_warnings_and_advisories.csv",
+            "text/csv",
+        ))
 
     # Input CSV (for rule-failure enrichment when serving from GCS)
     try:
-        report_path = output_dir / "report.json"
-        if report_path.exists():
-            with open(report_path, encoding="utf-8") as f:
-                report = json.load(f)
+        if "report.json" in present:
+            report = json_codec.loads((output_dir / "report.json").read_bytes())
             for p in (report.get("commandArgs") or {}).get("inputFiles") or []:
-                if str(p).lower().endswith(".csv"):
-                    input_csv = Path(p)
+                input_csv = Path(p)
+                if input_csv.suffix.lower() == ".csv":
                     if input_csv.exists():
-                        _upload_one_file(input_csv, bucket_name, f"{prefix}/input.csv", "text/csv")
-                        uploaded += 1
+                        candidates.append((input_csv, f"{prefix}/input.csv", "text/csv"))
                         break
     except (json.JSONDecodeError, OSError, TypeError):
         pass
@@ -231,33 +348,31 @@ def upload_deferred_artifacts_to_gcs(
     # JFR profiling artifacts (genmcf_profile.jfr, gc.log) — may be in a genmcf subdir.
     for jfr_filename in ("genmcf_profile.jfr", "gc.log"):
         # genmcf writes into a subdirectory (e.g. output_dir/genmcf_output/) — search one level.
-        for candidate in list(output_dir.glob(f"*/{jfr_filename}")) + [output_dir / jfr_filename]:
-            if candidate.exists():
-                ct = "application/octet-stream" if jfr_filename.endswith(".jfr") else "text/plain"
-                _upload_one_file(candidate, bucket_name, f"{prefix}/{jfr_filename}", ct)
-                uploaded += 1
-                break  # upload only the first match
+        # glob only yields existing paths; the top-level file comes from the listing.
+        matches = list(output_dir.glob(f"*/{jfr_filename}"))
+        if jfr_filename in present:
+            matches.append(output_dir / jfr_filename)
+        if matches:
+            ct = "application/octet-stream" if jfr_filename.endswith(".jfr") else "text/plain"
+            candidates.append((matches[0], f"{prefix}/{jfr_filename}", ct))  # first match only
+
+    uploaded = _upload_files_parallel(candidates, bucket_name, max_workers=8)
 
     # MCF output (required for baseline creation via /api/accept-baseline).
     # Uploaded in parallel: large shard counts produce an equal number of MCF
     # files (e.g. 1890 shards → 1890 MCF files), making sequential uploads the
     # dominant wall-time cost (~18 min observed vs ~30 s with parallelism).
     mcf_t0 = time.monotonic()
-    mcf_paths = sorted(output_dir.glob("*.mcf"))
+    mcf_paths = sorted(
+        output_dir / name for name in present if name.endswith(".mcf") and not name.startswith(".")
+    )
     if mcf_paths:
         n_workers = min(16, len(mcf_paths))
-        with ThreadPoolExecutor(max_workers=n_workers) as executor:
-            futures = {
-                executor.submit(
-                    _upload_mcf_file,
-                    p,
-                    bucket_name,
-                    f"{prefix}/{p.name}",
-                ): p
-                for p in mcf_paths
-            }
-            for future in as_completed(futures):
-                future.result()  # re-raises any upload exception immediately
+        _upload_files_parallel(
+            [(p, f"{prefix}/{p.name}", "text/plain") for p in mcf_paths],
+            bucket_name,
+            max_workers=n_workers,
+        )
         mcf_elapsed = time.monotonic() - mcf_t0
         _log.info(
             "[upload] MCF: %d files in %.1fs (%.1f files/s, workers=%d) [run_id=%s]",
@@ -325,33 +440,133 @@ def download_mcf_files_from_gcs(run_id: str, dataset: str, dest_dir: Path) -> in
     return count
 
 
+# get_report_from_gcs results: (bucket, run_id, dataset, filename) -> (content, fetched_at),
+# least recently used first. A run's reports are written once by its upload phases (which
+# bust the run's entries), so the UI's repeat views and the endpoints that read the same
+# artifact share one download. Misses are not cached: deferred artifacts appear later.
+# Bounded by total bytes; objects over _CONTENT_CACHE_MAX_OBJECT (e.g. big input.csv) are
+# never cached.
+_CONTENT_CACHE_TTL = 300.0
+_CONTENT_CACHE_MAX_BYTES = 128 * 1024 * 1024
+_CONTENT_CACHE_MAX_OBJECT = 16 * 1024 * 1024
+_content_cache: "OrderedDict[tuple[str, str, str, str], tuple[bytes, float]]" = OrderedDict()
+_content_cache_bytes = 0
+_content_cache_lock = threading.Lock()
+
+
+def _content_cache_get(key: tuple[str, str, str, str], now: float) -> bytes | None:
+    global _content_cache_bytes
+    with _content_cache_lock:
+        cached = _content_cache.get(key)
+        if cached is None:
+            return None
+        if now - cached[1] >= _CONTENT_CACHE_TTL:
+            del _content_cache[key]
+            _content_cache_bytes -= len(cached[0])
+            return None
+        _content_cache.move_to_end(key)
+        return cached[0]
+
+
+def _content_cache_put(key: tuple[str, str, str, str], content: bytes, now: float) -> None:
+    global _content_cache_bytes
+    if len(content) > _CONTENT_CACHE_MAX_OBJECT:
+        return
+    with _content_cache_lock:
+        old = _content_cache.pop(key, None)
+        if old is not None:
+            _content_cache_bytes -= len(old[0])
+        _content_cache[key] = (content, now)
+        _content_cache_bytes += len(content)
+        while _content_cache_bytes > _CONTENT_CACHE_MAX_BYTES:
+            _, (evicted, _) = _content_cache.popitem(last=False)
+            _content_cache_bytes -= len(evicted)
+
+
+def _content_cache_clear() -> None:
+    global _content_cache_bytes
+    with _content_cache_lock:
+        _content_cache.clear()
+        _content_cache_bytes = 0
+
+
 def get_report_from_gcs(run_id: str, dataset: str, filename: str) -> bytes | None:
     """Read a report file from GCS. Returns content or None if not found or GCS not configured.
+    Found objects are reused from memory for _CONTENT_CACHE_TTL seconds.
     Raises GCSAccessError if GCS_REPORTS_BUCKET is set but the bucket is not accessible."""
     bucket_name = _get_bucket()
     if not bucket_name or not run_id or not dataset:
         return None
-    _, bucket = _get_client_and_bucket()
+    key = (bucket_name, run_id, dataset, filename)
+    now = time.monotonic()
+    content = _content_cache_get(key, now)
+    if content is not None:
+        return content
+    _, bucket = _get_bucket_handle()
     if not bucket:
         return None
 
-    blob = bucket.blob(f"reports/{run_id}/{dataset}/{filename}")
-    if not blob.exists():
+    # One GET; a missing object is a 404 rather than a separate exists() round-trip.
+    try:
+        content = bucket.blob(f"reports/{run_id}/{dataset}/{filename}").download_as_bytes()
+    except NotFound:
         return None
-    return blob.download_as_bytes()
+    except Exception as e:
+        raise _access_error(bucket_name, e) from e
+    _content_cache_put(key, content, now)
+    return content
+
+
+# get_report_updated_from_gcs results, so back-to-back polls (report-info) within the TTL
+# share one metadata GET: (bucket, run_id, dataset, filename) -> (timestamp or None, fetched_at).
+# Insertion-ordered, so once expired entries are swept the oldest go first; guarded by a lock
+# because report-info (threadpool) and uploads (asyncio.to_thread) touch it concurrently.
+_UPDATED_CACHE_TTL = 5.0
+_UPDATED_CACHE_MAX = 1024
+_updated_cache: "OrderedDict[tuple[str, str, str, str], tuple[float | None, float]]" = OrderedDict()
+_updated_cache_lock = threading.Lock()
+
+
+def bust_report_cache(run_id: str, dataset: str) -> None:
+    """Forget cached report timestamps and contents for a run/dataset (after uploading new reports)."""
+    global _content_cache_bytes
+    with _updated_cache_lock:
+        for key in [k for k in _updated_cache if k[1] == run_id and k[2] == dataset]:
+            del _updated_cache[key]
+    with _content_cache_lock:
+        for key in [k for k in _content_cache if k[1] == run_id and k[2] == dataset]:
+            _content_cache_bytes -= len(_content_cache.pop(key)[0])
 
 
 def get_report_updated_from_gcs(run_id: str, dataset: str, filename: str) -> float | None:
     """Return last-modified timestamp (Unix) for a report file in GCS, or None.
+    Results (including None) are reused for _UPDATED_CACHE_TTL seconds.
     Raises GCSAccessError if GCS_REPORTS_BUCKET is set but the bucket is not accessible."""
     bucket_name = _get_bucket()
     if not bucket_name or not run_id or not dataset:
         return None
-    _, bucket = _get_client_and_bucket()
+    key = (bucket_name, run_id, dataset, filename)
+    now = time.monotonic()
+    with _updated_cache_lock:
+        cached = _updated_cache.get(key)
+    if cached is not None and now - cached[1] < _UPDATED_CACHE_TTL:
+        return cached[0]
+    _, bucket = _get_bucket_handle()
     if not bucket:
         return None
 
-    blob = bucket.get_blob(f"reports/{run_id}/{dataset}/{filename}")
-    if not blob or not blob.updated:
-        return None
-    return blob.updated.timestamp()
+    # get_blob is a single metadata GET and already returns None for a missing object.
+    try:
+        blob = bucket.get_blob(f"reports/{run_id}/{dataset}/{filename}")
+    except Exception as e:
+        raise _access_error(bucket_name, e) from e
+    updated = blob.updated.timestamp() if blob and blob.updated else None
+    with _updated_cache_lock:
+        _updated_cache.pop(key, None)
+        if len(_updated_cache) >= _UPDATED_CACHE_MAX:
+            for stale in [k for k, (_, at) in _updated_cache.items() if now - at >= _UPDATED_CACHE_TTL]:
+                del _updated_cache[stale]
+            while len(_updated_cache) >= _UPDATED_CACHE_MAX:
+                _updated_cache.popitem(last=False)
+        _updated_cache[key] = (updated, now)
+    return updated
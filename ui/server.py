@@ -2,6 +2,7 @@
 """Web UI server for DC Import Validator.
 
 Run with: uvicorn ui.server:app --reload --host 0.0.0.0 --port 8000
+(Production: add --loop uvloop --http httptools; both ship with uvicorn[standard].)
 
 Logging: session ID + request_id; on Cloud Run logs go to stdout (captured by Cloud Logging);
 locally to logs/dc_import_validator.log and console. See ui/app_logging.py.
@@ -9,10 +10,12 @@ locally to logs/dc_import_validator.log and console. See ui/app_logging.py.
 
 import asyncio
 import datetime
+import hashlib
 from dataclasses import dataclass as _dataclass
 import html
 import ipaddress
 import json
+import mmap
 import os
 import re
 import secrets
@@ -22,7 +25,10 @@ import sys
 import tempfile
 import threading
 import uuid
+from collections import OrderedDict
 from contextlib import asynccontextmanager
+from email.utils import formatdate
+from functools import lru_cache
 from pathlib import Path
 
 # Project root for importing shared scripts and services
@@ -45,7 +51,12 @@ from ui.app_logging import (
     clear_request_id,
 )
 from ui.services.validation_runner import run_validation_process as _run_validation_process
-from ui.services.rule_samples import extract_rule_failure_samples, enrich_rule_failure_samples
+from ui.services.rule_samples import (
+    enrich_rule_failure_samples,
+    enrich_rule_failure_samples_from_bytes,
+    extract_rule_failure_samples,
+    needs_csv_enrichment,
+)
 from ui.services.fluctuation_service import (
     extract_fluctuation_samples as _extract_fluctuation_samples,
     get_gemini_api_key as _get_gemini_api_key,
@@ -61,6 +72,7 @@ from ui import gcs_reports
 from ui.gcs_reports import GCSAccessError, is_gcs_configured
 from ui import gcs_uploads as _gcs_uploads
 import gcs_baselines as _gcs_baselines
+import json_codec
 from ui.services import batch_runner as _batch_runner
 from ui.services.job_status import get_job_status as _get_job_status
 from ui.orchestration.executors.batch import BatchExecutor
@@ -90,6 +102,9 @@ _COMMIT_SHA = os.environ.get("COMMIT_SHA", "").strip()[:7]  # short SHA only
 SCRIPT_DIR = APP_ROOT
 OUTPUT_DIR = APP_ROOT / "output"
 CONFIG_DIR = APP_ROOT / "validation_configs"
+# Merged validation configs, named by content hash and shared by every run that selects the
+# same built-in rules (see _create_merged_config). Never deleted by run cleanup.
+_CFG_CACHE_DIR = OUTPUT_DIR / ".cfg_cache"
 
 DATASET_OUTPUT_MAP = {
     "child_birth": OUTPUT_DIR / "child_birth_genmcf",
@@ -107,6 +122,10 @@ DATASET_CONFIG_MAP = {
     "custom": "new_import_config.json",
 }
 
+# The "full import tool report" href generate_html_report.py writes into validation_report.html;
+# serve_report_by_run_id rewrites it to the run-specific URL.
+_SUMMARY_LINK_BY_DATASET = {d: b'href="/summary-report/' + d.encode("utf-8") + b'"' for d in DATASET_OUTPUT_MAP}
+
 def _validate_custom_rules(custom_rules: list) -> str | None:
     """Validate custom rules list. Returns error message if invalid, else None.
 
@@ -179,8 +198,8 @@ def _validate_config_bytes(content: bytes, source: str = "") -> None:
     Raises HTTPException 422 if any SQL_VALIDATOR rule fails the DuckDB EXPLAIN pre-check.
     """
     try:
-        cfg = json.loads(content)
-    except json.JSONDecodeError as exc:
+        cfg = json_codec.loads(content)
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
         detail = f"Validation config is not valid JSON: {exc}"
         if source:
             detail += f" (source: {source})"
@@ -343,7 +362,7 @@ async def _resolve_validation_config(
     if content is None:
         return None
     dest = dest_dir / "validation_config_upload.json"
-    dest.write_bytes(content)
+    await asyncio.to_thread(dest.write_bytes, content)
     logger.info("resolved_validation_config bytes=%d", len(content))
     return dest
 
@@ -378,22 +397,45 @@ def _normalize_custom_rule(rule: dict) -> dict:
     return normalized
 
 
+@lru_cache(maxsize=8)
+def _load_config_file(path: str, mtime_ns: int) -> dict:
+    """Parsed config JSON, cached per (path, mtime_ns) so an edited file is re-read.
+    Callers must not mutate the result (copy before changing it)."""
+    return json_codec.loads(Path(path).read_bytes())
+
+
+def _dataset_base_config(dataset: str) -> dict | None:
+    """Shallow copy of the dataset's default validation config (rules list copied too),
+    or None when the dataset has no config file."""
+    config_name = DATASET_CONFIG_MAP.get(dataset)
+    if not config_name:
+        return None
+    config_path = CONFIG_DIR / config_name
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    config = dict(_load_config_file(str(config_path), mtime_ns))
+    if isinstance(config.get("rules"), list):
+        config["rules"] = list(config["rules"])
+    return config
+
+
 def _create_merged_config(dataset: str, rule_ids: list[str], custom_rules: list[dict]) -> Path | None:
-    """Create temp config with filtered built-in rules plus appended custom rules.
+    """Config with filtered built-in rules plus appended custom rules.
 
-    Returns path to a temp JSON file, or None when no modifications are needed
+    A built-in-only selection is written once under _CFG_CACHE_DIR, named by a hash of its
+    content, so repeat runs with the same selection reuse the file (a bounded set: one per
+    dataset config version and rule subset). Configs with custom rules (arbitrary user input)
+    go to a per-run temp file instead, so they never accumulate. Release either kind with
+    _discard_config, which keeps shared files. Returns None when no modifications are needed
     (i.e. all built-in rules selected and no custom rules — use the default config).
     """
     if not rule_ids and not custom_rules:
         return None
-    config_name = DATASET_CONFIG_MAP.get(dataset)
-    if not config_name:
-        return None
-    config_path = CONFIG_DIR / config_name
-    if not config_path.exists():
+    config = _dataset_base_config(dataset)
+    if config is None:
         return None
-    with open(config_path, encoding="utf-8") as f:
-        config = json.load(f)
     base_rules = config.get("rules", [])
 
     if rule_ids:
@@ -413,17 +455,52 @@ def _create_merged_config(dataset: str, rule_ids: list[str], custom_rules: list[
         return None
 
     config["rules"] = all_rules
-    fd, path = tempfile.mkstemp(suffix=".json", prefix="validation_config_")
+    content = json_codec.dumps_bytes(config, indent=True)
+    if custom_rules:
+        fd, tmp = tempfile.mkstemp(suffix=".json", prefix="validation_config_")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            return Path(tmp)
+        except Exception:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+    path = _CFG_CACHE_DIR / f"validation_config_{hashlib.blake2b(content, digest_size=16).hexdigest()}.json"
+    if path.exists():
+        return path
+    _CFG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    # Write a private temp file and rename it into place so a concurrent run never reads a
+    # partial file (two writers of the same name produce identical content).
+    fd, tmp = tempfile.mkstemp(suffix=".tmp", prefix=path.stem, dir=_CFG_CACHE_DIR)
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2)
-        return Path(path)
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(tmp, path)
     except Exception:
         try:
-            os.unlink(path)
+            os.unlink(tmp)
         except OSError:
             pass
         raise
+    return path
+
+
+def _ephemeral_config(config_path: Path | None) -> Path | None:
+    """config_path if it is a per-run file the run must delete when done; None for no config
+    or a shared file from _CFG_CACHE_DIR."""
+    if config_path is None or config_path.parent == _CFG_CACHE_DIR:
+        return None
+    return config_path
+
+
+def _discard_config(config_path: Path | None) -> None:
+    """Delete a per-run config file; shared cached configs are kept."""
+    path = _ephemeral_config(config_path)
+    if path is not None:
+        path.unlink(missing_ok=True)
 
 
 def _create_filtered_config(dataset: str, rule_ids: list[str]) -> Path | None:
@@ -442,15 +519,9 @@ def _inject_goldens_into_config(
     The caller is responsible for unlinking the returned temp file when done.
     """
     if config_path and config_path.exists():
-        with open(config_path, encoding="utf-8") as f:
-            config = json.load(f)
+        config = json_codec.loads(config_path.read_bytes())
     else:
-        config_name = DATASET_CONFIG_MAP.get(dataset)
-        if config_name:
-            cfg_file = CONFIG_DIR / config_name
-            config = json.loads(cfg_file.read_text(encoding="utf-8")) if cfg_file.exists() else {"schema_version": "1.0", "rules": []}
-        else:
-            config = {"schema_version": "1.0", "rules": []}
+        config = _dataset_base_config(dataset) or {"schema_version": "1.0", "rules": []}
 
     goldens_rule = {
         "rule_id": "check_uploaded_golden_files",
@@ -461,8 +532,8 @@ def _inject_goldens_into_config(
 
     fd, path = tempfile.mkstemp(suffix=".json", prefix="validation_config_goldens_")
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2)
+        with os.fdopen(fd, "wb") as f:
+            f.write(json_codec.dumps_bytes(config, indent=True))
         return Path(path)
     except Exception:
         try:
@@ -514,12 +585,15 @@ def _existence_checks_env(existence_checks: str | None) -> dict[str, str]:
 async def _stream_upload_to_file(
     upload: UploadFile, dest: Path, max_bytes: int, error_detail: str
 ) -> None:
-    """Stream-copy an UploadFile to dest in 8 MB chunks, enforcing max_bytes.
+    """Stream-copy an UploadFile to dest in 1 MB chunks, enforcing max_bytes.
+
+    Used for every file field of a custom run (TMCF, CSVs, stat-var MCFs, goldens), so no
+    upload is held in memory as a whole.
 
     Uses asyncio.to_thread so the event loop is not blocked during disk I/O.
     Raises HTTPException(400) mid-stream if the file exceeds max_bytes.
     """
-    CHUNK = 8 * 1024 * 1024  # 8 MB per read
+    CHUNK = 1024 * 1024  # 1 MB per read; bounds per-upload buffer memory under concurrent runs
 
     def _copy() -> None:
         total = 0
@@ -608,6 +682,11 @@ async def _lifespan(app: FastAPI):
         session_id,
         str(APP_ROOT / "logs"),
     )
+    # The pipeline script ships with the image, so check for it once here rather than per run.
+    script = SCRIPT_DIR / "run_e2e_test.sh"
+    app.state.run_script = script if script.is_file() else None
+    if app.state.run_script is None:
+        log.error("run_e2e_test.sh not found at %s; /api/run/* requests will fail", script)
     yield
     # Shutdown: nothing to close for file logging
     log.info("DC Import Validator shutting down server_session_id=%s", session_id)
@@ -617,6 +696,14 @@ app = FastAPI(title="DC Import Validator", version="1.0", lifespan=_lifespan)
 logger = get_logger(__name__)
 
 
+def _run_script(request: Request) -> Path:
+    """run_e2e_test.sh as located at startup; HTTPException(500) if it was missing."""
+    script = getattr(request.app.state, "run_script", None)
+    if script is None:
+        raise HTTPException(status_code=500, detail="run_e2e_test.sh not found")
+    return script
+
+
 _POLLING_PATH_PREFIXES = (
     "/api/review-summary/",
     "/api/validation-result/",
@@ -625,6 +712,7 @@ _POLLING_PATH_PREFIXES = (
     "/api/upload-config",
     "/healthz",
 )
+_RUN_PATH_PREFIX = "/api/run/"
 
 class LoggingMiddleware(BaseHTTPMiddleware):
     """Assign request_id per request and log run_started for /api/run/*.
@@ -634,19 +722,18 @@ class LoggingMiddleware(BaseHTTPMiddleware):
     """
 
     async def dispatch(self, request: Request, call_next):
-        rid = uuid.uuid4().hex[:12]
+        rid = secrets.token_hex(6)  # 12 hex chars, same shape as uuid4().hex[:12]
         set_request_id(rid)
         request.state.request_id = rid
         try:
             path = request.url.path
-            if any(path.startswith(p) for p in _POLLING_PATH_PREFIXES):
+            if path.startswith(_POLLING_PATH_PREFIXES):
                 logger.debug("request_started method=%s path=%s request_id=%s", request.method, path, rid)
             else:
                 logger.info("request_started method=%s path=%s request_id=%s", request.method, path, rid)
-            if path.startswith("/api/run/"):
+            if path.startswith(_RUN_PATH_PREFIX):
                 # Middleware runs before route match, so path_params is not set; parse path instead
-                suffix = path.split("/api/run/", 1)[-1].lstrip("/")
-                dataset = suffix.split("/")[0] if suffix else "?"
+                dataset = path.removeprefix(_RUN_PATH_PREFIX).lstrip("/").partition("/")[0] or "?"
                 logger.info("run_started request_id=%s dataset=%s", rid, dataset)
             response = await call_next(request)
             return response
@@ -664,6 +751,26 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         return response
 
 
+class UploadSizeLimitMiddleware(BaseHTTPMiddleware):
+    """Reject custom-run uploads whose Content-Length exceeds MAX_UPLOAD_BYTES with 413.
+
+    Runs before FastAPI parses the multipart form (which spools every file to disk), so an
+    oversized body is refused without being received. A fast-path guard only: the per-file
+    streaming check in _stream_upload_to_file is the authoritative enforcement.
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        if request.method == "POST" and request.url.path.startswith("/api/run/custom"):
+            cl = request.headers.get("content-length")
+            if cl and cl.isdigit() and int(cl) > MAX_UPLOAD_BYTES:
+                return JSONResponse(
+                    status_code=413,
+                    content={"detail": f"Upload too large. Maximum CSV size is {MAX_UPLOAD_BYTES // 1024**3} GB per file."},
+                )
+        return await call_next(request)
+
+
+app.add_middleware(UploadSizeLimitMiddleware)
 app.add_middleware(SecurityHeadersMiddleware)
 app.add_middleware(LoggingMiddleware)
 
@@ -841,9 +948,8 @@ async def prepare_upload(body: _PrepareUploadRequest):
         raise HTTPException(status_code=500, detail=f"Failed to create upload session: {exc}")
 
 
-@app.get("/api/datasets")
-def list_datasets():
-    return {
+_DATASETS_JSON = json_codec.dumps_bytes(
+    {
         "datasets": [
             {"id": "child_birth", "label": "Child Birth", "description": "Sample dataset (sample_data/child_birth/: TMCF, CSV, stat_vars.mcf). Expect PASS."},
             {"id": "statistics_poland", "label": "Statistics Poland", "description": "Sample dataset from data repo statvar_imports/statistics_poland/test/ (TMCF, CSV, stat_vars, stat_vars_schema)."},
@@ -852,18 +958,44 @@ def list_datasets():
             {"id": "custom", "label": "Custom (Upload your own files)", "description": "Upload TMCF + CSV files to validate."},
         ]
     }
+)
+
+
+@app.get("/api/datasets")
+def list_datasets():
+    return Response(_DATASETS_JSON, media_type="application/json")
+
+
+@lru_cache(maxsize=16)
+def _config_response_body(path: str, mtime_ns: int) -> bytes:
+    """Serialized /api/config body for one version of a config file."""
+    return json_codec.dumps_bytes(_load_config_file(path, mtime_ns))
 
 
 @app.get("/api/config/{dataset}")
-def get_config(dataset: str):
-    if dataset not in DATASET_CONFIG_MAP:
+def get_config(dataset: str, request: Request):
+    config_name = DATASET_CONFIG_MAP.get(dataset)
+    if config_name is None:
         raise HTTPException(status_code=404, detail="Unknown dataset")
-    config_name = DATASET_CONFIG_MAP[dataset]
     config_path = CONFIG_DIR / config_name
-    if not config_path.exists():
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Config not found")
-    with open(config_path, encoding="utf-8") as f:
-        return json.load(f)
+    # The config only changes when the file is edited, so its mtime is a (weak) validator.
+    etag = f'W/"{mtime_ns}"'
+    if request.headers.get("if-none-match") == etag:
+        return _not_modified(etag)
+    return _json_with_etag(_config_response_body(str(config_path), mtime_ns), etag)
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+
+def _json_with_etag(body: bytes, etag: str) -> Response:
+    """JSON response the client must revalidate (If-None-Match) before reusing."""
+    return Response(body, media_type="application/json", headers={"ETag": etag, "Cache-Control": "no-cache"})
 
 
 def _sanitize_dataset_name(name: str) -> str:
@@ -924,9 +1056,7 @@ async def _run_custom_validation_impl(
     - GCS input paths: tmcf_gcs_path / csv_gcs_paths provided; files downloaded
                       directly from GCS using the service account (no upload needed).
     """
-    script = SCRIPT_DIR / "run_e2e_test.sh"
-    if not script.exists():
-        raise HTTPException(status_code=500, detail="run_e2e_test.sh not found")
+    script = _run_script(request)
 
     # Use per-run upload directory to prevent concurrent requests from overwriting each other's files.
     # request_id is set by LoggingMiddleware before this function is called.
@@ -1087,20 +1217,8 @@ async def _run_custom_validation_impl(
             if not csv:
                 raise HTTPException(status_code=400, detail="At least one CSV file is required")
 
-            # Early reject: Content-Length of the whole multipart body exceeds the per-file limit.
-            # This is a fast-path guard; the per-file streaming check is the authoritative enforcement.
-            _cl_header = request.headers.get("content-length")
-            if _cl_header and _cl_header.isdigit() and int(_cl_header) > max_bytes:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Upload too large. Maximum CSV size is {_size_display} per file.",
-                )
-
-            # TMCF files are always small — load into memory as before.
-            tmcf_content = await tmcf.read()
-            if len(tmcf_content) > max_bytes:
-                raise HTTPException(status_code=400, detail=f"TMCF file exceeds {_size_display} limit")
-            tmcf_path.write_bytes(tmcf_content)
+            # Oversized request bodies were already rejected by UploadSizeLimitMiddleware.
+            await _stream_upload_to_file(tmcf, tmcf_path, max_bytes, f"TMCF file exceeds {_size_display} limit")
 
             csv_paths = []
             for i, csv_file in enumerate(csv):
@@ -1119,16 +1237,15 @@ async def _run_custom_validation_impl(
                 csv_paths.append(csv_save_path)
 
             if stat_vars_mcf and stat_vars_mcf.filename:
-                content = await stat_vars_mcf.read()
-                if len(content) > max_bytes:
-                    raise HTTPException(status_code=400, detail="Stat vars MCF file exceeds size limit")
-                stat_vars_mcf_path.write_bytes(content)
+                await _stream_upload_to_file(
+                    stat_vars_mcf, stat_vars_mcf_path, max_bytes, "Stat vars MCF file exceeds size limit"
+                )
 
             if stat_vars_schema_mcf and stat_vars_schema_mcf.filename:
-                content = await stat_vars_schema_mcf.read()
-                if len(content) > max_bytes:
-                    raise HTTPException(status_code=400, detail="Stat vars schema MCF file exceeds size limit")
-                stat_vars_schema_mcf_path.write_bytes(content)
+                await _stream_upload_to_file(
+                    stat_vars_schema_mcf, stat_vars_schema_mcf_path, max_bytes,
+                    "Stat vars schema MCF file exceeds size limit",
+                )
 
             if golden_files:
                 goldens_dir.mkdir(parents=True, exist_ok=True)
@@ -1138,18 +1255,18 @@ async def _run_custom_validation_impl(
                     orig_name = Path(gf.filename).name
                     safe_name = re.sub(r"[^A-Za-z0-9._-]", "_", orig_name) if orig_name else "golden.csv"
                     gdest = goldens_dir / safe_name
-                    content = await gf.read()
-                    if len(content) > max_bytes:
-                        raise HTTPException(status_code=400, detail=f"Golden file '{gf.filename}' exceeds size limit")
-                    gdest.write_bytes(content)
+                    await _stream_upload_to_file(
+                        gf, gdest, max_bytes, f"Golden file '{gf.filename}' exceeds size limit"
+                    )
                     golden_file_paths.append(gdest)
 
     except HTTPException:
         # Clean up the upload dir so rejected requests do not accumulate files on disk.
-        shutil.rmtree(run_upload_dir, ignore_errors=True)
+        # Off the event loop: a partial upload can be many large files.
+        await asyncio.to_thread(shutil.rmtree, run_upload_dir, ignore_errors=True)
         raise
     except Exception as e:
-        shutil.rmtree(run_upload_dir, ignore_errors=True)
+        await asyncio.to_thread(shutil.rmtree, run_upload_dir, ignore_errors=True)
         logger.exception("Error saving custom uploads or preparing run")
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1165,16 +1282,17 @@ async def _run_custom_validation_impl(
     config_path = await _resolve_validation_config(validation_config, validation_config_url, run_upload_dir)
     if config_path is None:
         rule_ids = [x.strip() for x in (rules or "").split(",") if x.strip()] if rules else []
-        config_path = _create_merged_config("custom", rule_ids, list(custom_rules or []))
+        config_path = await asyncio.to_thread(
+            _create_merged_config, "custom", rule_ids, list(custom_rules or [])
+        )
 
     # Inject GOLDENS_CHECK rule when golden files were provided (any delivery mode).
     if golden_file_paths:
         old_config_path = config_path
-        config_path = _inject_goldens_into_config(
-            config_path, [str(p) for p in golden_file_paths], "custom"
+        config_path = await asyncio.to_thread(
+            _inject_goldens_into_config, config_path, [str(p) for p in golden_file_paths], "custom"
         )
-        if old_config_path and old_config_path.exists():
-            old_config_path.unlink(missing_ok=True)
+        _discard_config(old_config_path)
         logger.info(
             "golden_check injected golden_files=%d request_id=%s",
             len(golden_file_paths), request_id,
@@ -1218,11 +1336,11 @@ async def _run_custom_validation_impl(
             _gcs_args_fn = _build_args
 
         # request_id was already extracted for the upload dir above; reuse it here.
-        output_dir = (OUTPUT_DIR / "custom" / request_id) if request_id else DATASET_OUTPUT_MAP["custom"]
         canonical_output_dir = DATASET_OUTPUT_MAP["custom"]
+        output_dir = (OUTPUT_DIR / "custom" / request_id) if request_id else canonical_output_dir
         return await _run_validation_process(
             [] if _gcs_args_fn is not None else _build_args(),
-            request, config_path, stream=stream, app_root=APP_ROOT,
+            request, _ephemeral_config(config_path), stream=stream, app_root=APP_ROOT,
             output_dir=output_dir, dataset="custom", canonical_output_dir=canonical_output_dir,
             # Pass run_upload_dir so the runner cleans it after the subprocess exits.
             # For streaming runs this happens in the generator's finally; for non-streaming
@@ -1237,18 +1355,32 @@ async def _run_custom_validation_impl(
     except HTTPException:
         # Runner raised before or during startup (e.g. 429). Clean up locally since the
         # runner's cleanup callbacks were never registered or never reached.
-        if config_path and config_path.exists():
-            config_path.unlink(missing_ok=True)
-        shutil.rmtree(run_upload_dir, ignore_errors=True)
+        _discard_config(config_path)
+        await asyncio.to_thread(shutil.rmtree, run_upload_dir, ignore_errors=True)
         raise
     except Exception as e:
-        if config_path and config_path.exists():
-            config_path.unlink(missing_ok=True)
-        shutil.rmtree(run_upload_dir, ignore_errors=True)
+        _discard_config(config_path)
+        await asyncio.to_thread(shutil.rmtree, run_upload_dir, ignore_errors=True)
         logger.exception("Error running custom validation%s", " (stream)" if stream else "")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _parse_custom_rules_json(custom_rules_json: str | None) -> list[dict]:
+    """Parse and validate the custom_rules_json form field of a custom run (HTTPException 400 if invalid)."""
+    if not custom_rules_json:
+        return []
+    try:
+        parsed = json.loads(custom_rules_json)
+    except json.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="custom_rules_json is not valid JSON")
+    if not isinstance(parsed, list):
+        raise HTTPException(status_code=400, detail="custom_rules_json must be a JSON array")
+    err = _validate_custom_rules(parsed)
+    if err:
+        raise HTTPException(status_code=400, detail=err)
+    return parsed
+
+
 @app.post("/api/run/custom/stream")
 async def run_custom_validation_stream(
     request: Request,
@@ -1283,22 +1415,10 @@ async def run_custom_validation_stream(
     override the default validation rules. File takes priority over URL. When provided, all
     rule selection and custom SQL rules are ignored for this run.
     """
-    custom_rules: list[dict] = []
-    if custom_rules_json:
-        try:
-            parsed = json.loads(custom_rules_json)
-            if not isinstance(parsed, list):
-                raise HTTPException(status_code=400, detail="custom_rules_json must be a JSON array")
-            err = _validate_custom_rules(parsed)
-            if err:
-                raise HTTPException(status_code=400, detail=err)
-            custom_rules = parsed
-        except json.JSONDecodeError:
-            raise HTTPException(status_code=400, detail="custom_rules_json is not valid JSON")
     return await _run_custom_validation_impl(
         request, tmcf, csv, stat_vars_mcf, stat_vars_schema_mcf, rules, llm_review, llm_model, stream=True,
         dataset_name=dataset_name, existence_checks=existence_checks, session_id=session_id,
-        custom_rules=custom_rules,
+        custom_rules=_parse_custom_rules_json(custom_rules_json),
         tmcf_gcs_path=tmcf_gcs_path, csv_gcs_paths=csv_gcs_paths,
         stat_vars_mcf_gcs_path=stat_vars_mcf_gcs_path,
         stat_vars_schema_mcf_gcs_path=stat_vars_schema_mcf_gcs_path,
@@ -1342,22 +1462,10 @@ async def run_custom_validation(
     Optional: validation_config (file) or validation_config_url (https:// or gs:// URI) to
     override the default validation rules. File takes priority over URL.
     """
-    custom_rules: list[dict] = []
-    if custom_rules_json:
-        try:
-            parsed = json.loads(custom_rules_json)
-            if not isinstance(parsed, list):
-                raise HTTPException(status_code=400, detail="custom_rules_json must be a JSON array")
-            err = _validate_custom_rules(parsed)
-            if err:
-                raise HTTPException(status_code=400, detail=err)
-            custom_rules = parsed
-        except json.JSONDecodeError:
-            raise HTTPException(status_code=400, detail="custom_rules_json is not valid JSON")
     return await _run_custom_validation_impl(
         request, tmcf, csv, stat_vars_mcf, stat_vars_schema_mcf, rules, llm_review, llm_model, stream=False,
         dataset_name=dataset_name, existence_checks=existence_checks, session_id=session_id,
-        custom_rules=custom_rules,
+        custom_rules=_parse_custom_rules_json(custom_rules_json),
         tmcf_gcs_path=tmcf_gcs_path, csv_gcs_paths=csv_gcs_paths,
         stat_vars_mcf_gcs_path=stat_vars_mcf_gcs_path,
         stat_vars_schema_mcf_gcs_path=stat_vars_schema_mcf_gcs_path,
@@ -1379,11 +1487,10 @@ async def run_validation(
     existence_checks: str | None = Query(None),
     validation_config_url: str | None = Query(None),
 ):
-    if dataset not in DATASET_OUTPUT_MAP:
+    canonical_output_dir = DATASET_OUTPUT_MAP.get(dataset)
+    if canonical_output_dir is None:
         raise HTTPException(status_code=404, detail="Unknown dataset")
-    script = SCRIPT_DIR / "run_e2e_test.sh"
-    if not script.exists():
-        raise HTTPException(status_code=500, detail="run_e2e_test.sh not found")
+    script = _run_script(request)
     # Config override takes full priority — ignore rule selection when set.
     if validation_config_url and validation_config_url.strip():
         run_upload_dir = OUTPUT_DIR / dataset / getattr(request.state, "request_id", "override")
@@ -1391,7 +1498,7 @@ async def run_validation(
         config_path = await _resolve_validation_config(None, validation_config_url.strip(), run_upload_dir)
     else:
         rule_ids = [x.strip() for x in (rules or "").split(",") if x.strip()] if rules else []
-        config_path = _create_filtered_config(dataset, rule_ids)
+        config_path = await asyncio.to_thread(_create_filtered_config, dataset, rule_ids)
     extra_env = _existence_checks_env(existence_checks)
     logger.info(
         "run existence_checks=%s dataset=%s request_id=%s",
@@ -1413,29 +1520,31 @@ async def run_validation(
             args.append("--no-llm-review")
             logger.info("LLM review disabled for this run")
         request_id = getattr(request.state, "request_id", "")
-        output_dir = (OUTPUT_DIR / dataset / request_id) if request_id else DATASET_OUTPUT_MAP[dataset]
-        canonical_output_dir = DATASET_OUTPUT_MAP[dataset]
+        output_dir = (OUTPUT_DIR / dataset / request_id) if request_id else canonical_output_dir
         return await _run_validation_process(
-            args, request, config_path, stream, app_root=APP_ROOT,
+            args, request, _ephemeral_config(config_path), stream, app_root=APP_ROOT,
             output_dir=output_dir, dataset=dataset, canonical_output_dir=canonical_output_dir,
             extra_env=extra_env,
         )
     except HTTPException:
         # Clean up temp config on 429 or other HTTP errors raised before the runner
         # could register its own cleanup (runner's finally is not reached on fast raises).
-        if config_path and config_path.exists():
-            config_path.unlink(missing_ok=True)
+        _discard_config(config_path)
         raise
     except Exception as e:
-        if config_path and config_path.exists():
-            config_path.unlink(missing_ok=True)
+        _discard_config(config_path)
         logger.exception("Error running validation for dataset %s", dataset)
         raise HTTPException(status_code=500, detail=str(e))
 
 
-def _run_id_safe(run_id: str) -> bool:
+# Run ids are generated server-side (request ids, "r…"/"bulk…" hex ids); anything outside this
+# allowlist (separators, "..", NUL, backslashes) is rejected before it is joined into a path.
+_RUN_ID_RE = re.compile(r"[A-Za-z0-9_-]{1,64}")
+
+
+def _run_id_safe(run_id: str | None) -> bool:
     """Reject run_id that could escape OUTPUT_DIR (path traversal)."""
-    return run_id is not None and "/" not in run_id and ".." not in run_id and "\x00" not in run_id
+    return run_id is not None and _RUN_ID_RE.fullmatch(run_id) is not None
 
 
 def _load_differ_stats_from_gcs(run_id: str, dataset: str) -> dict | None:
@@ -1485,34 +1594,88 @@ def _resolve_artifact(dataset: str, run_id: str | None, filename: str) -> bytes
     if is_gcs_configured():
         return None  # GCS is source of truth; do not fall through to local
     per_run_path = OUTPUT_DIR / dataset / run_id / filename
-    if per_run_path.exists():
-        try:
-            return per_run_path.read_bytes()
-        except OSError:
-            return None
+    try:
+        st = per_run_path.stat()
+    except OSError:
+        pass
+    else:
+        return _read_local_artifact(per_run_path, st)
     # Per-run dir was cleaned up — fall back to canonical (latest) output
     output_dir = DATASET_OUTPUT_MAP.get(dataset)
     if not output_dir:
         return None
     path = output_dir / filename
-    if not path.exists():
+    try:
+        st = path.stat()
+    except OSError:
         return None
+    return _read_local_artifact(path, st)
+
+
+# The results page fetches the same run's artifacts from several endpoints back to back
+# (validation-result, rule-failure-samples, review-summary); keep recent local reads in memory.
+# path -> (mtime_ns, size, bytes), least recently used first; a rewritten file replaces its
+# entry. Bounded by total bytes (entries for cleaned-up run dirs age out like any other);
+# files over _LOCAL_ARTIFACT_CACHE_MAX_OBJECT are never cached.
+_LOCAL_ARTIFACT_CACHE_MAX_BYTES = 32 * 1024 * 1024
+_LOCAL_ARTIFACT_CACHE_MAX_OBJECT = 4 * 1024 * 1024
+_local_artifact_cache: "OrderedDict[str, tuple[int, int, bytes]]" = OrderedDict()
+_local_artifact_cache_bytes = 0
+_local_artifact_cache_lock = threading.Lock()
+
+
+def _local_artifact_cache_clear() -> None:
+    global _local_artifact_cache_bytes
+    with _local_artifact_cache_lock:
+        _local_artifact_cache.clear()
+        _local_artifact_cache_bytes = 0
+
+
+def _read_local_artifact(path: Path, st: os.stat_result) -> bytes | None:
+    global _local_artifact_cache_bytes
+    key = str(path)
+    if st.st_size <= _LOCAL_ARTIFACT_CACHE_MAX_OBJECT:
+        with _local_artifact_cache_lock:
+            cached = _local_artifact_cache.get(key)
+            if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                _local_artifact_cache.move_to_end(key)
+                return cached[2]
     try:
-        return path.read_bytes()
+        content = path.read_bytes()
     except OSError:
         return None
+    if st.st_size > _LOCAL_ARTIFACT_CACHE_MAX_OBJECT or len(content) != st.st_size:
+        return content
+    with _local_artifact_cache_lock:
+        old = _local_artifact_cache.pop(key, None)
+        if old is not None:
+            _local_artifact_cache_bytes -= len(old[2])
+        _local_artifact_cache[key] = (st.st_mtime_ns, st.st_size, content)
+        _local_artifact_cache_bytes += len(content)
+        while _local_artifact_cache_bytes > _LOCAL_ARTIFACT_CACHE_MAX_BYTES:
+            _, (_, _, evicted) = _local_artifact_cache.popitem(last=False)
+            _local_artifact_cache_bytes -= len(evicted)
+    return content
 
 
 @app.get("/api/validation-result/{dataset}")
-def get_validation_result(dataset: str, run_id: str | None = Query(None)):
+def get_validation_result(dataset: str, request: Request, run_id: str | None = Query(None)):
     """Return per-rule validation results from validation_output.json. When GCS is configured and run_id is set, read from GCS only (no local fallback) so any instance can serve."""
     if dataset not in DATASET_OUTPUT_MAP:
         raise HTTPException(status_code=404, detail="Unknown dataset")
     raw = _resolve_artifact(dataset, run_id, "validation_output.json")
     if raw is None:
         return {"exists": False, "results": []}
+    # Well-formed output is a JSON array: splice the bytes in as-is rather than parse and re-encode.
+    # The UI fetches this URL without a cache-buster, so its revalidation gets a 304 when unchanged.
+    body = raw.strip()
+    if body.startswith(b"[") and body.endswith(b"]"):
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        if request.headers.get("if-none-match") == etag:
+            return _not_modified(etag)
+        return _json_with_etag(b'{"exists":true,"results":' + body + b"}", etag)
     try:
-        results = json.loads(raw.decode("utf-8"))
+        results = json_codec.loads(raw)
     except (json.JSONDecodeError, UnicodeDecodeError):
         return {"exists": True, "results": []}
     if not isinstance(results, list):
@@ -1520,44 +1683,63 @@ def get_validation_result(dataset: str, run_id: str | None = Query(None)):
     return {"exists": True, "results": results}
 
 
+# Gemini Review issue types that block when the issue carries no explicit severity.
+_LLM_BLOCKER_TYPES = frozenset({"typo", "schema", "naming", "unknown_statvar", "parse_error", "error"})
+
+
+def _is_llm_blocker(issue: dict) -> bool:
+    t = issue.get("type")
+    if t == "info":
+        return False
+    severity = issue.get("severity")
+    if severity == "blocker":
+        return True
+    if severity == "warning":
+        return False
+    return t in _LLM_BLOCKER_TYPES
+
+
+def _llm_issues_to_response(issues) -> dict:
+    if not isinstance(issues, list):
+        issues = [issues] if isinstance(issues, dict) else []
+    n_blockers = sum(1 for i in issues if _is_llm_blocker(i))
+    return {"exists": True, "issues": issues, "passed": n_blockers == 0, "ai_advisory_count": len(issues) - n_blockers}
+
+
 @app.get("/api/llm-report/{dataset}")
 def get_llm_report(dataset: str, run_id: str | None = Query(None)):
     """Return Gemini Review results from schema_review.json. If run_id is set and GCS is configured, use GCS."""
     if dataset not in DATASET_OUTPUT_MAP:
         raise HTTPException(status_code=404, detail="Unknown dataset")
-
-    def _issues_to_response(issues):
-        if not isinstance(issues, list):
-            issues = [issues] if isinstance(issues, dict) else []
-        def is_blocker(i):
-            t = i.get("type")
-            if t in ("info",):
-                return False
-            s = i.get("severity")
-            if s == "blocker":
-                return True
-            if s == "warning":
-                return False
-            return t in ("typo", "schema", "naming", "unknown_statvar", "parse_error", "error")
-        blockers = [i for i in issues if is_blocker(i)]
-        ai_advisory_count = len(issues) - len(blockers)
-        return {"exists": True, "issues": issues, "passed": len(blockers) == 0, "ai_advisory_count": ai_advisory_count}
-
     raw = _resolve_artifact(dataset, run_id, "schema_review.json")
     if raw is None:
         return {"exists": False, "issues": [], "passed": True, "ai_advisory_count": 0}
     try:
-        issues = json.loads(raw.decode("utf-8"))
+        issues = json_codec.loads(raw)
     except (json.JSONDecodeError, UnicodeDecodeError):
         return {"exists": True, "issues": [], "passed": False, "ai_advisory_count": 0}
-    return _issues_to_response(issues)
+    return _llm_issues_to_response(issues)
 
 
 @app.get("/api/report-info/{dataset}")
-def report_info(dataset: str, run_id: str | None = Query(None)):
-    """Return report metadata including mtime. When GCS is configured and run_id is set, use GCS only (validation_report.html or schema_review.json mtime) so any instance can serve."""
+def report_info(dataset: str, request: Request, run_id: str | None = Query(None)):
+    """Return report metadata including mtime. When GCS is configured and run_id is set, use GCS only (validation_report.html or schema_review.json mtime) so any instance can serve.
+
+    Found reports carry ETag W/"<mtime>" with Cache-Control: no-cache; the UI polls without a
+    cache-buster, so its revalidations get a 304 until the report changes.
+    """
     if dataset not in DATASET_OUTPUT_MAP:
         raise HTTPException(status_code=404, detail="Unknown dataset")
+    info = _report_info(dataset, run_id)
+    if not info["exists"]:
+        return info
+    etag = f'W/"{info["mtime"]}"'
+    if request.headers.get("if-none-match") == etag:
+        return _not_modified(etag)
+    return _json_with_etag(json_codec.dumps_bytes(info), etag)
+
+
+def _report_info(dataset: str, run_id: str | None) -> dict:
     if not run_id or not _run_id_safe(run_id):
         return {"exists": False}
     if is_gcs_configured():
@@ -1570,17 +1752,18 @@ def report_info(dataset: str, run_id: str | None = Query(None)):
     mtime = gcs_reports.get_report_updated_from_gcs(run_id, dataset, "validation_report.html")
     if mtime is not None:
         return {"exists": True, "mtime": mtime}
+    # One stat() per candidate; a missing file is FileNotFoundError, not a separate exists() call.
     per_run = OUTPUT_DIR / dataset / run_id
-    for name in ("validation_report.html", "schema_review.json"):
-        p = per_run / name
-        if p.exists():
-            return {"exists": True, "mtime": p.stat().st_mtime}
-    # Per-run dir was cleaned up — fall back to canonical
-    output_dir = DATASET_OUTPUT_MAP[dataset]
-    path = output_dir / "validation_report.html"
-    if not path.exists():
-        return {"exists": False}
-    return {"exists": True, "mtime": path.stat().st_mtime}
+    for path in (
+        per_run / "validation_report.html",
+        per_run / "schema_review.json",
+        DATASET_OUTPUT_MAP[dataset] / "validation_report.html",  # per-run dir was cleaned up
+    ):
+        try:
+            return {"exists": True, "mtime": os.stat(path).st_mtime}
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+    return {"exists": False}
 
 
 def _get_fluctuation_samples_internal(dataset: str, run_id: str | None) -> tuple[bool, list]:
@@ -1591,7 +1774,7 @@ def _get_fluctuation_samples_internal(dataset: str, run_id: str | None) -> tuple
     if raw is None:
         return False, []
     try:
-        report = json.loads(raw.decode("utf-8"))
+        report = json_codec.loads(raw)
     except (json.JSONDecodeError, UnicodeDecodeError):
         return True, []
     return True, _extract_fluctuation_samples(report)
@@ -1605,7 +1788,7 @@ def _get_lint_warnings_internal(dataset: str, run_id: str | None) -> tuple[bool,
     if raw is None:
         return False, []
     try:
-        report = json.loads(raw.decode("utf-8"))
+        report = json_codec.loads(raw)
     except (json.JSONDecodeError, UnicodeDecodeError):
         return True, []
     if not report:
@@ -1649,7 +1832,7 @@ def _get_lint_errors_internal(dataset: str, run_id: str | None) -> tuple[bool, l
     if raw is None:
         return False, []
     try:
-        report = json.loads(raw)
+        report = json_codec.loads(raw)
     except (json.JSONDecodeError, UnicodeDecodeError):
         return True, []
     if not report:
@@ -1777,7 +1960,8 @@ def get_rule_failure_samples(dataset: str, run_id: str | None = Query(None)):
     configured, use GCS; else local per-run then canonical (with enrichment when report.json/input.csv
     are present). Artifact resolution uses _resolve_artifact; enrichment source is determined separately
     because it requires a directory or raw GCS bytes depending on the storage tier."""
-    if dataset not in DATASET_OUTPUT_MAP:
+    canonical_dir = DATASET_OUTPUT_MAP.get(dataset)
+    if canonical_dir is None:
         raise HTTPException(status_code=404, detail="Unknown dataset")
 
     # --- Step 1: resolve validation_output.json via the shared helper ---
@@ -1785,7 +1969,7 @@ def get_rule_failure_samples(dataset: str, run_id: str | None = Query(None)):
     if raw_vo is None:
         return {"exists": False, "samples": []}
     try:
-        results = json.loads(raw_vo.decode("utf-8"))
+        results = json_codec.loads(raw_vo)
     except (json.JSONDecodeError, UnicodeDecodeError):
         return {"exists": True, "samples": []}
     if not isinstance(results, list):
@@ -1797,21 +1981,16 @@ def get_rule_failure_samples(dataset: str, run_id: str | None = Query(None)):
     # without enrichment. The enrichment source mirrors the storage tier that _resolve_artifact
     # used: GCS when configured with a valid run_id, local per-run dir otherwise, or canonical.
     if run_id and _run_id_safe(run_id):
-        raw_report = gcs_reports.get_report_from_gcs(run_id, dataset, "report.json")
-        raw_csv = gcs_reports.get_report_from_gcs(run_id, dataset, "input.csv")
-        if raw_report is not None and raw_csv is not None:
-            # GCS path: write CSV to a temp dir so enrich_rule_failure_samples can read it
-            try:
-                report = json.loads(raw_report.decode("utf-8"))
-                with tempfile.TemporaryDirectory(prefix="gcs_rule_failure_") as tmp:
-                    tmp_path = Path(tmp)
-                    (tmp_path / "input.csv").write_bytes(raw_csv)
-                    report["commandArgs"] = report.get("commandArgs") or {}
-                    report["commandArgs"]["inputFiles"] = [str(tmp_path / "input.csv")]
-                    (tmp_path / "report.json").write_text(json.dumps(report), encoding="utf-8")
-                    enrich_rule_failure_samples(samples, tmp_path, results)
-            except (json.JSONDecodeError, UnicodeDecodeError, OSError):
-                pass
+        # report.json is only needed locally, to find the input CSV; in GCS it is input.csv.
+        # Skip the (possibly large) download when no sample can be matched to a CSV row.
+        raw_csv = (
+            gcs_reports.get_report_from_gcs(run_id, dataset, "input.csv")
+            if needs_csv_enrichment(samples)
+            else None
+        )
+        if raw_csv is not None:
+            # GCS path: match rows straight from the downloaded bytes (no temp files).
+            enrich_rule_failure_samples_from_bytes(samples, raw_csv, results)
         elif not is_gcs_configured():
             # Local path: enrich directly from the per-run output directory if it exists
             per_run_dir = OUTPUT_DIR / dataset / run_id
@@ -1820,9 +1999,9 @@ def get_rule_failure_samples(dataset: str, run_id: str | None = Query(None)):
             else:
                 # Per-run dir absent (e.g. _resolve_artifact fell back to canonical).
                 # Enrich from canonical so callers always get the best available data.
-                enrich_rule_failure_samples(samples, DATASET_OUTPUT_MAP[dataset], results)
+                enrich_rule_failure_samples(samples, canonical_dir, results)
     else:
-        enrich_rule_failure_samples(samples, DATASET_OUTPUT_MAP[dataset], results)
+        enrich_rule_failure_samples(samples, canonical_dir, results)
 
     return {"exists": True, "samples": samples}
 
@@ -1841,7 +2020,7 @@ def get_config_errors(dataset: str, run_id: str | None = Query(None)):
     if raw is None:
         return {"exists": False, "errors": []}
     try:
-        results = json.loads(raw.decode("utf-8"))
+        results = json_codec.loads(raw)
     except (json.JSONDecodeError, UnicodeDecodeError):
         return {"exists": True, "errors": []}
     if not isinstance(results, list):
@@ -1938,7 +2117,7 @@ def _context_from_artifacts(
     statvars: set[str] = set()
     if report_json_bytes:
         try:
-            rj = json.loads(report_json_bytes.decode("utf-8"))
+            rj = json_codec.loads(report_json_bytes)
             for item in (rj.get("statsCheckSummary") or []):
                 sv = (item.get("statVarDcid") or "").strip()
                 if sv:
@@ -1953,7 +2132,7 @@ def _context_from_artifacts(
     vo_statvars: set[str] = set()
     if validation_output_bytes:
         try:
-            vo_results = json.loads(validation_output_bytes.decode("utf-8"))
+            vo_results = json_codec.loads(validation_output_bytes)
             _DATE_RULES = frozenset({"check_max_date_latest", "check_max_date_consistent"})
             if isinstance(vo_results, list):
                 for r in vo_results:
@@ -3278,24 +3457,50 @@ async def preview_sql_rule(body: _PreviewSqlRuleRequest):
 
 
 @app.get("/api/review-summary/{dataset}")
-def get_review_summary(dataset: str, format: str | None = Query(None), run_id: str | None = Query(None), baseline_id: str | None = Query(None)):
-    """Return combined review summary (validation + Gemini + fluctuation + rule failures). If run_id is set and GCS configured, use GCS."""
+async def get_review_summary(request: Request, dataset: str, format: str | None = Query(None), run_id: str | None = Query(None), baseline_id: str | None = Query(None)):
+    """Return combined review summary (validation + Gemini + fluctuation + rule failures). If run_id is set and GCS configured, use GCS.
+
+    The ETag is a hash of the response body and the UI fetches without a cache-buster, so an
+    unchanged summary is answered with 304 and its body is not sent again.
+    """
     if dataset not in DATASET_OUTPUT_MAP:
         raise HTTPException(status_code=404, detail="Unknown dataset")
+    raw: tuple[bytes | None, ...] = (None, None, None)
+    if run_id and _run_id_safe(run_id):
+        # The three artifacts are independent: fetch them concurrently (one round-trip, not three).
+        raw = tuple(await asyncio.gather(*(
+            asyncio.to_thread(gcs_reports.get_report_from_gcs, run_id, dataset, name)
+            for name in ("validation_output.json", "schema_review.json", "report.json")
+        )))
+    return await asyncio.to_thread(
+        _review_summary_response, dataset, format, run_id, baseline_id, *raw,
+        if_none_match=request.headers.get("if-none-match"),
+    )
+
+
+def _review_summary_response(
+    dataset: str,
+    format: str | None,
+    run_id: str | None,
+    baseline_id: str | None,
+    raw_vo: bytes | None,
+    raw_llm: bytes | None,
+    raw_report: bytes | None,
+    if_none_match: str | None = None,
+):
+    """Build the /api/review-summary response from the run's GCS artifacts (None when absent),
+    falling back to local per-run/canonical output. Blocking: called via asyncio.to_thread."""
     data = None
     if run_id and _run_id_safe(run_id):
-        raw_vo = gcs_reports.get_report_from_gcs(run_id, dataset, "validation_output.json")
-        raw_llm = gcs_reports.get_report_from_gcs(run_id, dataset, "schema_review.json")
-        raw_report = gcs_reports.get_report_from_gcs(run_id, dataset, "report.json")
         if raw_vo is not None:
             try:
-                results = json.loads(raw_vo.decode("utf-8"))
+                results = json_codec.loads(raw_vo)
                 if not isinstance(results, list):
                     results = []
                 llm_issues = []
                 if raw_llm is not None:
                     try:
-                        llm_issues = json.loads(raw_llm.decode("utf-8"))
+                        llm_issues = json_codec.loads(raw_llm)
                         if not isinstance(llm_issues, list):
                             llm_issues = [llm_issues] if isinstance(llm_issues, dict) else []
                     except (json.JSONDecodeError, UnicodeDecodeError):
@@ -3303,7 +3508,7 @@ def get_review_summary(dataset: str, format: str | None = Query(None), run_id: s
                 report = None
                 if raw_report is not None:
                     try:
-                        report = json.loads(raw_report.decode("utf-8"))
+                        report = json_codec.loads(raw_report)
                     except (json.JSONDecodeError, UnicodeDecodeError):
                         pass
                 data = _build_review_summary_from_data(dataset, results, llm_issues, report)
@@ -3355,14 +3560,26 @@ def get_review_summary(dataset: str, format: str | None = Query(None), run_id: s
         # When run_id is None, do not read canonical artifacts — caller has no run yet
     if data is None:
         raise HTTPException(status_code=404, detail="No validation result. Run validation first.")
+    # The summary also depends on baseline manifests and differ output, so the validator is
+    # derived from the built body rather than from the source artifacts.
+    if format and format.lower() == "md":
+        body = _review_summary_to_markdown(data).encode("utf-8")
+    else:
+        body = json_codec.dumps_bytes(data)
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    if if_none_match == etag:
+        return _not_modified(etag)
     if format and format.lower() == "md":
-        md = _review_summary_to_markdown(data)
         return Response(
-            content=md,
+            content=body,
             media_type="text/markdown",
-            headers={"Content-Disposition": f'attachment; filename="review_summary_{dataset}.md"'},
+            headers={
+                "Content-Disposition": f'attachment; filename="review_summary_{dataset}.md"',
+                "ETag": etag,
+                "Cache-Control": "no-cache",
+            },
         )
-    return data
+    return _json_with_etag(body, etag)
 
 
 @app.get("/report/{dataset}/{run_id}", response_class=HTMLResponse)
@@ -3372,6 +3589,12 @@ def serve_report_by_run_id(dataset: str, run_id: str):
         raise HTTPException(status_code=404, detail="Unknown dataset")
     if not _run_id_safe(run_id):
         raise HTTPException(status_code=400, detail="Invalid run_id")
+    # Rewrite "View full import tool report" link to be run-specific so it works from any instance.
+    # generate_html_report.py only injects this link when summary_report.html exists, so we only
+    # replace the exact href format below (no accidental match of other URLs).
+    # Escape dataset/run_id for HTML so URL path params cannot break the attribute (XSS).
+    old_link = _SUMMARY_LINK_BY_DATASET[dataset]
+    headers = {"Cache-Control": "no-cache, no-store, must-revalidate", "Pragma": "no-cache"}
     content = gcs_reports.get_report_from_gcs(run_id, dataset, "validation_report.html")
     if content is None:
         if is_gcs_configured():
@@ -3380,42 +3603,65 @@ def serve_report_by_run_id(dataset: str, run_id: str):
                 detail="Report not found. It may not have been uploaded to GCS yet.",
             )
         per_run_path = OUTPUT_DIR / dataset / run_id / "validation_report.html"
-        if per_run_path.exists():
-            content = per_run_path.read_bytes()
-        else:
+        try:
+            with per_run_path.open("rb") as f:
+                st = os.fstat(f.fileno())
+                # Search the mapped file instead of reading it: only a report that contains the
+                # link needs to be loaded into memory; otherwise it is sent as-is from disk.
+                has_link = st.st_size > 0 and _mmap_contains(f, old_link)
+        except (FileNotFoundError, NotADirectoryError):
             raise HTTPException(
                 status_code=404,
                 detail="Report not found. It may not have been uploaded to GCS yet, or GCS is not configured.",
             )
-    # Rewrite "View full import tool report" link to be run-specific so it works from any instance.
-    # generate_html_report.py only injects this link when summary_report.html exists, so we only
-    # replace the exact href format below (no accidental match of other URLs).
-    # Escape dataset/run_id for HTML so URL path params cannot break the attribute (XSS).
-    safe_dataset = html.escape(dataset, quote=True)
-    safe_run_id = html.escape(run_id, quote=True)
-    old_link = b'href="/summary-report/' + dataset.encode("utf-8") + b'"'
-    new_link = ('href="/summary-report/' + safe_dataset + "/" + safe_run_id + '"').encode("utf-8")
-    if old_link in content:
-        content = content.replace(old_link, new_link, 1)
-    return HTMLResponse(
-        content=content,
-        headers={"Cache-Control": "no-cache, no-store, must-revalidate", "Pragma": "no-cache"},
-    )
+        if not has_link:
+            return FileResponse(per_run_path, media_type="text/html", headers=headers, stat_result=st)
+        content = per_run_path.read_bytes()
+    idx = content.find(old_link)
+    if idx >= 0:
+        safe_dataset = html.escape(dataset, quote=True)
+        safe_run_id = html.escape(run_id, quote=True)
+        new_link = ('href="/summary-report/' + safe_dataset + "/" + safe_run_id + '"').encode("utf-8")
+        content = b"".join((content[:idx], new_link, content[idx + len(old_link):]))
+    return HTMLResponse(content=content, headers=headers)
+
+
+def _mmap_contains(f, needle: bytes) -> bool:
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return mm.find(needle) >= 0
+
+
+def _html_file_response(request: Request, path: Path, missing_detail: str) -> Response:
+    """FileResponse for a local report with validators, answering conditional GETs with 304.
+
+    Cache-Control: no-cache (not no-store) lets the browser keep the page but revalidate it on
+    every load, so an unchanged multi-MB report costs a header exchange instead of a download.
+    """
+    try:
+        st = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        raise HTTPException(status_code=404, detail=missing_detail)
+    last_modified = formatdate(st.st_mtime, usegmt=True)
+    etag = f'W/"{st.st_mtime_ns}-{st.st_size}"'
+    headers = {"ETag": etag, "Last-Modified": last_modified, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        not_modified = if_none_match == etag
+    else:
+        not_modified = request.headers.get("if-modified-since") == last_modified
+    if not_modified:
+        return Response(status_code=304, headers=headers)
+    return FileResponse(path, media_type="text/html", headers=headers, stat_result=st)
 
 
 @app.get("/report/{dataset}")
-def serve_report(dataset: str):
+def serve_report(dataset: str, request: Request):
     """Serve validation report from local disk (latest run for this dataset)."""
-    if dataset not in DATASET_OUTPUT_MAP:
+    output_dir = DATASET_OUTPUT_MAP.get(dataset)
+    if output_dir is None:
         raise HTTPException(status_code=404, detail="Unknown dataset")
-    output_dir = DATASET_OUTPUT_MAP[dataset]
-    path = output_dir / "validation_report.html"
-    if not path.exists():
-        raise HTTPException(status_code=404, detail="No report yet. Run validation first.")
-    return FileResponse(
-        path,
-        media_type="text/html",
-        headers={"Cache-Control": "no-cache, no-store, must-revalidate", "Pragma": "no-cache"},
+    return _html_file_response(
+        request, output_dir / "validation_report.html", "No report yet. Run validation first."
     )
 
 
@@ -3470,9 +3716,9 @@ def serve_warnings_csv_by_run_id(dataset: str, run_id: str):
 @app.get("/report/{dataset}/validation_warnings_and_advisories.csv")
 def serve_warnings_csv(dataset: str):
     """Serve warnings/advisories CSV from local disk (latest run for this dataset)."""
-    if dataset not in DATASET_OUTPUT_MAP:
+    output_dir = DATASET_OUTPUT_MAP.get(dataset)
+    if output_dir is None:
         raise HTTPException(status_code=404, detail="Unknown dataset")
-    output_dir = DATASET_OUTPUT_MAP[dataset]
     path = output_dir / _CSV_FILENAME
     if not path.exists():
         raise HTTPException(status_code=404, detail="Warnings CSV not found. Run validation first.")
@@ -3514,6 +3760,9 @@ def serve_summary_report_by_run_id(dataset: str, run_id: str):
     """Serve summary_report.html from GCS when configured (any instance); otherwise local per-run."""
     if dataset not in DATASET_OUTPUT_MAP:
         raise HTTPException(status_code=404, detail="Unknown dataset")
+    if not _run_id_safe(run_id):
+        raise HTTPException(status_code=400, detail="Invalid run_id")
+    headers = {"Cache-Control": "no-cache, no-store, must-revalidate", "Pragma": "no-cache"}
     content = gcs_reports.get_report_from_gcs(run_id, dataset, "summary_report.html")
     if content is None:
         if is_gcs_configured():
@@ -3522,32 +3771,25 @@ def serve_summary_report_by_run_id(dataset: str, run_id: str):
                 detail="Summary report not found. It may not have been uploaded to GCS yet.",
             )
         per_run_path = OUTPUT_DIR / dataset / run_id / "summary_report.html"
-        if per_run_path.exists():
-            content = per_run_path.read_bytes()
-        else:
+        try:
+            st = per_run_path.stat()
+        except (FileNotFoundError, NotADirectoryError):
             raise HTTPException(
                 status_code=404,
                 detail="Summary report not found. It may not have been uploaded to GCS yet.",
             )
-    return HTMLResponse(
-        content=content,
-        headers={"Cache-Control": "no-cache, no-store, must-revalidate", "Pragma": "no-cache"},
-    )
+        return FileResponse(per_run_path, media_type="text/html", headers=headers, stat_result=st)
+    return HTMLResponse(content=content, headers=headers)
 
 
 @app.get("/summary-report/{dataset}")
-def serve_summary_report(dataset: str):
+def serve_summary_report(dataset: str, request: Request):
     """Serve the import tool's summary_report.html from local disk (latest run)."""
-    if dataset not in DATASET_OUTPUT_MAP:
+    output_dir = DATASET_OUTPUT_MAP.get(dataset)
+    if output_dir is None:
         raise HTTPException(status_code=404, detail="Unknown dataset")
-    output_dir = DATASET_OUTPUT_MAP[dataset]
-    path = output_dir / "summary_report.html"
-    if not path.exists():
-        raise HTTPException(status_code=404, detail="No JAR summary report. Run validation first.")
-    return FileResponse(
-        path,
-        media_type="text/html",
-        headers={"Cache-Control": "no-cache, no-store, must-revalidate", "Pragma": "no-cache"},
+    return _html_file_response(
+        request, output_dir / "summary_report.html", "No JAR summary report. Run validation first."
     )
 
 
@@ -4141,23 +4383,21 @@ async def _execute_batch_job_submission(body: _SubmitJobRequest) -> dict:
     elif body.custom_rules or body.rules:
         dataset_key = dataset if dataset in DATASET_CONFIG_MAP else "custom"
         rule_ids = [x.strip() for x in body.rules.split(",") if x.strip()] if body.rules else []
-        _merged_tmp = _create_merged_config(dataset_key, rule_ids, body.custom_rules)
-        _merged_tmp_path = _merged_tmp  # may be None
-        if _merged_tmp:
+        _merged_config = _create_merged_config(dataset_key, rule_ids, body.custom_rules)
+        if _merged_config:
             logger.info(
                 "submit_batch_job: uploading merged config to GCS run_id=%s custom_rule_count=%d",
                 run_id, len(body.custom_rules),
             )
             try:
                 merged_config_gcs_path = await asyncio.to_thread(
-                    gcs_reports.upload_merged_config_to_gcs, run_id, _merged_tmp
+                    gcs_reports.upload_merged_config_to_gcs, run_id, _merged_config
                 )
             except Exception as exc:
                 logger.error("upload_merged_config_to_gcs failed run_id=%s: %s", run_id, exc)
                 raise HTTPException(status_code=500, detail=f"Failed to upload merged config to GCS: {exc}")
             finally:
-                if _merged_tmp_path and _merged_tmp_path.exists():
-                    _merged_tmp_path.unlink()
+                _discard_config(_merged_config)
 
             # Fail fast if GCS is not configured — Batch VMs cannot download the config
             # without a GCS path, so custom rules would be silently skipped.
@@ -4626,7 +4866,8 @@ async def _batch_run_html_report(run_id: str) -> HTMLResponse:
     _dataset, content = await _resolve_batch_run_report(run_id)
     if content is None:
         raise HTTPException(status_code=404, detail=_REPORT_NOT_READY_DETAIL)
-    return HTMLResponse(content=content.decode("utf-8", errors="replace"))
+    # Sent as the stored bytes (declared charset=utf-8); no decode/re-encode round trip.
+    return HTMLResponse(content=content)
 
 
 async def _batch_run_report_head(run_id: str) -> Response:
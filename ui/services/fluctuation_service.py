@@ -1,5 +1,7 @@
 """Fluctuation sample extraction (from report.json) and optional Gemini interpretation."""
 
+import atexit
+import functools
 import json
 import logging
 import os
@@ -45,6 +47,21 @@ def get_gemini_api_key() -> str | None:
     return os.environ.get("GEMINI_API_KEY") or os.environ.get("GOOGLE_API_KEY")
 
 
+@functools.lru_cache(maxsize=4)
+def _gemini_client(api_key: str):
+    """google-genai Client for api_key, reused across interpretations (keeps its HTTPS connection
+    pool warm). None when google-genai is not installed."""
+    try:
+        from google import genai
+    except ImportError:
+        return None
+    client = genai.Client(api_key=api_key)
+    # Older google-genai releases have no close().
+    if hasattr(client, "close"):
+        atexit.register(client.close)
+    return client
+
+
 def interpret_fluctuation(
     stat_var: str,
     location: str,
@@ -59,11 +76,9 @@ def interpret_fluctuation(
     api_key = get_gemini_api_key()
     if not api_key:
         return None
-    try:
-        from google import genai
-    except ImportError:
+    client = _gemini_client(api_key)
+    if client is None:
         return None
-    client = genai.Client(api_key=api_key)
     ts = json.dumps(technical_signals, indent=2) if technical_signals else "{}"
     pct = f"{percent_change:+.2f}%" if percent_change is not None else "N/A"
     freq_label = _observation_frequency_label(observation_period)
@@ -2,6 +2,8 @@
 
 import json
 import sys
+import threading
+from collections import Counter, OrderedDict
 from pathlib import Path
 
 try:
@@ -14,6 +16,7 @@ _APP_ROOT = Path(__file__).resolve().parent.parent.parent
 if str(_APP_ROOT) not in sys.path:
     sys.path.insert(0, str(_APP_ROOT))
 
+from scripts import json_codec
 from scripts.fluctuation_utils import extract_fluctuation_samples as _extract_fluctuation_samples
 
 from ui.services.rule_samples import enrich_rule_failure_samples, extract_rule_failure_samples
@@ -30,8 +33,7 @@ def _load_differ_stats(output_dir: Path, baseline_id: str | None = None) -> dict
 
     if summary_path.exists():
         try:
-            with open(summary_path, encoding="utf-8") as f:
-                raw = json.load(f)
+            raw = json_codec.loads(summary_path.read_bytes())
             if isinstance(raw, dict):
                 for key in ("previous_obs_size", "current_obs_size", "obs_diff_size"):
                     if key in raw:
@@ -107,8 +109,7 @@ def _load_differ_stats(output_dir: Path, baseline_id: str | None = None) -> dict
         manifest_path = _APP_ROOT / "output" / "baselines" / baseline_id / "latest" / "manifest.json"
         if manifest_path.exists():
             try:
-                with open(manifest_path, encoding="utf-8") as f:
-                    manifest = json.load(f)
+                manifest = json_codec.loads(manifest_path.read_bytes())
                 if "updated_at" in manifest:
                     stats["baseline_updated_at"] = manifest["updated_at"]
                 if "version" in manifest:
@@ -123,6 +124,12 @@ def _load_differ_stats(output_dir: Path, baseline_id: str | None = None) -> dict
     return stats if stats else None
 
 
+def _count_statuses(results: list) -> tuple[int, int, int]:
+    """(FAILED, WARNING, PASSED) counts in one pass over the validation results."""
+    counts = Counter([r.get("status") for r in results])
+    return counts["FAILED"], counts["WARNING"], counts["PASSED"]
+
+
 def build_review_summary_from_data(
     dataset: str,
     validation_results: list,
@@ -131,12 +138,7 @@ def build_review_summary_from_data(
 ) -> dict:
     """Build review summary from in-memory data (e.g. from GCS). No CSV enrichment for rule failures."""
     results = validation_results if isinstance(validation_results, list) else []
-    blockers = [r for r in results if r.get("status") == "FAILED"]
-    warnings = [r for r in results if r.get("status") == "WARNING"]
-    passed = [r for r in results if r.get("status") == "PASSED"]
-    n_blockers = len(blockers)
-    n_warnings = len(warnings)
-    n_passed = len(passed)
+    n_blockers, n_warnings, n_passed = _count_statuses(results)
     if n_blockers > 0:
         overall = "FAIL"
     elif n_warnings > 0:
@@ -166,25 +168,80 @@ def build_review_summary_from_data(
     }
 
 
+# Recently built local summaries, keyed on the stat signatures of every file they read.
+_SUMMARY_CACHE: OrderedDict[tuple, dict] = OrderedDict()
+_SUMMARY_CACHE_MAX = 16
+_SUMMARY_CACHE_LOCK = threading.Lock()
+
+
+def _stat_key(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _summary_cache_key(dataset: str, output_dir: Path) -> tuple:
+    """Signature of the files build_review_summary reads. The input CSV is not stat'ed: it is
+    named by report.json, which is rewritten whenever the run that produced it is redone."""
+    paths = [
+        output_dir / name
+        for name in (
+            "validation_output.json",
+            "schema_review.json",
+            "report.json",
+            "summary_report.csv",
+            "differ_output/differ_summary.json",
+            "differ_output/obs_diff_summary.csv",
+        )
+    ]
+    baselines_dir = _APP_ROOT / "output" / "baselines"
+    paths.append(baselines_dir / dataset / "latest" / "manifest.json")
+    try:
+        recorded = json_codec.loads((output_dir / "differ_output" / "differ_summary.json").read_bytes())
+    except (json.JSONDecodeError, OSError):
+        recorded = None
+    if isinstance(recorded, dict) and recorded.get("dataset_id"):
+        # _load_differ_stats reads this baseline's manifest instead (custom datasets).
+        paths.append(baselines_dir / str(recorded["dataset_id"]) / "latest" / "manifest.json")
+    return (dataset, str(output_dir), *(_stat_key(p) for p in paths))
+
+
 def build_review_summary(dataset: str, output_dir: Path) -> dict | None:
-    """Build combined review summary from validation_output, llm_review, report.json. Returns None if no validation result."""
+    """Build combined review summary from validation_output, llm_review, report.json. Returns None if no validation result.
+
+    Results are cached until one of the source files changes; callers must not mutate the returned dict.
+    """
+    key = _summary_cache_key(dataset, output_dir)
+    if key[2] is None:  # no validation_output.json
+        return None
+    with _SUMMARY_CACHE_LOCK:
+        data = _SUMMARY_CACHE.get(key)
+        if data is not None:
+            _SUMMARY_CACHE.move_to_end(key)
+            return data
+    data = _build_review_summary(dataset, output_dir)
+    if data is not None:
+        with _SUMMARY_CACHE_LOCK:
+            _SUMMARY_CACHE[key] = data
+            while len(_SUMMARY_CACHE) > _SUMMARY_CACHE_MAX:
+                _SUMMARY_CACHE.popitem(last=False)
+    return data
+
+
+def _build_review_summary(dataset: str, output_dir: Path) -> dict | None:
     path = output_dir / "validation_output.json"
     if not path.exists():
         return None
     try:
-        with open(path, encoding="utf-8") as f:
-            results = json.load(f)
+        results = json_codec.loads(path.read_bytes())
     except (json.JSONDecodeError, OSError):
         return None
     if not isinstance(results, list):
         results = []
 
-    blockers = [r for r in results if r.get("status") == "FAILED"]
-    warnings = [r for r in results if r.get("status") == "WARNING"]
-    passed = [r for r in results if r.get("status") == "PASSED"]
-    n_blockers = len(blockers)
-    n_warnings = len(warnings)
-    n_passed = len(passed)
+    n_blockers, n_warnings, n_passed = _count_statuses(results)
 
     if n_blockers > 0:
         overall = "FAIL"
@@ -197,8 +254,7 @@ def build_review_summary(dataset: str, output_dir: Path) -> dict | None:
     llm_path = output_dir / "schema_review.json"
     if llm_path.exists():
         try:
-            with open(llm_path, encoding="utf-8") as f:
-                data = json.load(f)
+            data = json_codec.loads(llm_path.read_bytes())
             llm_issues = data if isinstance(data, list) else []
         except (json.JSONDecodeError, OSError):
             pass
@@ -207,14 +263,13 @@ def build_review_summary(dataset: str, output_dir: Path) -> dict | None:
     report_path = output_dir / "report.json"
     if report_path.exists():
         try:
-            with open(report_path, encoding="utf-8") as f:
-                report = json.load(f)
+            report = json_codec.loads(report_path.read_bytes())
         except (json.JSONDecodeError, OSError):
             pass
 
     fluctuation_samples = _extract_fluctuation_samples(report) if report else []
     rule_failure_samples = extract_rule_failure_samples(results)
-    enrich_rule_failure_samples(rule_failure_samples, output_dir, results)
+    enrich_rule_failure_samples(rule_failure_samples, output_dir, results, report)
     differ_stats = _load_differ_stats(output_dir, baseline_id=dataset)
 
     return {
@@ -249,28 +304,28 @@ def review_summary_to_markdown(data: dict) -> str:
         "",
     ]
     s = data.get("summary") or {}
-    for k, v in s.items():
-        lines.append(f"- **{k}:** {v}")
+    lines.extend([f"- **{k}:** {v}" for k, v in s.items()])
     lines.extend(["", "## Validation Result", ""])
-    for r in data.get("validation_result") or []:
-        status = r.get("status", "?")
-        name = r.get("validation_name", "?")
-        msg = (r.get("message") or "")[:80]
-        lines.append(f"- [{status}] {name}: {msg}")
+    lines.extend([
+        f"- [{r.get('status', '?')}] {r.get('validation_name', '?')}: {(r.get('message') or '')[:80]}"
+        for r in data.get("validation_result") or []
+    ])
     lines.extend(["", "## Gemini Review", ""])
-    for i in data.get("ai_review") or []:
-        sev = i.get("severity", "?")
-        typ = i.get("type", "?")
-        msg = (i.get("message") or "")[:80]
-        lines.append(f"- [{sev}] {typ}: {msg}")
+    lines.extend([
+        f"- [{i.get('severity', '?')}] {i.get('type', '?')}: {(i.get('message') or '')[:80]}"
+        for i in data.get("ai_review") or []
+    ])
     lines.extend(["", "## Fluctuation Analysis", ""])
-    for f in data.get("fluctuation_samples") or []:
-        lines.append(f"- {f.get('statVar', '—')} @ {f.get('location', '—')}: {f.get('percentDifference')}%")
+    lines.extend([
+        f"- {f.get('statVar', '—')} @ {f.get('location', '—')}: {f.get('percentDifference')}%"
+        for f in data.get("fluctuation_samples") or []
+    ])
     if not data.get("fluctuation_samples"):
         lines.append("- No significant fluctuations.")
     lines.extend(["", "## Blocking Rule Failures", ""])
-    for r in data.get("rule_failure_samples") or []:
-        lines.append(f"- {r.get('rule', '—')}: {r.get('message', '')[:60]}")
+    lines.extend([
+        f"- {r.get('rule', '—')}: {(r.get('message') or '')[:60]}" for r in data.get("rule_failure_samples") or []
+    ])
     if not data.get("rule_failure_samples"):
         lines.append("- No rule failures.")
     return "\n".join(lines)
@@ -12,44 +12,89 @@ Adding a new SQL_VALIDATOR rule to new_import_config.json requires no changes he
 """
 
 import csv
+import io
 import json
+import re
+from collections.abc import Iterable
+from functools import lru_cache
 from pathlib import Path
 
+from scripts import json_codec
 
-def get_csv_path(output_dir: Path) -> Path | None:
-    """Get input CSV path from report.json commandArgs.inputFiles. Returns None if not found."""
-    try:
+
+def get_csv_path(output_dir: Path, report: dict | None = None) -> Path | None:
+    """Get input CSV path from report.json commandArgs.inputFiles. Returns None if not found.
+
+    Pass report when the caller has already parsed report.json, to skip reading it again.
+    """
+    if report is None:
         path = output_dir / "report.json"
-        if not path.exists():
+        try:
+            st = path.stat()
+            input_files = _report_input_files(str(path), st.st_mtime_ns, st.st_size)
+        except (json.JSONDecodeError, OSError, TypeError, AttributeError):
+            return None
+    else:
+        try:
+            input_files = _input_files(report)
+        except (TypeError, AttributeError):
             return None
-        with open(path, encoding="utf-8") as f:
-            report = json.load(f)
-        args = report.get("commandArgs") or {}
-        for p in args.get("inputFiles") or []:
-            if str(p).lower().endswith(".csv"):
-                fp = Path(p)
-                if fp.exists():
-                    return fp
-        return None
-    except (json.JSONDecodeError, OSError, TypeError):
-        return None
-
-
-def _stat_var_matches(csv_val: str, stat_var: str) -> bool:
-    """Match CSV variableMeasured/StatVar to validation stat_var (e.g. dcid:Count_X vs Count_X)."""
-    if not stat_var or csv_val is None:
-        return False
-    csv_val = str(csv_val).strip()
-    stat_var = str(stat_var).strip()
-    return csv_val == stat_var or csv_val.endswith(":" + stat_var) or csv_val.endswith("/" + stat_var)
-
-
-def _row_val_float(row: dict, key_candidates: list[str]) -> float | None:
-    """Get first present key's value as float."""
-    for k in key_candidates:
-        if k in row and row[k] is not None and str(row[k]).strip() != "":
+    for p in input_files:
+        if p.lower().endswith(".csv"):
+            fp = Path(p)
+            if fp.exists():
+                return fp
+    return None
+
+
+def _input_files(report: dict) -> tuple[str, ...]:
+    args = report.get("commandArgs") or {}
+    return tuple(str(p) for p in args.get("inputFiles") or [])
+
+
+@lru_cache(maxsize=32)
+def _report_input_files(path: str, mtime_ns: int, size: int) -> tuple[str, ...]:
+    """commandArgs.inputFiles of a report.json, cached per (path, mtime_ns, size): report.json
+    can be large and only this field is needed."""
+    return _input_files(json_codec.loads(Path(path).read_bytes()))
+
+
+# Rules whose samples never map to a CSV row (no statVar to match on).
+_NO_CSV_RULES = frozenset({"check_unit_consistency", "check_structural_lint_error_count"})
+
+
+def _needs_row_match(sample: dict) -> bool:
+    return bool(str(sample.get("statVar") or "").strip()) and (sample.get("rule") or "") not in _NO_CSV_RULES
+
+
+def needs_csv_enrichment(samples: list[dict]) -> bool:
+    """True if any sample can be enriched from an input CSV row (so the CSV is worth fetching)."""
+    return any(_needs_row_match(s) for s in samples)
+
+
+_STAT_VAR_SEP = re.compile(r"[:/]")
+
+
+def _stat_var_keys(csv_val: str) -> list[str]:
+    """Validation stat_vars that a CSV variableMeasured/StatVar value matches: the value itself
+    and each suffix after a ':' or '/' (e.g. dcid:Count_X matches Count_X)."""
+    if not csv_val:
+        return []
+    if ":" not in csv_val and "/" not in csv_val:
+        return [csv_val]
+    return [csv_val, *(csv_val[m.end():] for m in _STAT_VAR_SEP.finditer(csv_val))]
+
+
+# Bound on distinct statVar values memoized per scan (a CSV with mostly unique values stays O(1) memory).
+_STAT_VAR_KEYS_MEMO_MAX = 4096
+
+
+def _row_val_float(row: list[str], col_idxs: list[int]) -> float | None:
+    """Get the first non-empty value among the given columns as float."""
+    for j in col_idxs:
+        if j < len(row) and row[j].strip() != "":
             try:
-                return float(str(row[k]).strip())
+                return float(row[j].strip())
             except ValueError:
                 pass
     return None
@@ -88,112 +133,218 @@ def _format_sql_row_value(row: dict) -> str:
     return ", ".join(parts) if parts else "—"
 
 
-def _load_summary_statvar_units(output_dir: Path) -> list[tuple[str, str]]:
-    """Load (StatVar, Units) from summary_report.csv. Returns [] if not found or no Units column."""
+def _load_summary_statvar_units(output_dir: Path) -> tuple[tuple[str, str], ...]:
+    """Load (StatVar, Units) from summary_report.csv. Returns () if not found or no Units column."""
     path = output_dir / "summary_report.csv"
-    if not path.exists():
-        return []
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return ()
+    return _read_summary_statvar_units(str(path), mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _read_summary_statvar_units(path: str, mtime_ns: int) -> tuple[tuple[str, str], ...]:
+    """Cached per (path, mtime_ns) so a regenerated summary_report.csv is re-read."""
     try:
         with open(path, encoding="utf-8", newline="") as f:
             reader = csv.DictReader(f)
             rows = list(reader)
     except (OSError, csv.Error):
-        return []
+        return ()
     if not rows:
-        return []
+        return ()
     sv_col = "StatVar" if "StatVar" in rows[0] else "stat_var"
     unit_col = "Units" if "Units" in rows[0] else "units"
     if sv_col not in rows[0] or unit_col not in rows[0]:
-        return []
+        return ()
     out = []
     for row in rows:
         sv = (row.get(sv_col) or "").strip()
         unit = (row.get(unit_col) or "").strip()
         if sv:
             out.append((sv, unit or "—"))
-    return out
+    return tuple(out)
 
 
-def enrich_rule_failure_samples(samples: list[dict], output_dir: Path, results: list) -> None:
+def enrich_rule_failure_samples(
+    samples: list[dict], output_dir: Path, results: list, report: dict | None = None
+) -> None:
     """Enrich samples with location, date, sourceRow from CSV when possible. Mutates samples in place.
 
     Streams the CSV row-by-row (O(1) memory per row) instead of loading the entire file.
     A single pass over the file resolves all pending samples; iteration stops as soon as
-    every sample that needs enrichment has been matched or EOF is reached.
+    every sample that needs enrichment has been matched or EOF is reached. Matches are
+    cached per (CSV path, mtime, size, pending samples), so repeat requests for the same
+    run do not re-read the file.
     """
-    csv_path = get_csv_path(output_dir)
+    has_unit_samples = any((s.get("rule") or "") == "check_unit_consistency" for s in samples)
+    if not has_unit_samples and not needs_csv_enrichment(samples):
+        return  # nothing to match or expand: skip report.json and the CSV entirely
+    csv_path = get_csv_path(output_dir, report)
     if not csv_path:
         return
-    csv_basename = csv_path.name
-    stat_var_cols = ["variableMeasured", "StatVar", "stat_var", "Variable"]
-    loc_cols = ["observationAbout", "observation_about", "place", "Place"]
-    date_cols = ["observationDate", "observation_date", "date", "Date"]
-    value_cols = ["value", "Value"]
-
-    def get_val(row: dict, candidates: list[str]) -> str:
-        for c in candidates:
-            if c in row and row[c] is not None:
-                return str(row[c]).strip()
-        return ""
+    pending = _pending_row_matches(samples)
+    threshold = _min_value_threshold(results)
+    try:
+        st = csv_path.stat()
+        if isinstance(threshold, (int, float)):
+            scan = _scan_csv_file(str(csv_path), st.st_mtime_ns, st.st_size, tuple(k for _, k in pending), threshold)
+        else:
+            with open(csv_path, encoding="utf-8", newline="") as f:
+                scan = _scan_csv_rows(f, csv_path.name, tuple(k for _, k in pending), threshold)
+    except (OSError, csv.Error):
+        return  # mirrors original: load failure → skip enrichment + expansion
+    csv_has_rows, found = scan
+    _apply_row_matches(samples, pending, found)
+
+    if not csv_has_rows:
+        return  # mirrors original: empty CSV → skip enrichment + expansion
+
+    _expand_unit_consistency(samples, output_dir)
+
 
-    min_value_threshold = None
+def enrich_rule_failure_samples_from_bytes(
+    samples: list[dict], csv_bytes: bytes, results: list, csv_basename: str = "input.csv"
+) -> None:
+    """Like enrich_rule_failure_samples, for an input CSV held in memory (e.g. downloaded from
+    GCS) so nothing is written to disk. There is no summary_report.csv alongside, so
+    check_unit_consistency samples are left unexpanded. Mutates samples in place."""
+    # TextIOWrapper decodes incrementally: no second full-size str copy of the CSV.
+    f = io.TextIOWrapper(io.BytesIO(csv_bytes), encoding="utf-8", newline="")
+    pending = _pending_row_matches(samples)
+    try:
+        _, found = _scan_csv_rows(f, csv_basename, tuple(k for _, k in pending), _min_value_threshold(results))
+    except (UnicodeDecodeError, csv.Error):
+        return
+    _apply_row_matches(samples, pending, found)
+
+
+# A CSV row match: (location, date, sourceRow).
+_RowMatch = tuple[str | None, str | None, str]
+
+
+def _min_value_threshold(results: list):
     for r in results or []:
         if r.get("status") == "FAILED" and r.get("validation_name") == "check_min_value":
-            min_value_threshold = (r.get("validation_params") or {}).get("minimum")
-            if min_value_threshold is not None:
-                break
-    if min_value_threshold is None:
-        min_value_threshold = 0
-
-    # Collect samples that need per-row CSV enrichment, keyed by list index for
-    # direct in-place mutation.  Any sample with a statVar is eligible; rules that
-    # never produce CSV-matchable rows (unit_consistency, structural_lint) have no
-    # statVar and are naturally excluded by the guard below.
-    _no_csv_rules = {"check_unit_consistency", "check_structural_lint_error_count"}
-    pending: dict[int, dict] = {
-        idx: s
+            minimum = (r.get("validation_params") or {}).get("minimum")
+            if minimum is not None:
+                return minimum
+    return 0
+
+
+def _pending_row_matches(samples: list[dict]) -> list[tuple[int, tuple[str, bool]]]:
+    """(sample index, (stripped statVar, is check_min_value)) for every sample that can be
+    matched to a CSV row. Rules that never produce CSV-matchable rows (unit_consistency,
+    structural_lint) have no statVar and are naturally excluded."""
+    return [
+        (idx, (str(s["statVar"]).strip(), (s.get("rule") or "") == "check_min_value"))
         for idx, s in enumerate(samples)
-        if (s.get("statVar") or "")
-        and (s.get("rule") or "") not in _no_csv_rules
-    }
+        if _needs_row_match(s)
+    ]
+
+
+def _apply_row_matches(
+    samples: list[dict], pending: list[tuple[int, tuple[str, bool]]], found: tuple[_RowMatch | None, ...]
+) -> None:
+    for (idx, _), match in zip(pending, found):
+        if match is not None:
+            s = samples[idx]
+            s["location"], s["date"], s["sourceRow"] = match
+
+
+@lru_cache(maxsize=16)
+def _scan_csv_file(
+    path: str, mtime_ns: int, size: int, wanted: tuple[tuple[str, bool], ...], min_value_threshold
+) -> tuple[bool, tuple[_RowMatch | None, ...]]:
+    """_scan_csv_rows over a file, cached per (path, mtime_ns, size, wanted, threshold)."""
+    with open(path, encoding="utf-8", newline="") as f:
+        return _scan_csv_rows(f, Path(path).name, wanted, min_value_threshold)
+
+
+def _scan_csv_rows(
+    lines: Iterable[str], csv_basename: str, wanted: tuple[tuple[str, bool], ...], min_value_threshold
+) -> tuple[bool, tuple[_RowMatch | None, ...]]:
+    """Find the first matching CSV row for each wanted (statVar, is_min_value) in one pass.
+    Returns (csv_has_rows, matches aligned with wanted). Raises csv.Error / I/O errors from lines."""
+    found: list[_RowMatch | None] = [None] * len(wanted)
+    reader = csv.reader(lines)
+    header = next(reader, None)
+    if header is None:
+        return False, tuple(found)
+    # Resolve each column family to header positions once; rows are plain lists (no per-row dict).
+    # A later name wins on duplicate headers, as with DictReader.
+    col = {name: j for j, name in enumerate(header)}
+
+    def col_idxs(candidates: tuple[str, ...]) -> list[int]:
+        return [col[c] for c in candidates if c in col]
+
+    stat_var_cols = col_idxs(("variableMeasured", "StatVar", "stat_var", "Variable"))
+    loc_cols = col_idxs(("observationAbout", "observation_about", "place", "Place"))
+    date_cols = col_idxs(("observationDate", "observation_date", "date", "Date"))
+    value_cols = col_idxs(("value", "Value"))
+
+    def get_val(row: list[str], idxs: list[int]) -> str:
+        # Short rows fall through to the next candidate column (DictReader's None restval).
+        for j in idxs:
+            if j < len(row):
+                return row[j].strip()
+        return ""
+
+    # Indexed by statVar so each row costs a few dict lookups instead of a scan over every
+    # pending sample.
+    pending: dict[str, dict[int, bool]] = {}
+    for pos, (stat_var, is_min_value) in enumerate(wanted):
+        pending.setdefault(stat_var, {})[pos] = is_min_value
 
     # Single streaming pass: one row at a time, O(1) memory.
     # csv_has_rows mirrors the original early-return guard: the unit-consistency
-    # expansion below is skipped when the CSV is absent, empty, or unreadable —
+    # expansion is skipped when the CSV is absent, empty, or unreadable —
     # exactly as in the previous list(DictReader) approach.
     csv_has_rows = False
-    try:
-        with open(csv_path, encoding="utf-8", newline="") as f:
-            for i, row in enumerate(csv.DictReader(f)):
-                csv_has_rows = True
-                if not pending:
-                    break  # all samples resolved — stop reading the file
-                csv_sv = get_val(row, stat_var_cols)
-                for idx in list(pending):
-                    s = pending[idx]
-                    rule = s.get("rule") or ""
-                    stat_var = s.get("statVar") or ""
-                    if not _stat_var_matches(csv_sv, stat_var):
-                        continue
-                    if rule == "check_min_value":
+    row_num = 1  # header line
+    # Rows repeat a small set of statVar values; expand each distinct value's keys once.
+    keys_by_stat_var: dict[str, list[str]] = {}
+    for row in reader:
+        if not row:
+            continue  # blank line (DictReader skipped these too)
+        row_num += 1
+        csv_has_rows = True
+        if not pending:
+            break  # all samples resolved — stop reading the file
+        csv_sv = get_val(row, stat_var_cols)
+        keys = keys_by_stat_var.get(csv_sv)
+        if keys is None:
+            if len(keys_by_stat_var) >= _STAT_VAR_KEYS_MEMO_MAX:
+                keys_by_stat_var.clear()
+            keys = keys_by_stat_var[csv_sv] = _stat_var_keys(csv_sv)
+        below_min = None  # row value parsed at most once, on the first min-value sample that needs it
+        for key in keys:
+            group = pending.get(key)
+            if group is None:
+                continue
+            for pos, is_min_value in list(group.items()):
+                if is_min_value:
+                    if below_min is None:
                         val = _row_val_float(row, value_cols)
-                        if val is None or val >= min_value_threshold:
-                            continue  # value condition not met; keep looking for this sample
-                    s["location"] = get_val(row, loc_cols) or None
-                    s["date"] = get_val(row, date_cols) or None
-                    s["sourceRow"] = f"{csv_basename}:{i + 2}"
-                    del pending[idx]
-    except (OSError, csv.Error):
-        return  # mirrors original: load failure → skip enrichment + expansion
+                        below_min = val is not None and val < min_value_threshold
+                    if not below_min:
+                        continue  # value condition not met; keep looking for this sample
+                found[pos] = (get_val(row, loc_cols) or None, get_val(row, date_cols) or None, f"{csv_basename}:{row_num}")
+                del group[pos]
+            if not group:
+                del pending[key]
+    return csv_has_rows, tuple(found)
 
-    if not csv_has_rows:
-        return  # mirrors original: empty CSV → skip enrichment + expansion
 
-    # Expand check_unit_consistency into one sample per StatVar with its unit (when summary_report.csv exists)
+def _expand_unit_consistency(samples: list[dict], output_dir: Path) -> None:
+    """Expand check_unit_consistency into one sample per StatVar with its unit (when summary_report.csv exists)."""
     expanded = []
+    statvar_units = None  # loaded on the first check_unit_consistency sample
     for s in samples:
         if (s.get("rule") or "") == "check_unit_consistency":
-            statvar_units = _load_summary_statvar_units(output_dir)
+            if statvar_units is None:
+                statvar_units = _load_summary_statvar_units(output_dir)
             if statvar_units:
                 msg = s.get("message") or ""
                 expected = s.get("expected") or "consistent units (one unit per StatVar)"
@@ -20,6 +20,7 @@ from pipeline.projector import FeedResult, ProgressProjector
 from pipeline.registry import load_registry, step_by_id
 from pipeline.status_v1 import ProjectorState, resolve_step_id_from_legacy_token
 
+from scripts import json_codec
 from ui.app_logging import get_logger
 
 logger = get_logger(__name__)
@@ -33,6 +34,11 @@ def _run_timeout_sec() -> int:
         return 0
 
 
+# StreamReader line limit for streamed subprocess stdout. The asyncio default (64 KiB) makes
+# readline() raise ValueError on one long line (stack trace, JSON dump) and end the stream.
+_STDOUT_LINE_LIMIT = 4 * 1024 * 1024
+
+
 # ---------------------------------------------------------------------------
 # Concurrency guard: each validation run spawns a JVM + Python subprocess chain.
 # In Cloud Run with concurrency=1, the streaming HTTP connection keeps the request
@@ -71,6 +77,17 @@ _CANONICAL_ARTIFACTS = (
 _VALIDATION_REPORT_HTML = "validation_report.html"
 
 
+def _copy_artifact(src: Path, dst: Path) -> None:
+    """Copy file contents (kernel-side sendfile on Linux) and keep the source mtime.
+
+    Mode bits and xattrs are not needed for report artifacts, so copystat() is skipped; the
+    mtime is kept because report-info shows it as the report's generation time.
+    """
+    shutil.copyfile(src, dst)
+    st = src.stat()
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
 def _copy_run_to_canonical(run_dir: Path, canonical_dir: Path) -> None:
     """Copy report artifacts from per-run dir to canonical dir so latest-run APIs work.
     Only runs when validation_report.html exists (full run completed); copies only existing
@@ -85,10 +102,10 @@ def _copy_run_to_canonical(run_dir: Path, canonical_dir: Path) -> None:
         for name in _CANONICAL_ARTIFACTS:
             src = run_dir / name
             if src.exists():
-                shutil.copy2(src, canonical_dir / name)
+                _copy_artifact(src, canonical_dir / name)
         # Also copy MCF files so accept-baseline can locate them after per-run dir cleanup.
         for mcf in run_dir.glob("*.mcf"):
-            shutil.copy2(mcf, canonical_dir / mcf.name)
+            _copy_artifact(mcf, canonical_dir / mcf.name)
         # Copy differ output so review-summary can read it after per-run dir is cleaned up.
         differ_src = run_dir / "differ_output"
         if differ_src.is_dir():
@@ -97,7 +114,7 @@ def _copy_run_to_canonical(run_dir: Path, canonical_dir: Path) -> None:
             for name in ("differ_summary.json", "obs_diff_summary.csv"):
                 src = differ_src / name
                 if src.exists():
-                    shutil.copy2(src, differ_dst / name)
+                    _copy_artifact(src, differ_dst / name)
     except OSError as e:
         logger.warning("copy run to canonical failed run_dir=%s canonical_dir=%s: %s", run_dir, canonical_dir, e)
 
@@ -112,6 +129,15 @@ def _upload_reports_sync(output_dir: Path, run_id: str, dataset: str) -> None:
         logger.exception("GCS upload failed run_id=%s dataset=%s", run_id, dataset)
 
 
+def _finalize_reports_sync(
+    output_dir: Path, run_id: str, dataset: str, canonical_output_dir: Path | None
+) -> None:
+    """Upload reports, then copy them to the canonical dir (per-run isolation); one thread hop for both."""
+    _upload_reports_sync(output_dir, run_id, dataset)
+    if canonical_output_dir and output_dir != canonical_output_dir:
+        _copy_run_to_canonical(output_dir, canonical_output_dir)
+
+
 def _cleanup_run_dirs(
     output_dir: Path | None,
     canonical_output_dir: Path | None,
@@ -142,9 +168,13 @@ def _cleanup_run_dirs(
     logger.info("run_cleanup completed run_id=%s dirs_removed=%d", run_id, len(to_remove))
 
 _ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+_STEP_RE = re.compile(r"::STEP::(\d+(?:\.\d+)?)(?::(.+))?")
 
 
 def _strip_ansi(text: str) -> str:
+    # Most lines carry no escape codes; skip the regex for them.
+    if "\x1b[" not in text:
+        return text
     return _ANSI_RE.sub("", text)
 
 
@@ -272,19 +302,20 @@ def _step_payload_from_status(status: dict) -> dict | None:
 
 def _infer_step_fallback(text: str) -> tuple[int | None, str | None]:
     """Last-resort step inference from log substrings (no ::STEP:: / v1)."""
-    _step_match = re.search(r"::STEP::(\d+(?:\.\d+)?)(?::(.+))?", text)
-    if _step_match:
-        token = _step_match.group(1)
-        label = _step_match.group(2).strip() if _step_match.group(2) else None
-        reg = load_registry()
-        step_id = resolve_step_id_from_legacy_token(reg, token)
-        if step_id:
-            step = step_by_id(reg, step_id)
-            if step is not None:
-                return step.index, label
-        if "." not in token:
-            return int(token), label
-    if "Pre-Import Checks" in text or "CSV quality" in text.lower():
+    if "::STEP::" in text:
+        _step_match = _STEP_RE.search(text)
+        if _step_match:
+            token = _step_match.group(1)
+            label = _step_match.group(2).strip() if _step_match.group(2) else None
+            reg = load_registry()
+            step_id = resolve_step_id_from_legacy_token(reg, token)
+            if step_id:
+                step = step_by_id(reg, step_id)
+                if step is not None:
+                    return step.index, label
+            if "." not in token:
+                return int(token), label
+    if "Pre-Import Checks" in text:
         return 0, None
     if "Step 1" in text or ("Gemini review" in text and "model:" in text):
         return 1, None
@@ -334,8 +365,26 @@ def _parse_structured_failure_from_output(output: str):
     return None
 
 
+# "line" events are coalesced into one chunk per _LINE_BATCH_MAX lines or _LINE_FLUSH_SEC,
+# whichever comes first; step/failure/done events flush the batch so ordering is preserved.
+_LINE_BATCH_MAX = 64
+_LINE_FLUSH_SEC = 0.05
+
+
+# Serialized prefix of the done event as written by _stream_run_output (spacing depends on
+# whether json_codec is using orjson).
+_DONE_PREFIX = json_codec.dumps({"t": "done"})[:-1]
+
+
+def _flush(pending: list[str]) -> str:
+    """Join buffered NDJSON events into one stream chunk and clear the buffer."""
+    chunk = "".join(pending)
+    pending.clear()
+    return chunk
+
+
 def _emit_failure_ndjson(failure: dict) -> str:
-    return json.dumps({"t": "failure", **failure}) + "\n"
+    return json_codec.dumps({"t": "failure", **failure}) + "\n"
 
 
 def _maybe_emit_step_ndjson(
@@ -352,24 +401,52 @@ def _maybe_emit_step_ndjson(
         return None, last_emitted_step_index
     if idx == last_emitted_step_index:
         return None, last_emitted_step_index
-    return json.dumps(payload) + "\n", idx
+    return json_codec.dumps(payload) + "\n", idx
 
 
-async def _stream_run_output(proc, app_root: Path):
+async def _stream_run_output(proc, app_root: Path, timeout_sec: float = 0):
     """Stream process stdout line by line, yielding NDJSON.
 
     ProgressProjector is the primary interpreter for v1 events and legacy ::STEP:: markers.
     Regex/substring step detection is fallback-only when the projector does not handle a line.
+    Each yielded chunk holds one or more complete NDJSON lines; "done" is always its own chunk.
+    timeout_sec > 0 kills the process once that much time has passed without it exiting;
+    the done event then carries "timeout": True.
     """
     output_lines = []
     cancelled = False
+    timed_out = False
     last_failure = None
     failure_buffer = None
     projector = _new_projector(app_root)
     last_emitted_step_index: int | None = None
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout_sec if timeout_sec > 0 else None
+    pending: list[str] = []
+    flush_at = 0.0
     try:
         while True:
-            line = await proc.stdout.readline()
+            if pending and (len(pending) >= _LINE_BATCH_MAX or loop.time() >= flush_at):
+                yield _flush(pending)
+            # Do not hold buffered lines while the subprocess is quiet.
+            wake_at = flush_at if pending else None
+            if deadline is not None and (wake_at is None or deadline < wake_at):
+                wake_at = deadline
+            try:
+                async with asyncio.timeout_at(wake_at):
+                    line = await proc.stdout.readline()
+            except TimeoutError:
+                if deadline is not None and loop.time() >= deadline:
+                    timed_out = True
+                    try:
+                        proc.kill()
+                    except ProcessLookupError:
+                        pass
+                    break
+                yield _flush(pending)
+                continue
+            if not pending:
+                flush_at = loop.time() + _LINE_FLUSH_SEC
             if not line:
                 break
             text = line.decode("utf-8", errors="replace")
@@ -391,14 +468,15 @@ async def _stream_run_output(proc, app_root: Path):
                         if last_failure is None:
                             last_failure = failure
                         for buffered in failure_buffer:
-                            yield json.dumps({"t": "line", "v": buffered}) + "\n"
-                        yield _emit_failure_ndjson(failure)
+                            pending.append(json_codec.dumps({"t": "line", "v": buffered}) + "\n")
+                        pending.append(_emit_failure_ndjson(failure))
                         failure_buffer = None
                         step_line, last_emitted_step_index = _maybe_emit_step_ndjson(
                             projector, last_emitted_step_index
                         )
                         if step_line:
-                            yield step_line
+                            pending.append(step_line)
+                        yield _flush(pending)
                 except (json.JSONDecodeError, TypeError):
                     pass
                 yield_line = False
@@ -409,7 +487,8 @@ async def _stream_run_output(proc, app_root: Path):
                 if failure:
                     if last_failure is None:
                         last_failure = failure
-                    yield _emit_failure_ndjson(failure)
+                    pending.append(_emit_failure_ndjson(failure))
+                    yield _flush(pending)
             elif _is_failure_line_start(stripped) and not feed.handled:
                 try:
                     obj = json.loads(stripped)
@@ -418,7 +497,8 @@ async def _stream_run_output(proc, app_root: Path):
                     if failure:
                         if last_failure is None:
                             last_failure = failure
-                        yield _emit_failure_ndjson(failure)
+                        pending.append(_emit_failure_ndjson(failure))
+                        yield _flush(pending)
                 except (json.JSONDecodeError, TypeError):
                     failure_buffer = [text]
                     yield_line = False
@@ -428,7 +508,8 @@ async def _stream_run_output(proc, app_root: Path):
                     projector, last_emitted_step_index
                 )
                 if step_line:
-                    yield step_line
+                    pending.append(step_line)
+                    yield _flush(pending)
             elif not feed.handled:
                 step, label = _infer_step_fallback(text)
                 if step is not None and step != last_emitted_step_index:
@@ -438,11 +519,12 @@ async def _stream_run_output(proc, app_root: Path):
                         payload: dict = {"t": "step", "step": step, "step_index": step, "ts": time.time()}
                         if label:
                             payload["label"] = label
-                        yield json.dumps(payload) + "\n"
+                        pending.append(json_codec.dumps(payload) + "\n")
+                        yield _flush(pending)
                         last_emitted_step_index = step
 
             if yield_line:
-                yield json.dumps({"t": "line", "v": text}) + "\n"
+                pending.append(json_codec.dumps({"t": "line", "v": text}) + "\n")
         await proc.wait()
     except asyncio.CancelledError:
         cancelled = True
@@ -456,6 +538,8 @@ async def _stream_run_output(proc, app_root: Path):
             pass
         output_lines.append("[INFO] Validation cancelled by user.\n")
     finally:
+        if pending:
+            yield _flush(pending)
         output = "".join(output_lines)
         done_payload = {
             "t": "done",
@@ -465,6 +549,8 @@ async def _stream_run_output(proc, app_root: Path):
             "cancelled": cancelled,
             "ts_end": time.time(),
         }
+        if timed_out:
+            done_payload["timeout"] = True
         if not done_payload["success"] and not cancelled:
             failure = (
                 last_failure
@@ -482,7 +568,7 @@ async def _stream_run_output(proc, app_root: Path):
                     done_payload["failure_limit"] = failure["limit"]
                 if isinstance(failure.get("details"), dict):
                     done_payload["failure_details"] = failure["details"]
-        yield json.dumps(done_payload) + "\n"
+        yield json_codec.dumps(done_payload) + "\n"
 
 
 async def run_validation_process(
@@ -573,11 +659,7 @@ async def _run_validation_process_impl(
     # The subprocess is created inside gen() so that setup_gen (e.g. GCS downloads) can
     # yield real-time progress lines before the subprocess starts.
     if stream:
-        run_timed_out = False
-
         async def gen():
-            nonlocal run_timed_out
-
             # 1. Setup phase — runs before subprocess starts, yields NDJSON progress lines.
             #    Errors (e.g. GCS 404/403) emit a synthetic "done" failure and stop the stream.
             if setup_gen is not None:
@@ -590,7 +672,7 @@ async def _run_validation_process_impl(
                         "setup_gen failed request_id=%s duration_sec=%s: %s",
                         request_id, duration_sec, exc,
                     )
-                    yield json.dumps({
+                    yield json_codec.dumps({
                         "t": "done",
                         "success": False,
                         "exit_code": 1,
@@ -617,32 +699,22 @@ async def _run_validation_process_impl(
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.STDOUT,
                 env=env,
+                limit=_STDOUT_LINE_LIMIT,
             )
 
-            async def timeout_killer():
-                nonlocal run_timed_out
-                await asyncio.sleep(timeout_sec)
-                if proc.returncode is None:
-                    run_timed_out = True
-                    try:
-                        proc.kill()
-                    except ProcessLookupError:
-                        pass
-                    logger.warning("validation run timed out after %s sec request_id=%s", timeout_sec, request_id)
-
-            timeout_task = asyncio.create_task(timeout_killer()) if timeout_sec > 0 else None
-            done_yielded = False
             try:
                 for _pl in (prefix_lines or []):
-                    yield json.dumps({"t": "line", "v": _pl}) + "\n"
-                async for chunk in _stream_run_output(proc, app_root):
+                    yield json_codec.dumps({"t": "line", "v": _pl}) + "\n"
+                async for chunk in _stream_run_output(proc, app_root, timeout_sec):
                     needs_post_yield_upload = False
                     try:
-                        obj = json.loads(chunk) if chunk.strip() else {}
+                        # Batched line chunks are not single JSON documents; only "done" needs parsing.
+                        obj = json_codec.loads(chunk) if chunk.startswith(_DONE_PREFIX) else {}
                         if obj.get("t") == "done":
-                            done_yielded = True
-                            if run_timed_out:
-                                obj["timeout"] = True
+                            if obj.get("timeout"):
+                                logger.warning(
+                                    "validation run timed out after %s sec request_id=%s", timeout_sec, request_id
+                                )
                                 obj["success"] = False
                                 obj["exit_code"] = -1
                                 obj["failure_code"] = "RUN_TIMEOUT"
@@ -673,7 +745,7 @@ async def _run_validation_process_impl(
                             obj["run_id"] = request_id
                             if extra_done_fields:
                                 obj.update(extra_done_fields)
-                            chunk = json.dumps(obj) + "\n"
+                            chunk = json_codec.dumps(obj) + "\n"
                             # GCS upload happens after yielding done so the client receives
                             # the final result immediately, before the upload delay.
                             needs_post_yield_upload = bool(output_dir and dataset)
@@ -684,40 +756,8 @@ async def _run_validation_process_impl(
                     # Runs only once (needs_post_yield_upload is only set on the done event).
                     if needs_post_yield_upload:
                         await asyncio.to_thread(
-                            _upload_reports_sync, output_dir, request_id, dataset
+                            _finalize_reports_sync, output_dir, request_id, dataset, canonical_output_dir
                         )
-                        if canonical_output_dir and output_dir != canonical_output_dir:
-                            await asyncio.to_thread(
-                                _copy_run_to_canonical, output_dir, canonical_output_dir
-                            )
-                # If we timed out and the subprocess never sent "done", emit a synthetic done so UI gets structured failure
-                if run_timed_out and not done_yielded:
-                    duration_sec = round(time.monotonic() - run_start_time, 2)
-                    logger.info(
-                        "run_finished request_id=%s success=False timeout=True duration_sec=%s",
-                        request_id,
-                        duration_sec,
-                    )
-                    synthetic = {
-                        "t": "done",
-                        "success": False,
-                        "exit_code": -1,
-                        "timeout": True,
-                        "run_id": request_id,
-                        "failure_code": "RUN_TIMEOUT",
-                        "failure_step": None,
-                        "failure_message": "Validation run timed out.",
-                    }
-                    yield json.dumps(synthetic) + "\n"
-                    # Upload after yielding so the client already has the timeout result.
-                    if output_dir and dataset:
-                        await asyncio.to_thread(
-                            _upload_reports_sync, output_dir, request_id, dataset
-                        )
-                        if canonical_output_dir and output_dir != canonical_output_dir:
-                            await asyncio.to_thread(
-                                _copy_run_to_canonical, output_dir, canonical_output_dir
-                            )
             except asyncio.CancelledError:
                 try:
                     proc.kill()
@@ -733,7 +773,7 @@ async def _run_validation_process_impl(
                     request_id,
                     duration_sec,
                 )
-                yield json.dumps({
+                yield json_codec.dumps({
                     "t": "done",
                     "success": False,
                     "exit_code": -1,
@@ -745,12 +785,6 @@ async def _run_validation_process_impl(
                     "failure_message": "Validation cancelled by user.",
                 }) + "\n"
             finally:
-                if timeout_task is not None:
-                    timeout_task.cancel()
-                    try:
-                        await timeout_task
-                    except asyncio.CancelledError:
-                        pass
                 if config_path and config_path.exists():
                     config_path.unlink(missing_ok=True)
                 # Remove per-run and extra dirs after streaming ends (subprocess has exited).
@@ -811,7 +845,6 @@ async def _run_validation_process_impl(
                         await t
                     except asyncio.CancelledError:
                         pass
-                request_id = getattr(request.state, "request_id", "")
                 duration_sec = round(time.monotonic() - run_start_time, 2)
                 logger.warning("validation run timed out after %s sec request_id=%s duration_sec=%s", timeout_sec, request_id, duration_sec)
                 return {
@@ -845,7 +878,6 @@ async def _run_validation_process_impl(
                     await t
                 except asyncio.CancelledError:
                     pass
-            request_id = getattr(request.state, "request_id", "")
             duration_sec = round(time.monotonic() - run_start_time, 2)
             logger.info(
                 "run_finished request_id=%s success=False cancelled=True duration_sec=%s",
@@ -874,7 +906,6 @@ async def _run_validation_process_impl(
         output = _strip_ansi(output)
         exit_code = proc.returncode if proc.returncode is not None else -1
         success = proc.returncode == 0
-        request_id = getattr(request.state, "request_id", "")
         duration_sec = round(time.monotonic() - run_start_time, 2)
         logger.info(
             "run_finished request_id=%s success=%s cancelled=False duration_sec=%s",
@@ -885,12 +916,8 @@ async def _run_validation_process_impl(
         # Upload to GCS whenever a report was produced (success or failure) so any instance can serve it
         if output_dir and dataset:
             await asyncio.to_thread(
-                _upload_reports_sync, output_dir, request_id, dataset
+                _finalize_reports_sync, output_dir, request_id, dataset, canonical_output_dir
             )
-            if canonical_output_dir and output_dir != canonical_output_dir:
-                await asyncio.to_thread(
-                    _copy_run_to_canonical, output_dir, canonical_output_dir
-                )
         result = {
             "success": success,
             "exit_code": exit_code,